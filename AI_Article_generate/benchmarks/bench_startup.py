@@ -0,0 +1,175 @@
+"""Startup and rerun cost of the app's Streamlit UI.
+
+Every measurement runs in a fresh interpreter, so nothing is imported yet:
+
+- imports: time to import each module, and which heavy packages it pulls in
+- setup: building the objects the first request pays for once
+- render: first run of streamlit_app.py through Streamlit's AppTest (what a
+  new process pays before the first page shows), then repeated reruns of the
+  same session (what every widget interaction pays)
+
+This file is the same in every app; what to import, build and stub out for
+one app is in its benchmarks/startup_config.py.
+
+Usage (from the app directory):
+    python -m benchmarks.bench_startup --repeat 5 --reruns 20
+    python -m benchmarks.bench_startup --compare benchmarks/results/<older>.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from .startup_config import ENV, HEAVY_PACKAGES, IMPORTS, SETUP
+
+APP_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).parent / "results"
+
+STEP_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "loaded": [m for m in json.loads(sys.argv[2]) if m in sys.modules]}))
+"""
+
+RENDER_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+streamlit_s = time.perf_counter() - start
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.run()
+first_s = time.perf_counter() - start
+reruns = []
+for _ in range(int(sys.argv[2])):
+    t = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - t)
+print(json.dumps({"streamlit_import_s": streamlit_s, "first_render_s": first_s, "reruns_s": reruns,
+                  "exceptions": [e.message for e in at.exception],
+                  "loaded": [m for m in json.loads(sys.argv[3]) if m in sys.modules]}))
+"""
+
+
+def probe(code: str, *args) -> dict:
+    """Run ``code`` in a new interpreter in the app directory and return its JSON line."""
+    result = subprocess.run([sys.executable, "-c", code, *args], cwd=APP_DIR, capture_output=True,
+                            text=True, env={**os.environ, **ENV})
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def median(values: list) -> float:
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2]
+
+
+def percentiles(values: list) -> dict:
+    """Nearest-rank p50/p95 plus mean, in milliseconds."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50_ms": round(pick(0.50), 3),
+        "p95_ms": round(pick(0.95), 3),
+    }
+
+
+def time_steps(steps: dict, repeat: int) -> dict:
+    heavy = json.dumps(HEAVY_PACKAGES)
+    results = {}
+    for name, code in steps.items():
+        runs = [probe(STEP_PROBE, code, heavy) for _ in range(repeat)]
+        results[name] = {"median_ms": round(median([r["seconds"] for r in runs]) * 1000, 1),
+                         "loaded": runs[-1]["loaded"]}
+        print(f"{name:<28} {results[name]['median_ms']:>9} ms  loads: {', '.join(results[name]['loaded']) or '-'}")
+    return results
+
+
+def time_render(repeat: int, reruns: int) -> dict:
+    runs = [probe(RENDER_PROBE, str(APP_DIR / "streamlit_app.py"), str(reruns), json.dumps(HEAVY_PACKAGES))
+            for _ in range(repeat)]
+    result = {
+        "streamlit_import_ms": round(median([r["streamlit_import_s"] for r in runs]) * 1000, 1),
+        "first_render_ms": round(median([r["first_render_s"] for r in runs]) * 1000, 1),
+        "rerun": percentiles([s for r in runs for s in r["reruns_s"]]),
+        "loaded": runs[-1]["loaded"],
+        "exceptions": runs[-1]["exceptions"],
+    }
+    print(f"{'first render':<28} {result['first_render_ms']:>9} ms  "
+          f"(streamlit itself {result['streamlit_import_ms']} ms)  loads: {', '.join(result['loaded']) or '-'}")
+    print(f"{'rerun':<28} {result['rerun'].get('p50_ms', '-'):>9} ms  p95={result['rerun'].get('p95_ms', '-')} ms")
+    for message in result["exceptions"]:
+        print(f"  exception: {message}")
+    return result
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(current: dict, previous_path: str):
+    previous = json.loads(Path(previous_path).read_text())
+    print(f"\nChange vs {previous_path} ({previous['meta']['commit']}):")
+    rows = [(f"import {name}", "imports", name, "median_ms") for name in current["imports"]]
+    rows += [(f"setup {name}", "setup", name, "median_ms") for name in current["setup"]]
+    rows += [("first render", "render", None, "first_render_ms")]
+    for label, section, name, key in rows:
+        now = current[section][name] if name else current[section]
+        then = previous.get(section, {})
+        then = then.get(name) if name else then
+        if not then or key not in then:
+            continue
+        delta = (now[key] - then[key]) / then[key] * 100 if then[key] else 0.0
+        print(f"  {label:<28} {then[key]:>9} -> {now[key]:>9} ms ({delta:+.1f}%)")
+    then = previous.get("render", {}).get("rerun", {}).get("p50_ms")
+    if then:
+        now = current["render"]["rerun"]["p50_ms"]
+        print(f"  {'rerun p50':<28} {then:>9} -> {now:>9} ms ({(now - then) / then * 100:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per measurement")
+    parser.add_argument("--reruns", type=int, default=20, help="Reruns per render session")
+    parser.add_argument("--out", default=None, help="Where to write the JSON results")
+    parser.add_argument("--compare", default=None, help="Earlier results JSON to diff against")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "repeat": args.repeat,
+            "reruns": args.reruns,
+        },
+        "imports": time_steps({name: f"import {name}" for name in IMPORTS}, args.repeat),
+        "setup": time_steps(SETUP, args.repeat),
+        "render": time_render(args.repeat, args.reruns),
+    }
+
+    out = Path(args.out) if args.out else RESULTS_DIR / f"startup-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {out}")
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
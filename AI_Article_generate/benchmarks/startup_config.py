@@ -0,0 +1,23 @@
+"""What bench_startup.py measures for the article generator.
+
+Imports are the app modules, checked for google-genai, pandas and pyarrow;
+setup is creating the Gemini client, the response cache and the article
+store, which the first generation pays once. No request is sent to Gemini.
+"""
+import tempfile
+from pathlib import Path
+
+HEAVY_PACKAGES = ["google.genai", "pandas", "pyarrow"]
+IMPORTS = ["src.agent", "src.cache", "src.store", "src.batch"]
+SETUP = {
+    "agent": "from src.agent import ArticleGeneratorAgent; ArticleGeneratorAgent()",
+    "article_store": "from src.store import get_article_store; get_article_store()",
+}
+# Throwaway databases, so the benchmark neither reads nor fills the real ones
+ENV = {
+    "GOOGLE_API_KEY": "benchmark",
+    "ARTICLE_CACHE_PATH": str(Path(tempfile.gettempdir()) / "bench_startup_cache.sqlite3"),
+    "ARTICLE_STORE_PATH": str(Path(tempfile.gettempdir()) / "bench_startup_articles.sqlite3"),
+    "TELEMETRY_PORT": "",
+    "TELEMETRY_JSONL": "",
+}
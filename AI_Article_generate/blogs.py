@@ -1,15 +1,38 @@
 import streamlit as st
+from src.store import get_article_store
 
 st.set_page_config(page_title="Blogs")
 
 st.title("Blogs")
 
+PAGE_SIZE = 10
 
-def blog_items(title, content):
-    with st.expander(title):
-        st.markdown(content)
+store = get_article_store()
 
 
-for blog in st.session_state.get("blogs", []):
-    print(blog)
-    blog_items(blog.title, blog.content)
+def blog_items(row):
+    # Only the title and summary are loaded up front; the body is fetched when opened
+    with st.container(border=True):
+        st.markdown(f"**{row['title']}**")
+        st.caption(row["snippet"] or row["summary"])
+        if st.toggle("Read", key=f"read_{row['id']}"):
+            article = store.get(row["id"])
+            if article:
+                st.markdown(article["content"])
+
+
+query = st.text_input("Search articles", placeholder="e.g. rust ownership")
+total = store.count(query)
+if not total:
+    st.info("No articles match your search." if query.strip() else
+            "No articles yet. Generate some on the Home page.")
+    st.stop()
+
+pages = -(-total // PAGE_SIZE)
+page = 1
+if pages > 1:
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, key=f"page_{query}")
+st.caption(f"{total} article{'s' if total != 1 else ''}")
+
+for row in store.list(query, limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE):
+    blog_items(row)
@@ -1,24 +1,74 @@
 import streamlit as st
-from src.agent import ArticleGeneratorAgent
+from src.agent import ArticleGeneratorAgent, split_specifications
+from src.cache import get_cache
+from src.store import get_article_store
+
+
+@st.cache_resource
+def get_agent():
+    """One agent per process, created by the first generation rather than on page load."""
+    return ArticleGeneratorAgent()
+
 
 st.title("AI Programming Article Generator")
 st.write("Generate well-structured programming articles using AI.")
 
-if "blogs" not in st.session_state:
-    st.session_state.blogs = []
-
-agent = ArticleGeneratorAgent()
 user_query = st.text_area("Enter your article specifications:", height=300)
+mode = st.radio("Generation mode", ["Stream", "Parallel", "Single request"], horizontal=True,
+                help="Stream shows the articles as they are written. Parallel sends each numbered or 'Title:' "
+                     "specification as its own request, so several articles take about as long as one and a "
+                     "failed article does not lose the others.")
+
+if mode == "Parallel" and user_query.strip():
+    # Show how the prompt will be split before any request is sent
+    preamble, specifications = split_specifications(user_query)
+    if specifications:
+        with st.expander(f"{len(specifications)} specifications detected, one request each"):
+            if preamble:
+                st.caption(f"Shared with every request: {preamble}")
+            for number, specification in enumerate(specifications, 1):
+                st.markdown(f"**Request {number}**")
+                st.text(specification)
+    else:
+        st.caption("No separate specifications found; the prompt will be sent as a single request.")
+
+bypass_cache = st.checkbox("Bypass cache", value=False,
+                           help="Ask the model again even if these specifications were generated before.")
+
+
+def save_articles(articles):
+    if articles.article_generated and articles.articles:
+        get_article_store().add(articles.articles)
+        st.markdown(
+            "Articled Generated Successfully! Navigate to the 'Blogs' page to view them.")
+    else:
+        st.error(
+            "No articles were generated. Please check your specifications.")
+
+
 if st.button("Generate Articles", type="primary"):
     if user_query.strip():
-        with st.spinner("Generating articles..."):
-            articles = agent.generate_articles(user_query)
-            if articles.article_generated and articles.articles:
-                st.session_state.blogs.extend(articles.articles)
-                st.markdown(
-                    "Articled Generated Successfully! Navigate to the 'Blogs' page to view them.")
-            else:
-                st.error(
-                    "No articles were generated. Please check your specifications.")
+        if mode == "Stream":
+            stream = get_agent().stream_articles(user_query, use_cache=not bypass_cache)
+            with st.container(border=True):
+                st.write_stream(stream)
+            if stream.ttft_s is not None:
+                source = " (from cache)" if stream.cached else ""
+                st.caption(f"First text after {stream.ttft_s:.2f}s, finished in {stream.total_s:.1f}s{source}")
+            save_articles(stream.result())
+        else:
+            with st.spinner("Generating articles..."):
+                articles = get_agent().generate_articles(
+                    user_query, fan_out=mode == "Parallel", use_cache=not bypass_cache)
+                save_articles(articles)
+                for failure in getattr(articles, "failures", []):
+                    st.warning(f"Could not generate this article ({failure.error}):\n\n{failure.specification}")
     else:
         st.error("Please enter article specifications.")
+
+with st.expander("Response cache"):
+    cache = get_cache()
+    st.table(cache.stats())
+    if st.button("Clear cache"):
+        cache.clear()
+        st.rerun()
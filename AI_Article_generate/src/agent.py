@@ -1,12 +1,25 @@
-from google import genai
 from pydantic import BaseModel, Field
 from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import os
+import re
+import time
+
+from .cache import cache_key, get_cache, get_client
+from .telemetry import TELEMETRY
 
 load_dotenv()
 
-GEMINI_API_KEY = os.getenv("GOOGLE_API_KEY")
+MODEL_NAME = "gemini-2.5-flash"
+MAX_CONCURRENCY = int(os.getenv("ARTICLE_MAX_CONCURRENCY", "5"))
+
+# Where one specification starts: a "Title: ..." line (possibly "1) Title: ...") or,
+# when there are none, an unindented "1) ..." / "2. ..."
+NUMBERED_SPEC = re.compile(r"^ ?\d+[.)][ \t]+", re.MULTILINE)
+TITLE_SPEC = re.compile(r"^[ \t]*(?:(?:[-*]|\d+[.)])[ \t]*)?Title[ \t]*:", re.MULTILINE | re.IGNORECASE)
+# Line that starts each article in streaming mode; a Markdown comment, so it renders as nothing
+ARTICLE_MARKER = "[//]: # (article)"
 
 
 class Article(BaseModel):
@@ -21,6 +34,142 @@ class ArticlesOutput(BaseModel):
                                               description="List of generated articles")
 
 
+class ArticleFailure(BaseModel):
+    specification: str
+    error: str
+
+
+class BatchArticlesOutput(ArticlesOutput):
+    """ArticlesOutput merged from per-specification requests, plus what failed."""
+    failures: List[ArticleFailure] = Field(default_factory=list)
+
+
+def split_specifications(prompt: str):
+    """Split a prompt into its shared preamble and one text per article specification.
+
+    "Title:" lines mark specifications when there are any, so a numbered
+    list of general requirements stays in the preamble. Only a prompt
+    without them is split on numbered items. Returns (prompt, []) if fewer
+    than two specifications are found.
+    """
+    titles = [m.start() for m in TITLE_SPEC.finditer(prompt)]
+    starts = titles or [m.start() for m in NUMBERED_SPEC.finditer(prompt)]
+    if len(starts) < 2:
+        return prompt, []
+    ends = starts[1:] + [len(prompt)]
+    return prompt[:starts[0]].strip(), [prompt[a:b].strip() for a, b in zip(starts, ends)]
+
+
+def _outside_code(lines):
+    """Yield (line, in_code) for each line, tracking fenced code blocks."""
+    in_code = False
+    for line in lines:
+        if line.lstrip().startswith("```"):
+            in_code = not in_code
+        yield line, in_code
+
+
+def _article(lines) -> Optional[Article]:
+    body = "\n".join(lines).strip()
+    if body.endswith("\n---"):
+        body = body[:-4].strip()
+    if not body.startswith("## "):
+        return None
+    return Article(title=body.splitlines()[0][3:].strip(), content=body)
+
+
+def parse_markdown_articles(text: str, expected: int = None) -> List[Article]:
+    """Split streamed Markdown into articles.
+
+    Articles start with an ``ARTICLE_MARKER`` line followed by an H2 title.
+    If the model left the markers out, a ``---`` line followed by an H2
+    starts a new article, but only until ``expected`` articles (the number
+    of specifications) have been found; after that such sections are kept
+    in the current article, since articles use ``---`` and ``##`` internally
+    too. Text before the first title is dropped.
+    """
+    lines = text.splitlines()
+    if any(line.strip() == ARTICLE_MARKER and not in_code for line, in_code in _outside_code(lines)):
+        blocks, current = [], []
+        for line, in_code in _outside_code(lines):
+            if not in_code and line.strip() == ARTICLE_MARKER:
+                blocks.append(current)
+                current = []
+            else:
+                current.append(line)
+        blocks.append(current)
+        return [a for a in (_article(block) for block in blocks[1:]) if a]
+
+    expected = expected or 1
+    articles, current, separator = [], [], False
+    for line, in_code in _outside_code(lines):
+        if not articles and not current and not line.startswith("## "):
+            continue  # chatter before the first title
+        if not in_code and line.strip() == "---":
+            separator = True
+        elif separator and line.strip():
+            if line.startswith("## ") and len(articles) + 1 < expected:
+                articles.append(_article(current))
+                current = []
+            else:
+                current.append("---")
+            separator = False
+        if not separator:
+            current.append(line)
+    if current:
+        articles.append(_article(current))
+    return [a for a in articles if a]
+
+
+class ArticleStream:
+    """Iterator over Markdown chunks as Gemini writes them.
+
+    Pass it to ``st.write_stream``; once exhausted, ``result()`` returns the
+    validated ``ArticlesOutput``. ``ttft_s`` is the time to the first chunk
+    of text and ``total_s`` the time to the last. ``on_complete(text,
+    total_s)`` is called when the stream finishes; ``cached`` is True when
+    the text came from the response cache.
+    """
+
+    def __init__(self, texts, started_at: float, on_complete=None, cached: bool = False,
+                 expected: int = None):
+        self._texts = texts
+        self.expected = expected
+        self.started_at = started_at
+        self.on_complete = on_complete
+        self.cached = cached
+        self.ttft_s = None
+        self.total_s = None
+        self.chunks = []
+
+    def __iter__(self):
+        for text in self._texts:
+            if not text:
+                continue
+            if self.ttft_s is None:
+                self.ttft_s = time.perf_counter() - self.started_at
+                TELEMETRY.observe("article.ttft", self.ttft_s, cached=self.cached)
+            self.chunks.append(text)
+            yield text
+        self.total_s = time.perf_counter() - self.started_at
+        if self.on_complete is not None:
+            self.on_complete(self.text, self.total_s)
+
+    @property
+    def text(self) -> str:
+        return "".join(self.chunks)
+
+    def result(self) -> ArticlesOutput:
+        articles = parse_markdown_articles(self.text, self.expected)
+        return ArticlesOutput(article_generated=bool(articles), articles=articles or None)
+
+
+def single_spec_prompt(preamble: str, specification: str) -> str:
+    return (f"{preamble}\n\n" if preamble else "") + (
+        "This request is one part of a batch. Write exactly one article, "
+        f"for this specification only:\n\n{specification}")
+
+
 SYSTEM_PROMPT = """
 You are a helpful assistant specialized in writing high-quality programming articles.
 
@@ -60,26 +209,109 @@ Produce helpful, concise, and well-structured programming articles that a develo
 Important: If the user query does not contain any article specifications, raise an error indicating that at least one specification is required.
 """
 
+STREAM_SYSTEM_PROMPT = SYSTEM_PROMPT + f"""
+Streaming output: put a line containing exactly `{ARTICLE_MARKER}` directly before the H2 title of every article, including the first. Never write that line anywhere else.
+"""
+
 
 class ArticleGeneratorAgent:
-    def __init__(self):
-        self.client = genai.Client(api_key=GEMINI_API_KEY)
+    def __init__(self, client=None, cache=None):
+        """Uses the shared Gemini client and response cache unless others are given."""
+        self.client = client or get_client()
+        self.cache = cache or get_cache()
+
+    def _generate(self, prompt, use_cache=True):
+        schema = ArticlesOutput.model_json_schema()
+        key = cache_key(MODEL_NAME, SYSTEM_PROMPT, schema, prompt)
+        cached = self.cache.get(key) if use_cache else None
+        if cached is not None:
+            return ArticlesOutput.model_validate_json(cached)
+
+        started_at = time.perf_counter()
+        with TELEMETRY.span("gemini.generate", model=MODEL_NAME):
+            response = self.client.models.generate_content(
+                model=MODEL_NAME,
+                contents=prompt,
+                config={
+                    "system_instruction": SYSTEM_PROMPT,
+                    "response_mime_type": "application/json",
+                    "response_json_schema": schema,
+                },
+            )
+        TELEMETRY.record_gemini_usage(MODEL_NAME, getattr(response, "usage_metadata", None), mode="json")
+        if not response.text:
+            return ArticlesOutput(article_generated=False, articles=None)
+        articles = ArticlesOutput.model_validate_json(response.text)
+        # Only keep responses worth repeating; a refusal may not recur
+        if articles.article_generated:
+            self.cache.put(key, response.text, time.perf_counter() - started_at)
+        return articles
+
+    def stream_articles(self, prompt, use_cache=True) -> ArticleStream:
+        """Start generating in Markdown and return an ArticleStream over the text.
+
+        A cached response is replayed as a single chunk.
+        """
+        started_at = time.perf_counter()
+        key = cache_key(MODEL_NAME, STREAM_SYSTEM_PROMPT, None, prompt)
+        expected = len(split_specifications(prompt)[1]) or 1
+        cached = self.cache.get(key) if use_cache else None
+        if cached is not None:
+            return ArticleStream([cached], started_at, cached=True, expected=expected)
 
-    def generate_articles(self, prompt):
-        """Generates programming articles based on user specifications."""
-        response = self.client.models.generate_content(
-            model="gemini-2.5-flash",
+        def on_complete(text, total_s):
+            if parse_markdown_articles(text, expected):
+                self.cache.put(key, text, total_s)
+
+        response_stream = self.client.models.generate_content_stream(
+            model=MODEL_NAME,
             contents=prompt,
-            config={
-                "system_instruction": SYSTEM_PROMPT,
-                "response_mime_type": "application/json",
-                "response_json_schema": ArticlesOutput.model_json_schema(),
-            },
+            config={"system_instruction": STREAM_SYSTEM_PROMPT},
+        )
+
+        def texts():
+            usage = None
+            with TELEMETRY.span("gemini.stream", model=MODEL_NAME):
+                for chunk in response_stream:
+                    # Usage arrives with the last chunks; keep the latest
+                    usage = getattr(chunk, "usage_metadata", None) or usage
+                    yield chunk.text
+            TELEMETRY.record_gemini_usage(MODEL_NAME, usage, mode="stream")
+
+        return ArticleStream(texts(), started_at, on_complete, expected=expected)
+
+    def generate_articles(self, prompt, fan_out=False, max_concurrency=MAX_CONCURRENCY, use_cache=True):
+        """Generates programming articles based on user specifications.
+
+        With ``fan_out`` each specification is generated by its own request,
+        ``max_concurrency`` at a time, and the results are merged into a
+        ``BatchArticlesOutput`` in specification order; a failed article is
+        listed in ``failures`` instead of failing the whole batch.
+        Responses are served from the cache when the same request was made
+        before; ``use_cache=False`` always asks the model.
+        """
+        preamble, specifications = split_specifications(prompt) if fan_out else (prompt, [])
+        if not specifications:
+            return self._generate(prompt, use_cache)
+
+        def generate_one(specification):
+            try:
+                result = self._generate(single_spec_prompt(preamble, specification), use_cache)
+            except Exception as e:
+                return [], ArticleFailure(specification=specification, error=f"{type(e).__name__}: {e}")
+            if not result or not result.article_generated or not result.articles:
+                return [], ArticleFailure(specification=specification, error="No article was generated")
+            return result.articles, None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(specifications)))) as pool:
+            results = list(pool.map(generate_one, specifications))
+
+        articles = [article for generated, _ in results for article in generated]
+        return BatchArticlesOutput(
+            article_generated=bool(articles),
+            articles=articles or None,
+            failures=[failure for _, failure in results if failure],
         )
-        articles = {}
-        if response.text:
-            articles = ArticlesOutput.model_validate_json(response.text)
-        return articles
 
 
 if __name__ == "__main__":
@@ -0,0 +1,226 @@
+"""Generate articles in bulk from a spec file, resuming where a previous run stopped.
+
+Usage (from AI_Article_generate/):
+    python -m src.batch specs.jsonl --out articles.jsonl --concurrency 4
+
+Specs are a CSV with a header row or a JSONL file, one article per record.
+A record either has a ``prompt`` with the full specification, or fields such
+as ``title``, ``audience``, ``language`` and ``notes`` that are turned into
+"Field: value" lines. ``id`` identifies a record across runs; without it a
+hash of the specification is used.
+
+Each finished record is appended to the output JSONL straight away. Records
+already in it with status "ok" are skipped on the next run, so an interrupted
+batch is resumed by running the same command again.
+"""
+import argparse
+import csv
+import hashlib
+import json
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from pathlib import Path
+from typing import Callable, Iterator
+
+import httpx
+from google.genai.errors import APIError
+
+from .agent import ArticleGeneratorAgent
+from .telemetry import TELEMETRY, start_telemetry
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def iter_specs(path: str) -> Iterator[dict]:
+    """Yield spec records from a .csv or .jsonl file without reading it all at once."""
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def spec_prompt(record: dict) -> str:
+    """The specification text for a record; empty if it has neither a prompt nor a title."""
+    if str(record.get("prompt") or "").strip():
+        return str(record["prompt"]).strip()
+    if not str(record.get("title") or "").strip():
+        return ""
+    return "\n".join(f"{key.replace('_', ' ').capitalize()}: {value}"
+                     for key, value in record.items() if key != "id" and str(value or "").strip())
+
+
+def spec_id(record: dict, prompt: str) -> str:
+    if str(record.get("id") or "").strip():
+        return str(record["id"]).strip()
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def is_retryable(error: Exception) -> bool:
+    """Rate limits, server errors, dropped connections and timeouts are worth another try.
+
+    google-genai raises ``httpx.TransportError`` subclasses for the last two.
+    """
+    if isinstance(error, APIError):
+        return error.code in RETRY_STATUS_CODES or (error.code or 0) >= 500
+    return isinstance(error, (httpx.TransportError, ConnectionError, TimeoutError))
+
+
+def completed_ids(path: str) -> set:
+    """IDs of records that finished successfully in earlier runs of this output file."""
+    done = set()
+    if not Path(path).exists():
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a line cut short when a previous run was killed
+            if result.get("status") == "ok":
+                done.add(result["id"])
+    return done
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    return f"{seconds // 60}m{seconds % 60:02d}s"
+
+
+class BatchRunner:
+    """Generate one article per spec record through a bounded thread pool.
+
+    Failed requests are retried with exponential backoff and jitter when
+    ``is_retryable`` says so; anything else fails the record at once. At most
+    ``2 * max_concurrency`` records are read ahead of the workers, so large
+    spec files are streamed rather than loaded.
+    """
+
+    def __init__(self, agent: ArticleGeneratorAgent, max_concurrency: int = 4, max_attempts: int = 5,
+                 backoff_s: float = 2.0, max_backoff_s: float = 60.0, use_cache: bool = True,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.agent = agent
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.use_cache = use_cache
+        self.sleep = sleep
+        self.counts = {"ok": 0, "failed": 0, "skipped": 0, "resumed": 0, "retries": 0}
+        self._lock = threading.Lock()
+
+    def _generate(self, prompt: str, result: dict):
+        while True:
+            result["attempts"] += 1
+            try:
+                return self.agent.generate_articles(prompt, use_cache=self.use_cache)
+            except Exception as e:
+                if result["attempts"] >= self.max_attempts or not is_retryable(e):
+                    raise
+                delay = min(self.max_backoff_s, self.backoff_s * 2 ** (result["attempts"] - 1))
+                with self._lock:
+                    self.counts["retries"] += 1
+                TELEMETRY.count("batch_retries", code=getattr(e, "code", None) or type(e).__name__)
+                self.sleep(delay * random.uniform(0.5, 1.0))
+
+    def run_one(self, record: dict) -> dict:
+        prompt = spec_prompt(record)
+        result = {"id": spec_id(record, prompt), "status": "failed", "articles": [], "error": None,
+                  "attempts": 0, "latency_s": None, "spec": record}
+        if not prompt:
+            result.update(status="skipped", error="Record has neither a prompt nor a title")
+            return result
+        start = time.perf_counter()
+        try:
+            output = self._generate(prompt, result)
+            if output and output.article_generated and output.articles:
+                result.update(status="ok", articles=[a.model_dump() for a in output.articles])
+            else:
+                result["error"] = "No article was generated"
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        result["latency_s"] = round(time.perf_counter() - start, 3)
+        return result
+
+    def run(self, records, out_path: str, total: int = None,
+            on_result: Callable[[dict, dict], None] = None) -> dict:
+        """Process ``records`` into ``out_path``; returns the final progress snapshot.
+
+        ``on_result(result, progress)`` is called as each record finishes.
+        """
+        done = completed_ids(out_path)
+        start = time.perf_counter()
+        processed = 0
+
+        def progress() -> dict:
+            elapsed = time.perf_counter() - start
+            rate = processed / elapsed if elapsed > 0 else 0.0
+            remaining = None if total is None else max(0, total - self.counts["resumed"] - processed)
+            return {**self.counts, "processed": processed, "total": total, "elapsed_s": round(elapsed, 1),
+                    "items_per_s": round(rate, 3),
+                    "eta_s": round(remaining / rate, 1) if rate and remaining is not None else None}
+
+        with open(out_path, "a", encoding="utf-8") as out, \
+                ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            def finish(future):
+                nonlocal processed
+                result = future.result()
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                out.flush()
+                processed += 1
+                with self._lock:
+                    self.counts[result["status"]] += 1
+                TELEMETRY.count("batch_records", status=result["status"])
+                if on_result:
+                    on_result(result, progress())
+
+            pending = set()
+            for record in records:
+                if spec_id(record, spec_prompt(record)) in done:
+                    self.counts["resumed"] += 1
+                    continue
+                pending.add(pool.submit(self.run_one, record))
+                if len(pending) >= 2 * self.max_concurrency:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        finish(future)
+            for future in as_completed(pending):
+                finish(future)
+        return progress()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("specs", help="Spec file (.csv or .jsonl)")
+    parser.add_argument("--out", default="articles.jsonl", help="Output JSONL, also the resume checkpoint")
+    parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight at once")
+    parser.add_argument("--max-attempts", type=int, default=5, help="Tries per record on 429/5xx")
+    parser.add_argument("--no-cache", action="store_true", help="Do not reuse cached model responses")
+    args = parser.parse_args()
+    start_telemetry()
+
+    total = sum(1 for _ in iter_specs(args.specs))
+    runner = BatchRunner(ArticleGeneratorAgent(), max_concurrency=args.concurrency,
+                         max_attempts=args.max_attempts, use_cache=not args.no_cache)
+
+    def report(result, p):
+        eta = format_duration(p["eta_s"]) if p["eta_s"] is not None else "?"
+        detail = ", ".join(a["title"] for a in result["articles"]) or result["error"]
+        print(f"[{p['resumed'] + p['processed']}/{total}] {result['id']}: {result['status']} "
+              f"({result['latency_s']}s) {detail} | {p['items_per_s'] * 60:.1f}/min, ETA {eta}")
+
+    final = runner.run(iter_specs(args.specs), args.out, total=total, on_result=report)
+    print(f"Done in {format_duration(final['elapsed_s'])}: {final['ok']} ok, {final['failed']} failed, "
+          f"{final['skipped']} skipped, {final['resumed']} already done, {final['retries']} retries")
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from dotenv import load_dotenv
+
+from .telemetry import TELEMETRY
+
+if TYPE_CHECKING:
+    from google import genai
+
+load_dotenv()
+
+GEMINI_API_KEY = os.getenv("GOOGLE_API_KEY")
+CACHE_PATH = os.getenv("ARTICLE_CACHE_PATH", "data/article_cache.sqlite3")
+CACHE_TTL_S = float(os.getenv("ARTICLE_CACHE_TTL_S", str(7 * 24 * 3600)))
+CACHE_MAX_BYTES = int(os.getenv("ARTICLE_CACHE_MAX_MB", "200")) * 1024 * 1024
+CACHE_MEMORY_ENTRIES = int(os.getenv("ARTICLE_CACHE_MEMORY_ENTRIES", "128"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key         TEXT PRIMARY KEY,     -- sha256 of model, system prompt, schema and prompt
+    text        TEXT NOT NULL,
+    latency_s   REAL NOT NULL,        -- how long the model took to produce it
+    created_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size        INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+"""
+
+_client = None
+_cache = None
+_lock = threading.Lock()
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Ignore differences that do not change the request: line endings, trailing spaces, outer blank lines."""
+    prompt = unicodedata.normalize("NFC", prompt).replace("\r\n", "\n")
+    return "\n".join(line.rstrip() for line in prompt.split("\n")).strip()
+
+
+def cache_key(model: str, system_prompt: str, schema, prompt: str) -> str:
+    """Content address of a request; ``schema`` is None for plain Markdown responses."""
+    payload = json.dumps([model, system_prompt, schema, normalize_prompt(prompt)], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Model responses in an in-memory LRU backed by SQLite on disk.
+
+    Entries expire after ``ttl_s``. When the disk store grows past
+    ``max_bytes`` the least recently used entries are evicted. Each entry
+    remembers how long the model took to produce it, so ``stats()`` can
+    report the latency saved by hits.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, ttl_s: float = CACHE_TTL_S,
+                 max_bytes: int = CACHE_MAX_BYTES, memory_entries: int = CACHE_MEMORY_ENTRIES):
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "saved_s": 0.0}
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def _remember(self, key: str, entry: tuple):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str):
+        """Cached response text, or None on a miss or an expired entry."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[2] < self.ttl_s:
+                self._memory.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                self._counters["saved_s"] += entry[1]
+                TELEMETRY.count("response_cache_lookups", result="memory_hit")
+                return entry[0]
+            self._memory.pop(key, None)
+
+            row = self.conn.execute(
+                "SELECT text, latency_s, created_at FROM responses WHERE key = ? AND created_at > ?",
+                (key, now - self.ttl_s)).fetchone()
+            if row is None:
+                self._counters["misses"] += 1
+                TELEMETRY.count("response_cache_lookups", result="miss")
+                return None
+            with self.conn:
+                self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._remember(key, row)
+            self._counters["disk_hits"] += 1
+            self._counters["saved_s"] += row[1]
+            TELEMETRY.count("response_cache_lookups", result="disk_hit")
+            return row[0]
+
+    def put(self, key: str, text: str, latency_s: float):
+        now = time.time()
+        with self._lock:
+            self._remember(key, (text, latency_s, now))
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO responses (key, text, latency_s, created_at, accessed_at, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET text = excluded.text, latency_s = excluded.latency_s, "
+                    "created_at = excluded.created_at, accessed_at = excluded.accessed_at, size = excluded.size",
+                    (key, text, latency_s, now, now, len(text.encode("utf-8"))))
+                self._evict(now)
+
+    def _evict(self, now: float):
+        expired = self.conn.execute("DELETE FROM responses WHERE created_at <= ?", (now - self.ttl_s,)).rowcount
+        over = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0] - self.max_bytes
+        evicted = 0
+        if over > 0:
+            keys, freed = [], 0
+            for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+                keys.append((key,))
+                freed += size
+                if freed >= over:
+                    break
+            self.conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+            for (key,) in keys:
+                self._memory.pop(key, None)
+            evicted = len(keys)
+        self._counters["evictions"] += expired + evicted
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            with self.conn:
+                self.conn.execute("DELETE FROM responses")
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            counters = dict(self._counters)
+            memory_entries = len(self._memory)
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        lookups = hits + counters["misses"]
+        counters["saved_s"] = round(counters["saved_s"], 2)
+        return {**counters, "hit_rate": round(hits / lookups, 3) if lookups else None,
+                "memory_entries": memory_entries, "disk_entries": entries, "disk_bytes": size}
+
+
+def get_client() -> "genai.Client":
+    """Return the process-wide Gemini client, so Streamlit reruns reuse its connections.
+
+    google-genai takes over a second to import, so it is imported here on
+    first use; the pages render without it.
+    """
+    global _client
+    with _lock:
+        if _client is None:
+            from google import genai
+            _client = genai.Client(api_key=GEMINI_API_KEY)
+    return _client
+
+
+def get_cache() -> ResponseCache:
+    """Return the process-wide response cache."""
+    global _cache
+    with _lock:
+        if _cache is None:
+            _cache = ResponseCache()
+    return _cache
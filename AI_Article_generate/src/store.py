@@ -0,0 +1,163 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from dotenv import load_dotenv
+
+from .telemetry import TELEMETRY
+
+load_dotenv()
+
+ARTICLE_STORE_PATH = os.getenv("ARTICLE_STORE_PATH", "data/articles.sqlite3")
+SUMMARY_CHARS = 300
+SEARCH_TOKEN = re.compile(r"\w+", re.UNICODE)
+# Match markers for snippets; control characters cannot clash with the article's own Markdown
+MARK_START, MARK_END = "\x02", "\x03"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id           INTEGER PRIMARY KEY,
+    title        TEXT NOT NULL,
+    summary      TEXT NOT NULL,
+    content      TEXT NOT NULL,
+    content_hash TEXT NOT NULL UNIQUE,  -- the same article saved twice is stored once
+    created_at   REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, content, content='articles', content_rowid='id',
+    tokenize='porter unicode61', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, summary, content)
+    VALUES (new.id, new.title, new.summary, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary, content)
+    VALUES ('delete', old.id, old.title, old.summary, old.content);
+END;
+"""
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def summarize(content: str) -> str:
+    """The summary line that follows an article's H2 title, or its first line of prose."""
+    for line in content.splitlines():
+        line = line.strip()
+        if line and not line.startswith(("#", "-", "*", "|", ">", "```", "[", "---")):
+            return line[:SUMMARY_CHARS]
+    return ""
+
+
+def match_expression(query: str) -> str:
+    """Turn free text into an FTS5 query: all words must match, the last as a prefix.
+
+    Quoting every token means input such as ``c++`` or ``"async`` cannot
+    produce an FTS5 syntax error. A one-letter last word is matched exactly,
+    since as a prefix it would match most of the index.
+    """
+    tokens = SEARCH_TOKEN.findall(query)
+    if not tokens:
+        return ""
+    terms = [f'"{t}"' for t in tokens]
+    if len(tokens[-1]) > 1:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+def _highlight(snippet: str):
+    if not snippet or MARK_START not in snippet:
+        return None
+    return snippet.replace(MARK_START, "**").replace(MARK_END, "**")
+
+
+class ArticleStore:
+    """Generated articles in SQLite, with an FTS5 index over title, summary and body.
+
+    Listings return only id, title and summary; bodies are fetched one at a
+    time with ``get``.
+    """
+
+    def __init__(self, path: str = ARTICLE_STORE_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def add(self, articles) -> int:
+        """Save ``Article`` objects; returns how many were new."""
+        rows = [(a.title, summarize(a.content), a.content,
+                 hashlib.sha256(f"{a.title}\n{a.content}".encode("utf-8")).hexdigest(), time.time())
+                for a in articles]
+        with self._lock, self.conn:
+            # rowcount excludes the rows the FTS trigger writes
+            return self.conn.executemany(
+                "INSERT OR IGNORE INTO articles (title, summary, content, content_hash, created_at) "
+                "VALUES (?, ?, ?, ?, ?)", rows).rowcount
+
+    def count(self, query: str = "") -> int:
+        expression = match_expression(query)
+        with self._lock:
+            if expression:
+                return self.conn.execute(
+                    "SELECT COUNT(*) FROM articles_fts WHERE articles_fts MATCH ?", (expression,)).fetchone()[0]
+            return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def list(self, query: str = "", limit: int = 20, offset: int = 0) -> list:
+        """Newest first, or best match first when searching.
+
+        Each row has id, title, summary, created_at and, for searches where
+        the body matched, a ``snippet`` of it with the match in bold.
+        """
+        expression = match_expression(query)
+        with self._lock, TELEMETRY.span("library.list", search=bool(expression)):
+            if expression:
+                # Rank first, then build snippets for just this page rather than every match
+                ids = [row[0] for row in self.conn.execute(
+                    "SELECT rowid FROM articles_fts WHERE articles_fts MATCH ? "
+                    "ORDER BY bm25(articles_fts, 10.0, 4.0, 1.0) LIMIT ? OFFSET ?",
+                    (expression, limit, offset))]
+                placeholders = ", ".join("?" * len(ids))
+                rows = self.conn.execute(
+                    "SELECT a.id, a.title, a.summary, a.created_at, "
+                    "snippet(articles_fts, 2, ?, ?, '…', 16) AS snippet "
+                    "FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid "
+                    f"WHERE articles_fts MATCH ? AND articles_fts.rowid IN ({placeholders})",
+                    (MARK_START, MARK_END, expression, *ids)).fetchall()
+                rows.sort(key=lambda row: ids.index(row["id"]))
+                rows = [dict(row, snippet=_highlight(row["snippet"])) for row in rows]
+            else:
+                rows = self.conn.execute(
+                    "SELECT id, title, summary, created_at, NULL AS snippet FROM articles "
+                    "ORDER BY id DESC LIMIT ? OFFSET ?", (limit, offset)).fetchall()
+        return [dict(row) for row in rows]
+
+    def get(self, article_id: int):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT id, title, summary, content, created_at FROM articles WHERE id = ?",
+                (article_id,)).fetchone()
+        return dict(row) if row else None
+
+    def delete(self, article_id: int):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM articles WHERE id = ?", (article_id,))
+
+    def close(self):
+        self.conn.close()
+
+
+def get_article_store() -> ArticleStore:
+    """Return the process-wide article store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArticleStore()
+    return _store
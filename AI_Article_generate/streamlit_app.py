@@ -1,7 +1,14 @@
 import streamlit as st
+from dotenv import load_dotenv
+from src.telemetry import diagnostics_panel, start_telemetry
+
+load_dotenv()
+start_telemetry()
 
 home_page = st.Page("main.py", title="Home")
 blogs_page = st.Page("blogs.py", title="Blogs")
 
 pg = st.navigation([home_page, blogs_page])
 pg.run()
+
+diagnostics_panel()
@@ -0,0 +1,110 @@
+import json
+import threading
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from google.genai.errors import ClientError, ServerError
+
+from src.agent import ArticleGeneratorAgent, ArticlesOutput
+from src.batch import BatchRunner, completed_ids
+from src.cache import ResponseCache
+
+
+def api_error(cls, code, status):
+    return cls(code, {"error": {"code": code, "message": status.lower(), "status": status}})
+
+
+class StubClient:
+    """Stands in for genai.Client; each prompt plays its scripted outcomes in order.
+
+    An outcome is an exception to raise or a title to return one article for.
+    Once the script runs out the last outcome repeats.
+    """
+
+    def __init__(self, script: dict):
+        self.script = {prompt: list(outcomes) for prompt, outcomes in script.items()}
+        self.calls = []
+        self._lock = threading.Lock()
+        self.models = SimpleNamespace(generate_content=self.generate_content)
+
+    def generate_content(self, model, contents, config):
+        with self._lock:
+            self.calls.append(contents)
+            outcomes = self.script[contents]
+            outcome = outcomes.pop(0) if len(outcomes) > 1 else outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        output = ArticlesOutput(article_generated=True, articles=[{"title": outcome, "content": "Body"}])
+        return SimpleNamespace(text=output.model_dump_json(), usage_metadata=None)
+
+
+def make_runner(tmp_path, script, **kwargs):
+    client = StubClient(script)
+    agent = ArticleGeneratorAgent(client=client, cache=ResponseCache(str(tmp_path / "cache.sqlite3")))
+    return BatchRunner(agent, max_concurrency=2, sleep=lambda s: None, **kwargs), client
+
+
+def read_results(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_second_run_skips_ok_ids_and_retries_failed(tmp_path):
+    out = tmp_path / "articles.jsonl"
+    records = [{"id": "a", "prompt": "Title: A"}, {"id": "b", "prompt": "Title: B"}]
+    bad_request = api_error(ClientError, 400, "INVALID_ARGUMENT")
+
+    runner, client = make_runner(tmp_path, {"Title: A": ["A"], "Title: B": [bad_request]})
+    first = runner.run(records, str(out))
+    assert (first["ok"], first["failed"], first["resumed"]) == (1, 1, 0)
+    assert completed_ids(str(out)) == {"a"}
+
+    runner, client = make_runner(tmp_path, {"Title: A": ["A"], "Title: B": ["B"]})
+    second = runner.run(records, str(out))
+    assert (second["ok"], second["failed"], second["resumed"]) == (1, 0, 1)
+    assert client.calls == ["Title: B"]
+    assert completed_ids(str(out)) == {"a", "b"}
+    assert [r["status"] for r in read_results(out) if r["id"] == "b"] == ["failed", "ok"]
+
+
+@pytest.mark.parametrize("error", [
+    api_error(ClientError, 429, "RESOURCE_EXHAUSTED"),
+    api_error(ServerError, 500, "INTERNAL"),
+    api_error(ServerError, 503, "UNAVAILABLE"),
+    httpx.ConnectError("connection reset"),
+    httpx.ReadTimeout("read timed out"),
+])
+def test_rate_limits_server_errors_and_dropped_connections_are_retried(tmp_path, error):
+    runner, client = make_runner(tmp_path, {"Title: A": [error, error, "A"]})
+    result = runner.run_one({"id": "a", "prompt": "Title: A"})
+    assert result["status"] == "ok"
+    assert result["attempts"] == 3
+    assert runner.counts["retries"] == 2
+    assert [a["title"] for a in result["articles"]] == ["A"]
+
+
+def test_retries_stop_at_max_attempts(tmp_path):
+    error = api_error(ServerError, 503, "UNAVAILABLE")
+    runner, client = make_runner(tmp_path, {"Title: A": [error]}, max_attempts=3)
+    result = runner.run_one({"id": "a", "prompt": "Title: A"})
+    assert result["status"] == "failed"
+    assert result["attempts"] == 3
+    assert result["error"].startswith("ServerError: 503")
+
+
+def test_non_retryable_error_fails_at_once(tmp_path):
+    runner, client = make_runner(tmp_path, {"Title: A": [api_error(ClientError, 400, "INVALID_ARGUMENT"), "A"]})
+    result = runner.run_one({"id": "a", "prompt": "Title: A"})
+    assert result["status"] == "failed"
+    assert result["attempts"] == 1
+    assert result["error"].startswith("ClientError: 400")
+    assert runner.counts["retries"] == 0
+    assert len(client.calls) == 1
+
+
+def test_record_without_prompt_or_title_is_skipped(tmp_path):
+    runner, client = make_runner(tmp_path, {})
+    result = runner.run_one({"id": "x", "audience": "Developers"})
+    assert result["status"] == "skipped"
+    assert client.calls == []
@@ -0,0 +1,43 @@
+import time
+
+from src.cache import ResponseCache, cache_key
+
+
+def test_key_ignores_whitespace_differences():
+    assert cache_key("m", "s", None, "Title: A\r\n") == cache_key("m", "s", None, "  \nTitle: A  ")
+    assert cache_key("m", "s", None, "Title: A") != cache_key("m", "other", None, "Title: A")
+
+
+def test_hits_come_from_memory_then_disk(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResponseCache(path)
+    assert cache.get("k") is None
+    cache.put("k", "text", 1.5)
+    assert cache.get("k") == "text"
+
+    reopened = ResponseCache(path)
+    assert reopened.get("k") == "text"
+    assert reopened.get("k") == "text"
+    stats = reopened.stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["saved_s"]) == (1, 1, 3.0)
+
+
+def test_expired_entries_are_misses(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), ttl_s=60)
+    cache.put("k", "text", 1.0)
+    later = time.time() + 120
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert cache.get("k") is None
+
+
+def test_least_recently_used_entries_are_evicted_past_max_bytes(tmp_path, monkeypatch):
+    clock = iter(range(1_000_000, 2_000_000))
+    monkeypatch.setattr(time, "time", lambda: next(clock))
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), max_bytes=25, memory_entries=0)
+    cache.put("a", "x" * 10, 1.0)
+    cache.put("b", "x" * 10, 1.0)
+    assert cache.get("a") is not None  # now "b" is the least recently used
+    cache.put("c", "x" * 10, 1.0)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,14 @@
+from types import SimpleNamespace
+
+from src.agent import ArticleGeneratorAgent
+from src.cache import ResponseCache
+
+
+def test_empty_response_means_no_articles(tmp_path):
+    client = SimpleNamespace(models=SimpleNamespace(
+        generate_content=lambda **kwargs: SimpleNamespace(text="", usage_metadata=None)))
+    agent = ArticleGeneratorAgent(client=client, cache=ResponseCache(str(tmp_path / "cache.sqlite3")))
+
+    result = agent.generate_articles("Title: Rust for Python Developers")
+    assert result.article_generated is False
+    assert not result.articles
@@ -0,0 +1,56 @@
+from src.agent import ARTICLE_MARKER, parse_markdown_articles
+
+ARTICLE_A = """## Rust for Python Developers
+Ownership without tears.
+
+## Ownership
+Values have one owner.
+
+---
+
+## Conclusion
+Borrow, don't copy."""
+
+ARTICLE_B = """## FastAPI in Practice
+A minimal REST API.
+
+```yaml
+---
+## not a heading in YAML
+```"""
+
+
+def titles(articles):
+    return [a.title for a in articles]
+
+
+def test_markers_split_articles_and_keep_inner_sections():
+    text = f"Sure! Here you go.\n\n{ARTICLE_MARKER}\n{ARTICLE_A}\n\n---\n\n{ARTICLE_MARKER}\n{ARTICLE_B}\n"
+    articles = parse_markdown_articles(text, expected=2)
+    assert titles(articles) == ["Rust for Python Developers", "FastAPI in Practice"]
+    assert "## Conclusion" in articles[0].content
+    assert not articles[0].content.endswith("---")
+    assert ARTICLE_MARKER not in articles[1].content
+
+
+def test_without_markers_a_single_specification_is_one_article():
+    articles = parse_markdown_articles(ARTICLE_A, expected=1)
+    assert titles(articles) == ["Rust for Python Developers"]
+    assert "---\n## Conclusion" in articles[0].content
+
+
+def test_without_markers_separators_split_up_to_the_expected_count():
+    text = f"{ARTICLE_B}\n\n---\n\n{ARTICLE_A}"
+    assert titles(parse_markdown_articles(text, expected=2)) == ["FastAPI in Practice",
+                                                                 "Rust for Python Developers"]
+    assert titles(parse_markdown_articles(text, expected=1)) == ["FastAPI in Practice"]
+
+
+def test_separators_inside_code_blocks_are_ignored():
+    articles = parse_markdown_articles(ARTICLE_B, expected=3)
+    assert titles(articles) == ["FastAPI in Practice"]
+    assert "## not a heading in YAML" in articles[0].content
+
+
+def test_no_title_means_no_article():
+    assert parse_markdown_articles("I need at least one specification.") == []
@@ -0,0 +1,27 @@
+from src.agent import split_specifications
+
+
+def test_numbered_requirements_stay_in_the_preamble_when_titles_exist():
+    prompt = "Write articles. Requirements:\n1. Use markdown\n2. Be short\n\nTitle: A\nTitle: B"
+    preamble, specifications = split_specifications(prompt)
+    assert preamble == "Write articles. Requirements:\n1. Use markdown\n2. Be short"
+    assert specifications == ["Title: A", "Title: B"]
+
+
+def test_numbered_title_items_keep_their_details():
+    prompt = ('Specifications:\n\n1) Title: "Rust for Python Developers"\n   Audience: Beginner\n\n'
+              '2) Title: "Building REST APIs with FastAPI"\n   Notes: include a Dockerfile.')
+    preamble, specifications = split_specifications(prompt)
+    assert preamble == "Specifications:"
+    assert specifications == ['1) Title: "Rust for Python Developers"\n   Audience: Beginner',
+                              '2) Title: "Building REST APIs with FastAPI"\n   Notes: include a Dockerfile.']
+
+
+def test_numbered_items_are_specifications_without_title_lines():
+    assert split_specifications("Articles:\n1. Intro to Rust\n2. FastAPI basics") == (
+        "Articles:", ["1. Intro to Rust", "2. FastAPI basics"])
+
+
+def test_single_specification_is_not_split():
+    prompt = "Title: Only one\nRules:\n1. Be concise\n2. Use examples"
+    assert split_specifications(prompt) == (prompt, [])
@@ -0,0 +1,46 @@
+from src.agent import Article
+from src.store import ArticleStore, match_expression, summarize
+
+RUST = Article(title="Rust for Python Developers",
+               content="## Rust for Python Developers\nOwnership without tears.\n\nBorrow checkers explained.")
+FASTAPI = Article(title="FastAPI in Practice",
+                  content="## FastAPI in Practice\nA minimal REST API.\n\nAsync endpoints and dependency injection.")
+
+
+def test_summary_is_first_line_of_prose():
+    assert summarize(RUST.content) == "Ownership without tears."
+
+
+def test_match_expression_quotes_tokens():
+    assert match_expression('c++ "async') == '"c" "async"*'
+    assert match_expression("rust o") == '"rust" "o"'
+    assert match_expression("  ") == ""
+
+
+def test_same_article_is_stored_once(tmp_path):
+    store = ArticleStore(str(tmp_path / "articles.sqlite3"))
+    assert store.add([RUST, FASTAPI]) == 2
+    assert store.add([RUST]) == 0
+    assert store.count() == 2
+
+
+def test_search_ranks_and_highlights_body_matches(tmp_path):
+    store = ArticleStore(str(tmp_path / "articles.sqlite3"))
+    store.add([RUST, FASTAPI])
+    assert [r["title"] for r in store.list()] == ["FastAPI in Practice", "Rust for Python Developers"]
+
+    rows = store.list("borrow check")
+    assert [r["title"] for r in rows] == ["Rust for Python Developers"]
+    assert "**Borrow**" in rows[0]["snippet"]
+    assert store.count("dependency") == 1
+    assert store.list("nothing matches this") == []
+
+
+def test_deleted_articles_leave_the_index(tmp_path):
+    store = ArticleStore(str(tmp_path / "articles.sqlite3"))
+    store.add([RUST])
+    article_id = store.list()[0]["id"]
+    assert store.get(article_id)["content"] == RUST.content
+    store.delete(article_id)
+    assert store.get(article_id) is None
+    assert store.count("ownership") == 0
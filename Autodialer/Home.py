@@ -1,19 +1,35 @@
 import streamlit as st
-from src.agent import AutodialerAgent
+from src.agent import AutodialerAgent, CALL_STATS
+from src.tools import reset_twilio_client
+
+
+@st.cache_resource
+def get_agent():
+    """Build the agent once per process; reruns reuse its model and graph."""
+    return AutodialerAgent()
+
 
 st.title("AutoDialer")
 st.write("Welcome to the AutoDialer application!")
 st.write("Please provide the mobile number with country code and message to initiate a call. (Only verified numbers are allowed due to Twilio trial account limitations.)")
 
-agent = AutodialerAgent()
-
 user_query = st.text_area("Enter your message:", height=150)
 if st.button("Make Call", type="primary"):
     if user_query.strip():
         response = None
         with st.spinner("Processing your request..."):
-            response = agent.call_agent(user_query.strip())
+            # Built on the first call rather than on page load
+            response = get_agent().call_agent(user_query.strip())
         st.write("Response from AutoDialer:")
         st.markdown(response["structured_response"].final_response)
+        if not response["messages"]:
+            st.caption("Handled directly, without the language model.")
     else:
         st.error("Some error occurred. Please try again.")
+
+with st.expander("Request stats (direct vs language model)"):
+    st.table(CALL_STATS.summary())
+    if st.button("Reload agent", help="Discard the cached agent and Twilio client; "
+                                      "both are rebuilt on the next call."):
+        get_agent.clear()
+        reset_twilio_client()
@@ -0,0 +1,260 @@
+"""Load test for the Autodialer against local stand-ins.
+
+Starts the fake Twilio API in-process and drives make_call,
+AutodialerAgent.call_agent (fast path and LLM path, the latter with a stub
+chat model) and fetch_call_logs at increasing concurrency. No real calls
+are placed and no Gemini quota is used.
+
+Usage (from Autodialer/):
+    python -m benchmarks.bench_autodialer --concurrency 1 4 16 64 --requests 200
+    python -m benchmarks.bench_autodialer --twilio-latency-ms 150 --llm-latency-ms 800 --error-rate 0.02
+    python -m benchmarks.bench_autodialer --client-per-call   # old behaviour: new Twilio client per call
+    python -m benchmarks.bench_autodialer --compare benchmarks/results/<older>.json
+"""
+import os
+
+# Benchmarks never talk to the real services: these override anything in .env
+os.environ.update({
+    "TWILIO_ACCOUNT_SID": "ACbenchmark",
+    "TWILIO_AUTH_TOKEN": "benchmark",
+    "TWILIO_NUMBER": "+15005550006",
+    "VERIFIED_NUMBER": "+15005550010",
+    "GOOGLE_API_KEY": "benchmark",
+    "STATUS_CALLBACK_URL": "",
+})
+
+import argparse  # noqa: E402
+import contextvars  # noqa: E402
+import json  # noqa: E402
+import platform  # noqa: E402
+import subprocess  # noqa: E402
+import threading  # noqa: E402
+import time  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+from datetime import datetime  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+from twilio.http.http_client import TwilioHttpClient  # noqa: E402
+from twilio.rest import Client  # noqa: E402
+
+from src import logs, tools  # noqa: E402
+from src.agent import VERIFIED_NUMBER, AutodialerAgent  # noqa: E402
+from src.fake_twilio import start_fake_twilio  # noqa: E402
+
+from .stub_llm import StubChatModel  # noqa: E402
+
+RESULTS_DIR = Path(__file__).parent / "results"
+SCENARIOS = ["make_call", "agent_fast_path", "agent_llm", "fetch_call_logs"]
+COMPONENTS = ["llm", "twilio_http", "client_setup"]
+
+
+def percentiles(values: list) -> dict:
+    """Nearest-rank p50/p95/p99 plus mean, in milliseconds."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50_ms": round(pick(0.50), 3),
+        "p95_ms": round(pick(0.95), 3),
+        "p99_ms": round(pick(0.99), 3),
+    }
+
+
+class Breakdown:
+    """Per-request accumulator of time spent in each instrumented component.
+
+    A context variable rather than a thread-local, because LangGraph runs
+    tools on its own executor threads and copies the context over.
+    """
+
+    def __init__(self):
+        self._spent = contextvars.ContextVar("spent", default=None)
+
+    def begin(self):
+        self._spent.set(dict.fromkeys(COMPONENTS, 0.0))
+
+    def add(self, component: str, seconds: float):
+        spent = self._spent.get()
+        if spent is not None:
+            spent[component] += seconds
+
+    def end(self) -> dict:
+        spent = self._spent.get()
+        self._spent.set(None)
+        return spent
+
+    def timed(self, component: str, fn):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add(component, time.perf_counter() - start)
+        return wrapper
+
+
+def instrument(breakdown: Breakdown, base_url: str, client_per_call: bool):
+    """Wrap the HTTP layer, client setup and the stub model with timers."""
+    TwilioHttpClient.request = breakdown.timed("twilio_http", TwilioHttpClient.request)
+    StubChatModel._generate = breakdown.timed("llm", StubChatModel._generate)
+
+    def fresh_client():
+        # What make_call did before the shared client: new session for every call
+        client = Client(tools.TWILIO_ACCOUNT_SID, tools.TWILIO_AUTH_TOKEN, http_client=TwilioHttpClient())
+        client.api.base_url = base_url
+        return client
+
+    get_client = fresh_client if client_per_call else tools.get_twilio_client
+    tools.get_twilio_client = breakdown.timed("client_setup", get_client)
+    logs.get_twilio_client = tools.get_twilio_client
+
+
+def client_construction_ms(n: int = 200) -> float:
+    """Mean cost of building a Twilio client with its own HTTP session."""
+    start = time.perf_counter()
+    for _ in range(n):
+        Client("ACbenchmark", "benchmark", http_client=TwilioHttpClient())
+    return round((time.perf_counter() - start) / n * 1000, 3)
+
+
+def make_operation(scenario: str, agent: AutodialerAgent):
+    if scenario == "make_call":
+        make_call = tools.get_make_call_tool()
+        return lambda i: make_call.invoke(
+            {"mobile_no": VERIFIED_NUMBER, "message": f"Benchmark call {i}"})
+    if scenario == "agent_fast_path":
+        return lambda i: agent.call_agent(
+            f"Call {VERIFIED_NUMBER} and say 'Benchmark call {i}'")["structured_response"].final_response
+    if scenario == "agent_llm":
+        # No quoted message, so the fast path hands this to the model
+        return lambda i: agent.call_agent(
+            f"Please ring {VERIFIED_NUMBER} and tell them: benchmark call {i}")["structured_response"].final_response
+    if scenario == "fetch_call_logs":
+        return lambda i: logs.fetch_call_logs()
+    raise ValueError(scenario)
+
+
+def run_level(operation, breakdown: Breakdown, concurrency: int, requests: int) -> dict:
+    latencies, parts, failures = [], [], 0
+    lock = threading.Lock()
+
+    def task(i):
+        nonlocal failures
+        breakdown.begin()
+        start = time.perf_counter()
+        result = operation(i)
+        elapsed = time.perf_counter() - start
+        spent = breakdown.end()
+        with lock:
+            latencies.append(elapsed)
+            parts.append(spent)
+            if isinstance(result, str) and "Failed" in result:
+                failures += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(task, range(requests)))
+    wall = time.perf_counter() - start
+
+    mean = {c: sum(p[c] for p in parts) / len(parts) * 1000 for c in COMPONENTS}
+    mean["other"] = sum(latencies) / len(latencies) * 1000 - sum(mean.values())
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "calls_per_s": round(requests / wall, 1),
+        "failures": failures,
+        "latency": percentiles(latencies),
+        "time_breakdown_ms": {k: round(v, 3) for k, v in mean.items()},
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(current: dict, previous_path: str):
+    previous = json.loads(Path(previous_path).read_text())
+    print(f"\nCompared with {previous_path} ({previous['meta'].get('commit')}):")
+    for scenario, levels in current["results"].items():
+        old_levels = {r["concurrency"]: r for r in previous["results"].get(scenario, [])}
+        for now in levels:
+            old = old_levels.get(now["concurrency"])
+            if not old:
+                continue
+            for label, getter in [("calls/s", lambda r: r["calls_per_s"]),
+                                  ("p50 ms", lambda r: r["latency"]["p50_ms"]),
+                                  ("p99 ms", lambda r: r["latency"]["p99_ms"])]:
+                a, b = getter(old), getter(now)
+                if a:
+                    print(f"  {scenario:<16} c={now['concurrency']:<4} {label:<8} "
+                          f"{a:>10} -> {b:>10} ({(b - a) / a:+.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario and level")
+    parser.add_argument("--scenarios", nargs="+", default=SCENARIOS, choices=SCENARIOS)
+    parser.add_argument("--twilio-latency-ms", type=float, default=100.0)
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of calls the fake Twilio API rejects")
+    parser.add_argument("--llm-latency-ms", type=float, default=500.0,
+                        help="Simulated latency of each model turn")
+    parser.add_argument("--client-per-call", action="store_true",
+                        help="Build a new Twilio client for every request, as before the shared client")
+    parser.add_argument("--out", default=None, help="Where to write the JSON results")
+    parser.add_argument("--compare", default=None, help="Earlier results JSON to diff against")
+    args = parser.parse_args()
+
+    server = start_fake_twilio(latency_ms=args.twilio_latency_ms, error_rate=args.error_rate)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    tools.get_twilio_client().api.base_url = base_url
+
+    breakdown = Breakdown()
+    instrument(breakdown, base_url, args.client_per_call)
+    model = StubChatModel(verified_number=VERIFIED_NUMBER, latency_s=args.llm_latency_ms / 1000)
+    agent = AutodialerAgent(model=model)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "twilio_latency_ms": args.twilio_latency_ms,
+            "llm_latency_ms": args.llm_latency_ms,
+            "error_rate": args.error_rate,
+            "client_per_call": args.client_per_call,
+            "client_construction_ms": client_construction_ms(),
+        },
+        "results": {},
+    }
+    for scenario in args.scenarios:
+        operation = make_operation(scenario, agent)
+        report["results"][scenario] = []
+        for concurrency in args.concurrency:
+            result = run_level(operation, breakdown, concurrency, args.requests)
+            report["results"][scenario].append(result)
+            parts = ", ".join(f"{k}={v}ms" for k, v in result["time_breakdown_ms"].items())
+            print(f"{scenario:<16} c={concurrency:<4} {result['calls_per_s']:>8} calls/s  "
+                  f"p50={result['latency']['p50_ms']}ms p95={result['latency']['p95_ms']}ms "
+                  f"p99={result['latency']['p99_ms']}ms  [{parts}]")
+
+    server.shutdown()
+    out = Path(args.out) if args.out else RESULTS_DIR / f"autodialer-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {out}")
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
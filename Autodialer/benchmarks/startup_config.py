@@ -0,0 +1,22 @@
+"""What bench_startup.py measures for the Autodialer.
+
+Imports cover the agent, Twilio tools, fast path, call store and analytics;
+setup is building the agent and the shared Twilio client.
+"""
+HEAVY_PACKAGES = ["langchain", "langchain_core", "langchain_google_genai", "langgraph", "twilio",
+                  "pandas", "numpy"]
+IMPORTS = ["src.agent", "src.tools", "src.fast_path", "src.call_store", "src.analytics"]
+SETUP = {
+    "agent": "from src.agent import AutodialerAgent; AutodialerAgent()",
+    "twilio_client": "from src.tools import get_twilio_client; get_twilio_client()",
+}
+# Placeholders so nothing reaches the real services; Home renders without them too
+ENV = {
+    "TWILIO_ACCOUNT_SID": "ACbenchmark",
+    "TWILIO_AUTH_TOKEN": "benchmark",
+    "TWILIO_NUMBER": "+15005550006",
+    "VERIFIED_NUMBER": "+15005550010",
+    "GOOGLE_API_KEY": "benchmark",
+    "TELEMETRY_PORT": "",
+    "TELEMETRY_JSONL": "",
+}
@@ -0,0 +1,64 @@
+import re
+import time
+import uuid
+from typing import Any, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+NUMBER_PATTERN = re.compile(r"\+[\d\s().-]{7,20}\d")
+MESSAGE_PATTERN = re.compile(r"(?:message|say|tell(?: them)?)\s*:?\s*[\"'“‘]?(?P<message>.+?)[\"'”’]?\s*$",
+                             re.IGNORECASE | re.DOTALL)
+
+
+class StubChatModel(BaseChatModel):
+    """Deterministic stand-in for Gemini that follows the AutoDialer prompt.
+
+    The first turn calls ``make_call`` (or refuses a number other than
+    ``verified_number``); the turn after the tool result answers with the
+    ``AgentOutput`` structured-output tool. Each turn sleeps ``latency_s``
+    to model the API round-trip.
+    """
+
+    verified_number: str = ""
+    latency_s: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "autodialer-stub"
+
+    def bind_tools(self, tools, **kwargs):
+        # Tool schemas are fixed for this agent, nothing to bind
+        return self
+
+    def _reply(self, messages: List[BaseMessage]) -> AIMessage:
+        last = messages[-1]
+        if isinstance(last, ToolMessage):
+            result = str(last.content)
+            if result.startswith("Call initiated with SID: "):
+                sid = result.rsplit(" ", 1)[-1]
+                answer = f"Call initiated successfully with call_sid: `{sid}`. Check Call logs for call status."
+            else:
+                answer = f"Failed to make call with error as: `{result}`"
+            return self._tool_call("AgentOutput", {"final_response": answer})
+
+        text = next(str(m.content) for m in reversed(messages) if isinstance(m, HumanMessage))
+        number = NUMBER_PATTERN.search(text)
+        mobile_no = re.sub(r"[\s().-]", "", number.group(0)) if number else ""
+        if mobile_no != self.verified_number:
+            return self._tool_call("AgentOutput", {
+                "final_response": "Due to the trial account of Twilio, I can make calls to verified numbers only."})
+        message = MESSAGE_PATTERN.search(text[number.end():])
+        return self._tool_call("make_call", {
+            "mobile_no": mobile_no, "message": message.group("message") if message else "Hello"})
+
+    @staticmethod
+    def _tool_call(name: str, args: dict) -> AIMessage:
+        return AIMessage(content="", tool_calls=[{"name": name, "args": args, "id": f"call_{uuid.uuid4().hex[:12]}"}])
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
@@ -1,18 +1,122 @@
 import streamlit as st
-from src.logs import fetch_call_logs
+from datetime import datetime, time as dt_time, timedelta, timezone
+from src.analytics import CallAnalytics
+from src.call_store import CallStore
+
+PAGE_SIZES = [25, 50, 100, 250]
+LIVE_REFRESH_S = 2.0
+
+
+@st.cache_resource
+def get_call_store():
+    return CallStore()
+
+
+@st.cache_resource
+def get_analytics():
+    return CallAnalytics()
+
+
+def format_ts(value):
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
 
 st.title("Call Logs")
-st.write("This page will display the logs of last 50 calls made using the AutoDialer agent.")
-
-# Refresh controls
-if st.button("Refresh", type="primary"):
-    # Attempt to clear any cached data (if used) before re-running
-    try:
-        st.cache_data.clear()
-    except Exception:
-        pass
-    st.rerun()
-
-with st.spinner("Fetching call logs..."):
-    call_logs = fetch_call_logs()
-    st.table(call_logs)
+st.write("Calls made using the AutoDialer agent, read from the local call-log store. Sync to pull new and updated calls from Twilio.")
+
+store = get_call_store()
+
+# Sync controls
+col_sync, col_info, col_live = st.columns([1, 2, 1])
+# The first sync runs on its own; after a failure it backs off instead of retrying on every rerun
+if col_sync.button("Sync with Twilio", type="primary") or store.auto_sync_due():
+    with st.spinner("Syncing call logs..."):
+        try:
+            result = store.sync()
+            st.toast(f"Synced: {result['fetched']} calls read, {result['changed']} new or changed")
+        except Exception as e:
+            st.error(f"Sync failed: {e}")
+last_sync = store.last_sync()
+col_info.caption(f"Last synced: {format_ts(last_sync)} UTC" if last_sync else "Not synced yet.")
+live = col_live.toggle("Live updates", help="Re-read the store every few seconds; status callbacks "
+                                            "(src/callbacks.py) keep it current without syncing.")
+
+# Filters, applied in SQLite
+col_status, col_number, col_dates = st.columns(3)
+statuses = col_status.multiselect("Status", store.statuses())
+number = col_number.text_input("To number starts with", placeholder="+91")
+dates = col_dates.date_input("Date range (UTC)", value=(), format="YYYY-MM-DD")
+
+date_from = date_to = None
+if len(dates) >= 1:
+    date_from = datetime.combine(dates[0], dt_time.min, timezone.utc).timestamp()
+if len(dates) == 2:
+    date_to = datetime.combine(dates[1] + timedelta(days=1), dt_time.min, timezone.utc).timestamp()
+
+tab_calls, tab_analytics = st.tabs(["Calls", "Analytics"])
+
+with tab_calls:
+    col_size, col_page = st.columns(2)
+    page_size = col_size.selectbox("Rows per page", PAGE_SIZES, index=1)
+    total = store.count(statuses, number, date_from, date_to)
+    pages = max(1, -(-total // page_size))
+    page = col_page.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1)
+
+
+@st.fragment(run_every=LIVE_REFRESH_S if live else None)
+def render_calls():
+    total = store.count(statuses, number, date_from, date_to)
+    rows = store.query(statuses, number, date_from, date_to,
+                       limit=page_size, offset=(page - 1) * page_size)
+    st.caption(f"{total} matching calls")
+    st.dataframe(
+        [{
+            "sid": r["sid"],
+            "to": r["to_number"],
+            "status": r["status"],
+            "created": format_ts(r["date_created"]),
+            "start_time": format_ts(r["start_time"]),
+            "end_time": format_ts(r["end_time"]),
+            "duration": r["duration"],
+        } for r in rows],
+        width="stretch",
+        hide_index=True,
+    )
+
+
+@st.fragment(run_every=LIVE_REFRESH_S if live else None)
+def render_analytics():
+    analytics = get_analytics()
+    analytics.refresh()  # only recomputes hours with new or changed calls
+    hourly = analytics.hourly(date_from, date_to)
+    if hourly.empty:
+        st.info("No calls in the selected range yet.")
+        return
+    summary = analytics.summary(hourly)
+    st.caption("Covers the selected date range; status and number filters apply to the Calls tab only.")
+
+    col_calls, col_rate, col_duration, col_live = st.columns(4)
+    col_calls.metric("Calls", f"{summary['calls']:,}")
+    col_rate.metric("Answer rate", f"{summary['answer_rate']:.1%}" if summary["answer_rate"] is not None else "n/a")
+    col_duration.metric("Avg talk time", f"{summary['avg_duration_s']:.0f}s" if summary["avg_duration_s"] else "n/a")
+    col_live.metric("In progress", f"{summary['in_flight']:,}")
+
+    outcome_columns = ["completed", "busy", "failed", "no_answer", "canceled", "in_flight"]
+    st.subheader("Calls per hour")
+    st.bar_chart(hourly[outcome_columns], stack=True)
+    st.subheader("Calls per day")
+    st.bar_chart(analytics.daily(hourly)[outcome_columns], stack=True)
+
+    col_failures, col_durations = st.columns(2)
+    col_failures.subheader("Failures")
+    col_failures.bar_chart(summary["failures"])
+    col_durations.subheader("Talk time (answered calls)")
+    col_durations.bar_chart(summary["durations"], sort=False)
+
+
+with tab_calls:
+    render_calls()
+with tab_analytics:
+    render_analytics()
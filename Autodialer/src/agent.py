@@ -1,10 +1,11 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.agents import create_agent
 from dotenv import load_dotenv
-from .tools import make_call
-from langchain.agents.structured_output import ToolStrategy
+from .tools import place_call
+from .fast_path import normalize_number, parse_call_request
+from .telemetry import TELEMETRY
 from pydantic import BaseModel
 import os
+import threading
+import time
 
 load_dotenv()
 
@@ -39,14 +40,59 @@ You are **AutoDialer**, a calling agent responsible for initiating phone calls u
 """
 
 
+TRIAL_REFUSAL = "Due to the trial account of Twilio, I can make calls to verified numbers only."
+
+
 class AgentOutput(BaseModel):
     final_response: str
 
 
-class AutodialerAgent:
+class CallPathStats:
+    """Process-wide counts and latencies of fast-path vs LLM-path requests."""
+
     def __init__(self):
-        self.model = ChatGoogleGenerativeAI(model=MODEL_NAME)
-        self.tools = [make_call]
+        self.latencies = {"fast_path": [], "llm": []}
+        self._lock = threading.Lock()
+
+    def record(self, path: str, seconds: float):
+        with self._lock:
+            self.latencies[path].append(seconds)
+
+    def summary(self) -> dict:
+        with self._lock:
+            out = {}
+            for path, values in self.latencies.items():
+                ordered = sorted(values)
+                out[path] = {
+                    "count": len(ordered),
+                    "mean_ms": round(sum(ordered) / len(ordered) * 1000, 1) if ordered else None,
+                    "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1) if ordered else None,
+                    "max_ms": round(ordered[-1] * 1000, 1) if ordered else None,
+                }
+            return out
+
+
+CALL_STATS = CallPathStats()
+
+
+class AutodialerAgent:
+    def __init__(self, model=None):
+        """``model`` defaults to Gemini; any LangChain chat model with tool calling works.
+
+        LangChain is imported here rather than at module level, so pages that
+        only need ``CALL_STATS`` or the fast path start without it.
+        """
+        from langchain.agents import create_agent
+        from langchain.agents.structured_output import ToolStrategy
+        from .model_telemetry import ModelTelemetry
+        from .tools import get_make_call_tool
+
+        if model is None:
+            from langchain_google_genai import ChatGoogleGenerativeAI
+            model = ChatGoogleGenerativeAI(model=MODEL_NAME)
+        self.model = model
+        self.telemetry = ModelTelemetry(getattr(self.model, "model", None) or type(self.model).__name__)
+        self.tools = [get_make_call_tool()]
         self.agent = create_agent(
             self.model,
             tools=self.tools,
@@ -54,11 +100,40 @@ class AutodialerAgent:
             response_format=ToolStrategy(AgentOutput)
         )
 
+    def fast_path(self, user_input: str):
+        """Handle a well-formed instruction without the model.
+
+        Applies the same rules as SYSTEM_PROMPT; returns None if the input
+        needs the agent.
+        """
+        request = parse_call_request(user_input)
+        if request is None:
+            return None
+        if request.mobile_no != normalize_number(VERIFIED_NUMBER):
+            final_response = TRIAL_REFUSAL
+        else:
+            try:
+                call_sid = place_call(request.mobile_no, request.message)
+                final_response = (f"Call initiated successfully with call_sid: `{call_sid}`. "
+                                  "Check Call logs for call status.")
+            except Exception as e:
+                final_response = f"Failed to make call with error as: `{e}`"
+        return {"messages": [], "structured_response": AgentOutput(final_response=final_response)}
+
     def call_agent(self, user_input: str) -> str:
         """Invoke the agent with user input to make a call."""
+        start = time.perf_counter()
+        response = self.fast_path(user_input)
+        if response is not None:
+            CALL_STATS.record("fast_path", time.perf_counter() - start)
+            TELEMETRY.observe("agent.call", time.perf_counter() - start, path="fast_path")
+            return response
         response = self.agent.invoke(
-            {"messages": [{"role": "user", "content": user_input}]}
+            {"messages": [{"role": "user", "content": user_input}]},
+            config={"callbacks": [self.telemetry]},
         )
+        CALL_STATS.record("llm", time.perf_counter() - start)
+        TELEMETRY.observe("agent.call", time.perf_counter() - start, path="llm")
         return response
 
 
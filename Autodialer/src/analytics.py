@@ -0,0 +1,152 @@
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from .call_store import CALL_STORE_PATH, TERMINAL_STATUSES
+from .telemetry import TELEMETRY
+
+FAILURE_STATUSES = ("busy", "failed", "no-answer", "canceled")
+# Duration buckets in seconds, [lower, upper)
+DURATION_BINS = [0, 10, 30, 60, 120, 300, np.inf]
+DURATION_LABELS = ["<10s", "10-30s", "30-60s", "1-2m", "2-5m", "5m+"]
+DURATION_COLUMNS = ["d_lt_10", "d_10_30", "d_30_60", "d_60_120", "d_120_300", "d_300_plus"]
+STATUS_COLUMNS = {"completed": "completed", "busy": "busy", "failed": "failed",
+                  "no-answer": "no_answer", "canceled": "canceled"}
+# Calls updated this recently are re-read on the next refresh too, in case
+# another writer (sync, status callbacks) committed them after we looked
+WATERMARK_LAG_S = 5
+ROLLUP_COLUMNS = (["hour", "calls", "answered", "in_flight", "total_duration"]
+                  + list(STATUS_COLUMNS.values()) + DURATION_COLUMNS)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS hourly_rollups (
+    hour REAL PRIMARY KEY,               -- unix time of the start of the hour (UTC)
+    {", ".join(f"{c} INTEGER NOT NULL DEFAULT 0" for c in ROLLUP_COLUMNS[1:])}
+);
+CREATE TABLE IF NOT EXISTS rollup_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def rollup_hours(calls: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate calls (date_created, status, duration) into one row per hour."""
+    hour = (calls["date_created"] // 3600 * 3600).rename("hour")
+    duration = calls["duration"].fillna(0)
+    finished = calls["status"].isin(TERMINAL_STATUSES)
+    columns = {
+        "calls": pd.Series(1, index=calls.index),
+        "answered": (calls["status"].eq("completed") & duration.gt(0)).astype(int),
+        "in_flight": (~finished).astype(int),
+        "total_duration": duration.where(calls["status"].eq("completed"), 0).astype(int),
+    }
+    for status, column in STATUS_COLUMNS.items():
+        columns[column] = calls["status"].eq(status).astype(int)
+    buckets = pd.cut(duration, DURATION_BINS, right=False, labels=DURATION_COLUMNS)
+    # Only answered calls count towards the duration distribution
+    dummies = pd.get_dummies(buckets.where(columns["answered"].astype(bool))).astype(int)
+    rolled = pd.concat([pd.DataFrame(columns), dummies], axis=1).groupby(hour).sum()
+    return rolled.reindex(columns=ROLLUP_COLUMNS[1:], fill_value=0).reset_index()
+
+
+def _runs(hours: list) -> list:
+    """Group sorted hour starts into contiguous [start, end) ranges."""
+    runs = []
+    for hour in hours:
+        if runs and hour == runs[-1][1]:
+            runs[-1][1] = hour + 3600
+        else:
+            runs.append([hour, hour + 3600])
+    return runs
+
+
+class CallAnalytics:
+    """Answer rate, failures, durations and volume from per-hour rollups.
+
+    Rollups live next to the calls in the call-store database. ``refresh``
+    only recomputes the hours that contain calls changed since the last
+    refresh (tracked through ``calls.updated_at``), so keeping them current
+    costs the same whether the history holds a thousand calls or a million.
+    """
+
+    def __init__(self, path: str = CALL_STORE_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def _watermark(self) -> float:
+        row = self.conn.execute("SELECT value FROM rollup_state WHERE key = 'updated_at'").fetchone()
+        return float(row[0]) if row else 0.0
+
+    @TELEMETRY.timed("analytics.refresh")
+    def refresh(self) -> dict:
+        """Bring the rollups up to date with the calls table."""
+        start = time.perf_counter()
+        now = time.time()
+        with self._lock:
+            watermark = self._watermark()
+            newest, hours = self.conn.execute(
+                "SELECT MAX(updated_at), GROUP_CONCAT(DISTINCT CAST(date_created / 3600 AS INTEGER)) "
+                "FROM calls WHERE updated_at > ? AND date_created IS NOT NULL",
+                (watermark,)).fetchone()
+            if newest is None:
+                return {"hours_updated": 0, "calls_scanned": 0,
+                        "seconds": round(time.perf_counter() - start, 3)}
+            hours = sorted(int(h) * 3600 for h in hours.split(","))
+            scanned = 0
+            with self.conn:
+                for run_start, run_end in _runs(hours):
+                    calls = pd.read_sql_query(
+                        "SELECT date_created, status, duration FROM calls "
+                        "WHERE date_created >= ? AND date_created < ?",
+                        self.conn, params=(run_start, run_end))
+                    scanned += len(calls)
+                    rolled = rollup_hours(calls)
+                    self.conn.execute("DELETE FROM hourly_rollups WHERE hour >= ? AND hour < ?",
+                                      (run_start, run_end))
+                    self.conn.executemany(
+                        f"INSERT INTO hourly_rollups ({', '.join(ROLLUP_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(ROLLUP_COLUMNS))})",
+                        rolled[ROLLUP_COLUMNS].itertuples(index=False, name=None))
+                self.conn.execute(
+                    "INSERT INTO rollup_state (key, value) VALUES ('updated_at', ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                    (str(max(watermark, min(newest, now - WATERMARK_LAG_S))),))
+        return {"hours_updated": len(hours), "calls_scanned": scanned,
+                "seconds": round(time.perf_counter() - start, 3)}
+
+    def hourly(self, date_from: float = None, date_to: float = None) -> pd.DataFrame:
+        """Rollup rows indexed by UTC hour, optionally bounded by unix times."""
+        with self._lock:
+            frame = pd.read_sql_query(
+                "SELECT * FROM hourly_rollups WHERE hour >= ? AND hour < ? ORDER BY hour",
+                self.conn, params=(date_from if date_from is not None else -np.inf,
+                                   date_to if date_to is not None else np.inf))
+        frame.index = pd.to_datetime(frame.pop("hour"), unit="s", utc=True)
+        return frame
+
+    @staticmethod
+    def daily(hourly: pd.DataFrame) -> pd.DataFrame:
+        return hourly.resample("1D").sum()
+
+    @staticmethod
+    def summary(hourly: pd.DataFrame) -> dict:
+        """Headline numbers, failure breakdown and duration distribution."""
+        totals = hourly.sum()
+        finished = totals.get("completed", 0) + sum(
+            totals.get(STATUS_COLUMNS[s], 0) for s in FAILURE_STATUSES)
+        answered = int(totals.get("answered", 0))
+        return {
+            "calls": int(totals.get("calls", 0)),
+            "in_flight": int(totals.get("in_flight", 0)),
+            "answer_rate": float(answered / finished) if finished else None,
+            "avg_duration_s": float(totals.get("total_duration", 0) / answered) if answered else None,
+            "failures": pd.Series({s: int(totals.get(STATUS_COLUMNS[s], 0)) for s in FAILURE_STATUSES}),
+            "durations": pd.Series(
+                [int(totals.get(c, 0)) for c in DURATION_COLUMNS], index=DURATION_LABELS),
+        }
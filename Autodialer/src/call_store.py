@@ -0,0 +1,264 @@
+from dotenv import load_dotenv
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from .telemetry import TELEMETRY
+
+load_dotenv()
+
+CALL_STORE_PATH = os.getenv("CALL_STORE_PATH", "data/call_logs.sqlite3")
+# Calls in these states never change again, so they are not re-fetched
+TERMINAL_STATUSES = ("completed", "busy", "failed", "no-answer", "canceled")
+# On incremental syncs, re-read this much history before the cursor to catch late status changes
+SYNC_OVERLAP_S = 3600
+# After a failed sync, wait this long before syncing on our own again (doubling, up to the max)
+SYNC_RETRY_S = 30
+SYNC_RETRY_MAX_S = 900
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    sid          TEXT PRIMARY KEY,
+    to_number    TEXT,
+    from_number  TEXT,
+    status       TEXT,
+    direction    TEXT,
+    date_created REAL,                   -- unix time, UTC
+    start_time   REAL,
+    end_time     REAL,
+    duration     INTEGER,                -- seconds
+    updated_at   REAL NOT NULL           -- unix time this row last changed locally
+);
+CREATE INDEX IF NOT EXISTS idx_calls_created ON calls(date_created);
+CREATE INDEX IF NOT EXISTS idx_calls_status ON calls(status, date_created);
+CREATE INDEX IF NOT EXISTS idx_calls_to ON calls(to_number, date_created);
+CREATE INDEX IF NOT EXISTS idx_calls_updated ON calls(updated_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+UPSERT = """
+INSERT INTO calls (sid, to_number, from_number, status, direction, date_created,
+                   start_time, end_time, duration, updated_at)
+VALUES (:sid, :to_number, :from_number, :status, :direction, :date_created,
+        :start_time, :end_time, :duration, :updated_at)
+ON CONFLICT(sid) DO UPDATE SET
+    status = excluded.status, start_time = excluded.start_time,
+    end_time = excluded.end_time, duration = excluded.duration,
+    updated_at = excluded.updated_at
+WHERE calls.status IS NOT excluded.status OR calls.end_time IS NOT excluded.end_time
+   OR calls.duration IS NOT excluded.duration
+"""
+
+# Order of a call's states, so late or duplicate status events never move a call backwards
+STATUS_RANK_SQL = """CASE {} WHEN 'queued' THEN 0 WHEN 'initiated' THEN 1 WHEN 'ringing' THEN 2
+    WHEN 'in-progress' THEN 3 ELSE 4 END"""
+
+APPLY_EVENT = f"""
+INSERT INTO calls (sid, to_number, from_number, status, direction, date_created,
+                   start_time, end_time, duration, updated_at)
+VALUES (:sid, :to_number, :from_number, :status, :direction, :timestamp,
+        :start_time, :end_time, :duration, :updated_at)
+ON CONFLICT(sid) DO UPDATE SET
+    status = excluded.status,
+    start_time = COALESCE(calls.start_time, excluded.start_time),
+    end_time = COALESCE(excluded.end_time, calls.end_time),
+    duration = COALESCE(excluded.duration, calls.duration),
+    updated_at = excluded.updated_at
+WHERE {STATUS_RANK_SQL.format('excluded.status')} > {STATUS_RANK_SQL.format('calls.status')}
+"""
+
+
+def _timestamp(value):
+    return value.timestamp() if isinstance(value, datetime) else value
+
+
+def call_row(record) -> dict:
+    """Flatten a Twilio CallInstance into a ``calls`` row."""
+    return {
+        "sid": record.sid,
+        "to_number": record.to,
+        "from_number": record._from,
+        "status": record.status,
+        "direction": record.direction,
+        "date_created": _timestamp(record.date_created),
+        "start_time": _timestamp(record.start_time),
+        "end_time": _timestamp(record.end_time),
+        "duration": int(record.duration) if record.duration else None,
+        "updated_at": time.time(),
+    }
+
+
+class CallStore:
+    """Local SQLite copy of the account's call log.
+
+    ``sync`` pages through the full history once, then only reads calls
+    newer than the last sync (plus an overlap) and re-fetches calls that
+    were still in progress. The Call Logs page reads from here only.
+    """
+
+    def __init__(self, path: str = CALL_STORE_PATH):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA case_sensitive_like=ON")  # lets number prefix search use the index
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def _get_state(self, key: str):
+        row = self.conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value):
+        self.conn.execute(
+            "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value", (key, str(value)))
+
+    def upsert(self, rows: list) -> int:
+        """Insert or update calls; returns how many rows actually changed."""
+        with self._lock, self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(UPSERT, rows)
+            return self.conn.total_changes - before
+
+    def apply_events(self, events: list) -> int:
+        """Apply status-callback events (see ``callbacks.event_row``) in one transaction.
+
+        Returns how many calls changed; events older than the stored state are ignored.
+        """
+        with self._lock, self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(APPLY_EVENT, events)
+            return self.conn.total_changes - before
+
+    @TELEMETRY.timed("call_store.sync")
+    def sync(self, client=None, page_size: int = 1000, batch_size: int = 500) -> dict:
+        """Pull new and changed calls from Twilio.
+
+        A failure is recorded (see ``auto_sync_due``) before it is re-raised.
+        """
+        try:
+            return self._sync(client, page_size, batch_size)
+        except Exception:
+            with self._lock, self.conn:
+                failures = int(self._get_state("failed_syncs") or 0) + 1
+                self._set_state("failed_syncs", failures)
+                self._set_state("last_failed_sync", time.time())
+            raise
+
+    def _sync(self, client, page_size: int, batch_size: int) -> dict:
+        if client is None:
+            from .tools import get_twilio_client
+            client = get_twilio_client()
+        with self._lock:
+            cursor = self._get_state("cursor")
+        stop_before = float(cursor) - SYNC_OVERLAP_S if cursor else None
+        start = time.perf_counter()
+        seen = changed = 0
+        newest = float(cursor) if cursor else 0.0
+        batch = []
+        # The API lists calls newest first
+        for record in client.calls.stream(page_size=page_size):
+            row = call_row(record)
+            if stop_before is not None and row["date_created"] and row["date_created"] < stop_before:
+                break
+            newest = max(newest, row["date_created"] or 0.0)
+            batch.append(row)
+            seen += 1
+            if len(batch) >= batch_size:
+                changed += self.upsert(batch)
+                batch = []
+        changed += self.upsert(batch)
+
+        # Calls older than the overlap that were still in flight last time
+        with self._lock:
+            stale = [r[0] for r in self.conn.execute(
+                f"SELECT sid FROM calls WHERE status NOT IN ({','.join('?' * len(TERMINAL_STATUSES))})"
+                " AND date_created < ?", (*TERMINAL_STATUSES, stop_before or 0.0))]
+        if stale:
+            changed += self.upsert([call_row(client.calls(sid).fetch()) for sid in stale])
+
+        with self._lock, self.conn:
+            self._set_state("cursor", newest)
+            self._set_state("last_sync", time.time())
+            self._set_state("failed_syncs", 0)
+        return {"fetched": seen, "refetched": len(stale), "changed": changed,
+                "seconds": round(time.perf_counter() - start, 2)}
+
+    def last_sync(self):
+        """Unix time of the last completed sync, or None."""
+        with self._lock:
+            value = self._get_state("last_sync")
+        return float(value) if value else None
+
+    def auto_sync_due(self) -> bool:
+        """True if the store was never synced and no recent failed attempt is backing off.
+
+        Pages call this on every rerun, so a failing first sync is retried
+        after ``SYNC_RETRY_S``, doubling up to ``SYNC_RETRY_MAX_S``, rather
+        than on every widget interaction.
+        """
+        with self._lock:
+            last_sync = self._get_state("last_sync")
+            failures = int(self._get_state("failed_syncs") or 0)
+            last_failed = self._get_state("last_failed_sync")
+        if last_sync:
+            return False
+        if not failures or not last_failed:
+            return True
+        backoff = min(SYNC_RETRY_MAX_S, SYNC_RETRY_S * 2 ** (failures - 1))
+        return time.time() - float(last_failed) >= backoff
+
+    def statuses(self) -> list:
+        with self._lock:
+            return [r[0] for r in self.conn.execute(
+                "SELECT DISTINCT status FROM calls WHERE status IS NOT NULL ORDER BY status")]
+
+    @staticmethod
+    def _where(status=None, number: str = None, date_from: float = None, date_to: float = None):
+        where, params = [], []
+        if status:
+            statuses = [status] if isinstance(status, str) else list(status)
+            where.append(f"status IN ({','.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if number:
+            escaped = number.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            where.append("to_number LIKE ? ESCAPE '\\'")
+            params.append(escaped + "%")
+        if date_from is not None:
+            where.append("date_created >= ?")
+            params.append(date_from)
+        if date_to is not None:
+            where.append("date_created < ?")
+            params.append(date_to)
+        return (f"WHERE {' AND '.join(where)}" if where else ""), params
+
+    def count(self, status=None, number: str = None, date_from: float = None,
+              date_to: float = None) -> int:
+        clause, params = self._where(status, number, date_from, date_to)
+        with self._lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM calls {clause}", params).fetchone()[0]
+
+    def query(self, status=None, number: str = None, date_from: float = None,
+              date_to: float = None, limit: int = 50, offset: int = 0) -> list:
+        """Filtered page of calls, newest first.
+
+        ``status`` is one status or a list of them, ``number`` a prefix of the
+        destination number and ``date_from``/``date_to`` unix times bounding
+        ``date_created``.
+        """
+        clause, params = self._where(status, number, date_from, date_to)
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT * FROM calls {clause} ORDER BY date_created DESC LIMIT ? OFFSET ?",
+                (*params, limit, offset)).fetchall()
+        return [dict(r) for r in rows]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,192 @@
+"""Receive Twilio call status callbacks and write them to the call store.
+
+Usage (from Autodialer/):
+    python -m src.callbacks --port 8088
+    STATUS_CALLBACK_URL=https://<public-host>/twilio/status streamlit run streamlit_app.py
+
+Twilio must be able to reach the receiver, e.g. through a tunnel such as
+ngrok. To try it locally, post a sample event:
+    curl -X POST localhost:8088/twilio/status -d CallSid=CA123 -d CallStatus=ringing -d To=+12025550123
+"""
+import argparse
+import os
+import queue
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from dotenv import load_dotenv
+
+from .call_store import TERMINAL_STATUSES, CallStore
+from .telemetry import TELEMETRY, start_telemetry
+
+load_dotenv()
+
+STATUS_CALLBACK_PATH = "/twilio/status"
+STATUS_CALLBACK_URL = os.getenv("STATUS_CALLBACK_URL")
+TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
+
+
+def _parse_timestamp(value: str):
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return time.time()
+
+
+def event_row(form: dict) -> dict:
+    """Map a status-callback form (field -> value) to ``CallStore.apply_events`` parameters."""
+    status = form.get("CallStatus")
+    timestamp = _parse_timestamp(form.get("Timestamp"))
+    duration = form.get("CallDuration")
+    return {
+        "sid": form["CallSid"],
+        "to_number": form.get("To"),
+        "from_number": form.get("From"),
+        "status": status,
+        "direction": form.get("Direction"),
+        "timestamp": timestamp,
+        "start_time": timestamp if status == "in-progress" else None,
+        "end_time": timestamp if status in TERMINAL_STATUSES else None,
+        "duration": int(duration) if duration else None,
+        "updated_at": time.time(),
+    }
+
+
+class EventWriter:
+    """Collect events on a queue and write them to the store in batches.
+
+    A batch is written when ``batch_size`` events are waiting or
+    ``flush_interval_s`` has passed since the first one, so a burst of
+    callbacks during a campaign becomes a few transactions instead of one
+    per event.
+    """
+
+    def __init__(self, store: CallStore, batch_size: int = 200, flush_interval_s: float = 0.25):
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.received = 0
+        self.written = 0
+        self.batches = 0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, event: dict):
+        with self._lock:
+            self.received += 1
+        self._queue.put(event)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval_s
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                with TELEMETRY.span("callbacks.write_batch"):
+                    self.store.apply_events(batch)
+                self.written += len(batch)
+                self.batches += 1
+            except Exception as e:
+                print(f"[callbacks] failed to write {len(batch)} events: {e}")
+
+    def stats(self) -> dict:
+        return {"received": self.received, "written": self.written, "batches": self.batches,
+                "pending": self._queue.qsize()}
+
+
+class StatusCallbackHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, status: int):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        if urlparse(self.path).path != STATUS_CALLBACK_PATH:
+            self._reply(404)
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8")
+        # Twilio signs blank fields too (ForwardedFrom, CallerName, ...), so keep them
+        form = {k: v[0] for k, v in parse_qs(body, keep_blank_values=True).items()}
+        validator = self.server.validator
+        if validator is not None and not validator.validate(
+                self.server.public_url, form, self.headers.get("X-Twilio-Signature", "")):
+            self._reply(403)
+            return
+        if "CallSid" not in form or "CallStatus" not in form:
+            self._reply(400)
+            return
+        TELEMETRY.count("status_callbacks", status=form["CallStatus"])
+        self.server.writer.put(event_row(form))
+        self._reply(204)
+
+    def do_GET(self):
+        # Health check for tunnels and load balancers
+        self._reply(200 if urlparse(self.path).path == "/health" else 404)
+
+    def log_message(self, *args):
+        pass
+
+
+class CallbackServer(ThreadingHTTPServer):
+    """Threaded server with a deep listen backlog; campaigns produce bursts of callbacks."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def start_callback_server(store: CallStore = None, host: str = "127.0.0.1", port: int = 8088,
+                          validate: bool = False) -> CallbackServer:
+    """Serve the receiver on a background thread; its ``writer`` holds the ingest stats.
+
+    With ``validate`` each request's X-Twilio-Signature is checked against
+    ``STATUS_CALLBACK_URL`` and ``TWILIO_AUTH_TOKEN``.
+    """
+    server = CallbackServer((host, port), StatusCallbackHandler)
+    server.writer = EventWriter(store or CallStore())
+    server.validator = None
+    server.public_url = STATUS_CALLBACK_URL
+    if validate:
+        from twilio.request_validator import RequestValidator
+        if not (STATUS_CALLBACK_URL and TWILIO_AUTH_TOKEN):
+            raise ValueError("Signature validation needs STATUS_CALLBACK_URL and TWILIO_AUTH_TOKEN")
+        server.validator = RequestValidator(TWILIO_AUTH_TOKEN)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--validate", action="store_true",
+                        help="Reject requests without a valid X-Twilio-Signature")
+    args = parser.parse_args()
+    start_telemetry()
+
+    server = start_callback_server(host=args.host, port=args.port, validate=args.validate)
+    print(f"Status callbacks on http://{args.host}:{server.server_address[1]}{STATUS_CALLBACK_PATH}")
+    try:
+        while True:
+            time.sleep(60)
+            print(f"[callbacks] {server.writer.stats()}")
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
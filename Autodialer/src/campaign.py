@@ -0,0 +1,232 @@
+"""Dial a list of contacts with a templated message.
+
+Usage (from Autodialer/):
+    python -m src.campaign contacts.csv --template "Hi {name}, your appointment is at {time}." \
+        --concurrency 8 --cps 1 --out campaign_results.csv
+
+Contacts are a CSV with a header row or a JSONL file; each contact needs a
+``mobile_no`` field in E.164 format, other fields can be used in the template.
+
+Each result is appended to the results file as soon as the call is placed.
+Numbers a previous run of the same results file already dialed are skipped,
+so an interrupted campaign is resumed by running the same command again.
+"""
+import argparse
+import csv
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List
+
+from .telemetry import start_telemetry
+from .tools import is_e164, place_call
+
+RESULT_FIELDS = ["row", "mobile_no", "sid", "status", "error", "latency_s"]
+# What a broken template raises: missing field, positional field, bad format spec or attribute
+TEMPLATE_ERRORS = (KeyError, IndexError, ValueError, AttributeError)
+
+
+class CallRateLimiter:
+    """Space call starts at least ``1 / calls_per_second`` apart, across threads."""
+
+    def __init__(self, calls_per_second: float):
+        self.interval = 1 / calls_per_second if calls_per_second > 0 else 0.0
+        self.next_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self.next_at)
+            self.next_at = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def load_contacts(path: str) -> List[dict]:
+    """Read contacts from a .csv or .jsonl file."""
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            contacts = [json.loads(line) for line in f if line.strip()]
+        else:
+            contacts = list(csv.DictReader(f))
+    for contact in contacts:
+        contact["mobile_no"] = str(contact.get("mobile_no", "")).strip()
+    return contacts
+
+
+def render_message(template: str, contact: dict) -> str:
+    """Fill ``{field}`` placeholders from the contact; raises one of ``TEMPLATE_ERRORS`` if it cannot."""
+    return template.format_map(contact)
+
+
+class Campaign:
+    """Dial every contact through a bounded thread pool.
+
+    All threads share one Twilio client (see ``tools.get_twilio_client``)
+    and one rate limiter, so ``calls_per_second`` holds for the whole
+    campaign regardless of ``max_concurrency``.
+    """
+
+    def __init__(self, contacts: List[dict], template: str, max_concurrency: int = 8,
+                 calls_per_second: float = 1.0, dial: Callable[[str, str], str] = place_call):
+        self.contacts = contacts
+        self.template = template
+        self.max_concurrency = max_concurrency
+        self.limiter = CallRateLimiter(calls_per_second)
+        self.dial = dial
+        self.results = [None] * len(contacts)
+        self.resumed = 0
+
+    def _dial_one(self, i: int, contact: dict) -> dict:
+        result = {"row": i, "mobile_no": contact["mobile_no"], "sid": None,
+                  "status": "failed", "error": None, "latency_s": None}
+        if not is_e164(contact["mobile_no"]):
+            result.update(status="skipped", error="Number is not in E.164 format")
+            return result
+        try:
+            message = render_message(self.template, contact)
+        except TEMPLATE_ERRORS as e:
+            result["error"] = f"Template cannot be filled for contact: {type(e).__name__}: {e}"
+            return result
+
+        self.limiter.wait()
+        start = time.perf_counter()
+        try:
+            result.update(sid=self.dial(contact["mobile_no"], message), status="initiated")
+        except Exception as e:
+            result["error"] = str(e)
+        result["latency_s"] = round(time.perf_counter() - start, 3)
+        return result
+
+    def run(self, on_result: Callable[[dict], None] = None, out_path: str = None) -> List[dict]:
+        """Dial all contacts; results come back in contact order.
+
+        With ``out_path`` each result is appended there as it completes, and
+        numbers already dialed by an earlier run of that file are skipped
+        (their entry in the returned list is None).
+        """
+        done = dialed_numbers(out_path) if out_path else set()
+        log = ResultLog(out_path) if out_path else None
+
+        def task(i, contact):
+            result = self._dial_one(i, contact)
+            self.results[i] = result
+            if log:
+                log.write(result)
+            if on_result:
+                on_result(result)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                futures = []
+                for i, contact in enumerate(self.contacts):
+                    if contact["mobile_no"] in done:
+                        self.resumed += 1
+                        continue
+                    futures.append(pool.submit(task, i, contact))
+                for future in futures:
+                    future.result()
+        finally:
+            if log:
+                log.close()
+        return self.results
+
+    def summary(self) -> dict:
+        done = [r for r in self.results if r]
+        latencies = sorted(r["latency_s"] for r in done if r["latency_s"] is not None)
+        return {
+            "contacts": len(self.contacts),
+            "initiated": sum(r["status"] == "initiated" for r in done),
+            "failed": sum(r["status"] == "failed" for r in done),
+            "skipped": sum(r["status"] == "skipped" for r in done),
+            "resumed": self.resumed,
+            "p50_latency_s": latencies[len(latencies) // 2] if latencies else None,
+        }
+
+
+def _is_jsonl(path: Path) -> bool:
+    return path.suffix.lower() in (".jsonl", ".ndjson")
+
+
+def read_results(path: str) -> List[dict]:
+    """Results written so far to a .csv or .jsonl results file."""
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path, newline="", encoding="utf-8") as f:
+        if not _is_jsonl(path):
+            return list(csv.DictReader(f))
+        results = []
+        for line in f:
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # a line cut short when a previous run was killed
+        return results
+
+
+def dialed_numbers(path: str) -> set:
+    """Numbers an earlier run already dialed, whether or not Twilio accepted the call.
+
+    Contacts that were never dialed (bad number or template) are tried again.
+    """
+    return {r["mobile_no"] for r in read_results(path) if r.get("latency_s") not in (None, "")}
+
+
+class ResultLog:
+    """Append campaign results to a .csv or .jsonl file, one flushed line per call."""
+
+    def __init__(self, path: str):
+        path = Path(path)
+        self.jsonl = _is_jsonl(path)
+        new = not path.exists() or path.stat().st_size == 0
+        self.file = open(path, "a", newline="", encoding="utf-8")
+        self.writer = None
+        if not self.jsonl:
+            self.writer = csv.DictWriter(self.file, fieldnames=RESULT_FIELDS)
+            if new:
+                self.writer.writeheader()
+        self._lock = threading.Lock()
+
+    def write(self, result: dict):
+        with self._lock:
+            if self.jsonl:
+                self.file.write(json.dumps(result) + "\n")
+            else:
+                self.writer.writerow(result)
+            self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("contacts", help="Contacts file (.csv or .jsonl)")
+    parser.add_argument("--template", required=True, help="Message with {field} placeholders")
+    parser.add_argument("--concurrency", type=int, default=8, help="Calls in flight at once")
+    parser.add_argument("--cps", type=float, default=1.0, help="Max call starts per second")
+    parser.add_argument("--out", default="campaign_results.csv", help="Results file (.csv or .jsonl)")
+    args = parser.parse_args()
+    start_telemetry()
+
+    contacts = load_contacts(args.contacts)
+    campaign = Campaign(contacts, args.template, max_concurrency=args.concurrency,
+                        calls_per_second=args.cps)
+    start = time.perf_counter()
+
+    def report(r):
+        print(f"[{r['row']}] {r['mobile_no']}: {r['status']} {r['sid'] or r['error']}")
+
+    campaign.run(on_result=report, out_path=args.out)
+    print(f"Dialed {len(contacts) - campaign.resumed} contacts in {time.perf_counter() - start:.1f}s: "
+          f"{campaign.summary()}")
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Local stand-in for the Twilio Calls API, for testing without real calls.
+
+Usage (from Autodialer/):
+    python -m src.fake_twilio --port 8099 --latency-ms 150 --error-rate 0.05
+    TWILIO_API_BASE_URL=http://127.0.0.1:8099 python -m src.campaign contacts.csv ...
+
+Calls created with a StatusCallback get status events posted to it, like
+the real API.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import urllib.request
+import uuid
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+CALLS_PATH = re.compile(r"^/2010-04-01/Accounts/(?P<account>[^/]+)/Calls(?:/(?P<sid>[^/.]+))?\.json$")
+
+
+class FakeCallStore:
+    """In-memory calls whose status moves queued -> ringing -> in-progress -> completed."""
+
+    def __init__(self, ring_s: float = 1.0, talk_s: float = 5.0):
+        self.ring_s = ring_s
+        self.talk_s = talk_s
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def create(self, account: str, to: str, from_: str, status_callback: str = None,
+               events: list = None) -> dict:
+        call = {"sid": "CA" + uuid.uuid4().hex, "account_sid": account, "to": to,
+                "from": from_, "created": time.time()}
+        with self._lock:
+            self.calls[call["sid"]] = call
+        if status_callback:
+            self.schedule_callbacks(call, status_callback, events or ["completed"])
+        return self.render(call)
+
+    def schedule_callbacks(self, call: dict, url: str, events: list):
+        """POST Twilio-style status events to ``url`` as the call progresses."""
+        timeline = [("initiated", "initiated", 0.0), ("ringing", "ringing", self.ring_s / 2),
+                    ("answered", "in-progress", self.ring_s),
+                    ("completed", "completed", self.ring_s + self.talk_s)]
+        wanted = [step for step in timeline if step[0] in events]
+        for sequence, (_, status, delay) in enumerate(wanted):
+            form = {"CallSid": call["sid"], "AccountSid": call["account_sid"], "To": call["to"],
+                    "From": call["from"], "CallStatus": status, "Direction": "outbound-api",
+                    "SequenceNumber": str(sequence),
+                    "Timestamp": formatdate(call["created"] + delay)}
+            if status == "completed":
+                form["CallDuration"] = str(int(self.talk_s))
+            timer = threading.Timer(delay, _post_form, (url, form))
+            timer.daemon = True
+            timer.start()
+
+    def render(self, call: dict) -> dict:
+        elapsed = time.time() - call["created"]
+        start = call["created"] + self.ring_s
+        end = start + self.talk_s
+        if elapsed < self.ring_s / 2:
+            status = "queued"
+        elif elapsed < self.ring_s:
+            status = "ringing"
+        elif elapsed < self.ring_s + self.talk_s:
+            status = "in-progress"
+        else:
+            status = "completed"
+        return {
+            "sid": call["sid"],
+            "account_sid": call["account_sid"],
+            "to": call["to"],
+            "from": call["from"],
+            "status": status,
+            "date_created": formatdate(call["created"]),
+            "date_updated": formatdate(min(time.time(), end)),
+            "start_time": formatdate(start) if elapsed >= self.ring_s else None,
+            "end_time": formatdate(end) if status == "completed" else None,
+            "duration": str(int(self.talk_s)) if status == "completed" else None,
+            "direction": "outbound-api",
+            "uri": f"/2010-04-01/Accounts/{call['account_sid']}/Calls/{call['sid']}.json",
+        }
+
+    def get(self, sid: str):
+        with self._lock:
+            call = self.calls.get(sid)
+        return self.render(call) if call else None
+
+    def page(self, account: str, page: int, page_size: int) -> tuple:
+        """Newest-first slice of the calls plus whether more pages follow."""
+        with self._lock:
+            ordered = sorted(self.calls.values(), key=lambda c: c["created"], reverse=True)
+        chunk = ordered[page * page_size:(page + 1) * page_size]
+        return [self.render(c) for c in chunk], (page + 1) * page_size < len(ordered)
+
+
+def _post_form(url: str, form: dict):
+    try:
+        urllib.request.urlopen(url, data=urlencode(form).encode("utf-8"), timeout=5).close()
+    except Exception as e:
+        print(f"[fake_twilio] status callback to {url} failed: {e}")
+
+
+class FakeTwilioHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    # Send headers and body in one write; separate small writes stall on delayed ACKs
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: int, code: int, message: str):
+        self._send_json(status, {"code": code, "message": message, "status": status,
+                                 "more_info": f"https://www.twilio.com/docs/errors/{code}"})
+
+    def _simulate(self) -> bool:
+        """Apply the configured latency; False if this request should fail."""
+        server = self.server
+        if server.latency_s:
+            time.sleep(random.uniform(0.5, 1.5) * server.latency_s)
+        return random.random() >= server.error_rate
+
+    def do_POST(self):
+        match = CALLS_PATH.match(urlparse(self.path).path)
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        if not match or match["sid"]:
+            self._error(404, 20404, "The requested resource was not found")
+            return
+        if not self._simulate():
+            self._error(400, 21210, "The source phone number provided is not yet verified.")
+            return
+        to, from_ = form.get("To", [""])[0], form.get("From", [""])[0]
+        if not to.startswith("+"):
+            self._error(400, 21211, f"The 'To' number {to} is not a valid phone number.")
+            return
+        callback = form.get("StatusCallback", [None])[0]
+        self._send_json(201, self.server.store.create(
+            match["account"], to, from_, callback, form.get("StatusCallbackEvent")))
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        match = CALLS_PATH.match(url.path)
+        if not match:
+            self._error(404, 20404, "The requested resource was not found")
+            return
+        self._simulate()
+        if match["sid"]:
+            call = self.server.store.get(match["sid"])
+            if call is None:
+                self._error(404, 20404, "The requested resource was not found")
+            else:
+                self._send_json(200, call)
+            return
+        query = parse_qs(url.query)
+        page = int(query.get("Page", ["0"])[0])
+        page_size = int(query.get("PageSize", ["50"])[0])
+        calls, more = self.server.store.page(match["account"], page, page_size)
+        next_uri = f"{url.path}?PageSize={page_size}&Page={page + 1}" if more else None
+        self._send_json(200, {"calls": calls, "page": page, "page_size": page_size,
+                              "start": page * page_size, "end": page * page_size + len(calls),
+                              "uri": self.path, "first_page_uri": f"{url.path}?PageSize={page_size}&Page=0",
+                              "next_page_uri": next_uri, "previous_page_uri": None})
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeTwilioServer(ThreadingHTTPServer):
+    """Threaded server with room in the accept queue for load tests."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def start_fake_twilio(port: int = 0, latency_ms: float = 0.0, error_rate: float = 0.0,
+                      ring_s: float = 1.0, talk_s: float = 5.0) -> FakeTwilioServer:
+    """Serve the fake API on a background thread; ``server_address[1]`` is the port."""
+    server = FakeTwilioServer(("127.0.0.1", port), FakeTwilioHandler)
+    server.latency_s = latency_ms / 1000
+    server.error_rate = error_rate
+    server.store = FakeCallStore(ring_s=ring_s, talk_s=talk_s)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency-ms", type=float, default=150.0,
+                        help="Mean response latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of call requests rejected with a Twilio error")
+    parser.add_argument("--talk-s", type=float, default=5.0, help="Simulated call length")
+    args = parser.parse_args()
+
+    server = start_fake_twilio(args.port, args.latency_ms, args.error_rate, talk_s=args.talk_s)
+    print(f"Fake Twilio API on http://127.0.0.1:{server.server_address[1]} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
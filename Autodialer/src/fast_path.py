@@ -0,0 +1,47 @@
+import re
+from typing import NamedTuple, Optional
+
+from .tools import is_e164
+
+# "Make a call to +91... with the message: '...'", "Call +1... and say '...'", ...
+REQUEST_PATTERN = re.compile(
+    r"^\s*(?:please\s+)?(?:(?:make|place)\s+a\s+call\s+to|call|dial|ring)\s+"
+    r"(?P<number>\+?[\d\s().-]{7,24}?)\s*,?\s*"
+    r"(?:and\s+)?(?:with\s+(?:the\s+)?message|say(?:ing)?|tell\s+(?:them|him|her)|"
+    r"the\s+message\s+is|message)\s*:?\s*"
+    r"(?P<open>[\"'“‘])(?P<message>.+)(?P<close>[\"'”’])\s*[.!]?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+QUOTE_PAIRS = {'"': '"', "'": "'", "“": "”", "‘": "’"}
+# A second number inside the "message" means two instructions ran together
+EMBEDDED_NUMBER = re.compile(r"\+\d[\d\s().-]{6,}")
+
+
+class CallRequest(NamedTuple):
+    mobile_no: str
+    message: str
+
+
+def normalize_number(raw: str) -> str:
+    """Drop the spaces, dashes, dots and brackets people type inside numbers."""
+    return re.sub(r"[\s().-]", "", raw or "")
+
+
+def parse_call_request(text: str) -> Optional[CallRequest]:
+    """Parse a well-formed call instruction without the LLM.
+
+    Returns None when the input is anything but one clear instruction with an
+    E.164 number and a quoted message, so the caller can hand it to the agent.
+    """
+    match = REQUEST_PATTERN.match(text or "")
+    if not match or QUOTE_PAIRS[match["open"]] != match["close"]:
+        return None
+    message = match["message"].strip()
+    # The message runs to the last quote, so a quote inside it means more than
+    # one quoted part (or text after the message): leave that to the agent
+    if match["open"] in message or match["close"] in message:
+        return None
+    mobile_no = normalize_number(match["number"])
+    if not is_e164(mobile_no) or not message or EMBEDDED_NUMBER.search(message):
+        return None
+    return CallRequest(mobile_no, message)
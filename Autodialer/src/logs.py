@@ -1,20 +1,18 @@
 from dotenv import load_dotenv
-from twilio.rest import Client
-import os
+from .telemetry import TELEMETRY
+from .tools import get_twilio_client
 
 load_dotenv()
 
-TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
-TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
-
 
 def fetch_call_logs():
     """Fetch call logs from Twilio account.
     Returns:
         list: A list of call log dictionaries.
     """
-    client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
-    calls = client.calls.list(limit=50)  # Fetch last 50 call logs
+    client = get_twilio_client()
+    with TELEMETRY.span("twilio.calls.list"):
+        calls = client.calls.list(limit=50)  # Fetch last 50 call logs
     call_logs = []
     for record in calls:
         call_logs.append({
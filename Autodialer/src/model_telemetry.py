@@ -0,0 +1,40 @@
+import time
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from .telemetry import TELEMETRY
+
+
+class ModelTelemetry(BaseCallbackHandler):
+    """Times each chat-model turn of the agent and records its Gemini token usage."""
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self._started = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._started[run_id] = time.perf_counter()
+
+    def _finish(self, run_id, error=None):
+        start = self._started.pop(run_id, None)
+        if start is not None:
+            TELEMETRY.observe("gemini.chat", time.perf_counter() - start, error=error, model=self.model_name)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        self._finish(run_id)
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if not usage:
+                    continue
+                # LangChain counts thinking as part of output_tokens
+                thinking = (usage.get("output_token_details") or {}).get("reasoning", 0)
+                TELEMETRY.record_tokens(
+                    self.model_name,
+                    input_tokens=usage.get("input_tokens", 0),
+                    output_tokens=usage.get("output_tokens", 0) - thinking,
+                    thinking_tokens=thinking,
+                    cached_tokens=(usage.get("input_token_details") or {}).get("cache_read", 0))
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._finish(run_id, error=type(error).__name__)
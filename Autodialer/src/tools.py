@@ -1,17 +1,102 @@
-from langchain.tools import tool
 from dotenv import load_dotenv
 import os
-from twilio.rest import Client
+import re
+import threading
+from typing import TYPE_CHECKING
+from xml.sax.saxutils import escape
+from .telemetry import TELEMETRY
+
+if TYPE_CHECKING:
+    from twilio.rest import Client
 
 load_dotenv()
 
 TWILIO_NUMBER = os.getenv("TWILIO_NUMBER")
 TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
 TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
+# Point the client at another API host, e.g. the local fake server in src/fake_twilio.py
+TWILIO_API_BASE_URL = os.getenv("TWILIO_API_BASE_URL")
+TWILIO_POOL_SIZE = int(os.getenv("TWILIO_POOL_SIZE", "16"))
+TWILIO_TIMEOUT = float(os.getenv("TWILIO_TIMEOUT", "15"))
+# Public URL of the status-callback receiver (src/callbacks.py); unset disables callbacks
+STATUS_CALLBACK_URL = os.getenv("STATUS_CALLBACK_URL")
+STATUS_CALLBACK_EVENTS = ["initiated", "ringing", "answered", "completed"]
+
+E164_PATTERN = re.compile(r"^\+[1-9]\d{7,14}$")
+
+_client = None
+_client_lock = threading.Lock()
+_make_call_tool = None
+_tool_lock = threading.Lock()
+
+
+def is_e164(mobile_no: str) -> bool:
+    """True if the number is in E.164 format, e.g. +12025550123."""
+    return bool(E164_PATTERN.match(mobile_no or ""))
+
+
+def get_twilio_client() -> "Client":
+    """Return the process-wide Twilio client.
+
+    All calls share one requests session, so the TCP/TLS connection to the
+    API is reused instead of being set up again for every call. The twilio
+    package is imported here, on first use, rather than with this module.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            from requests.adapters import HTTPAdapter
+            from twilio.http.http_client import TwilioHttpClient
+            from twilio.rest import Client
+            http_client = TwilioHttpClient(pool_connections=True, timeout=TWILIO_TIMEOUT)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=TWILIO_POOL_SIZE)
+            http_client.session.mount("https://", adapter)
+            http_client.session.mount("http://", adapter)
+            _client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, http_client=http_client)
+            if TWILIO_API_BASE_URL:
+                _client.api.base_url = TWILIO_API_BASE_URL
+    return _client
+
+
+def reset_twilio_client():
+    """Drop the shared client, e.g. after changing credentials; the next call builds a new one."""
+    global _client
+    with _client_lock:
+        _client = None
+
+
+def build_twiml(message: str) -> str:
+    """TwiML that speaks the message; the text is XML-escaped."""
+    return f"<Response><Say>{escape(message)}</Say></Response>"
+
 
+def place_call(mobile_no: str, message: str, status_callback: str = None) -> str:
+    """Start a call through the shared client and return its SID.
 
-@tool
-def make_call(mobile_no: str, message: str):
+    Twilio posts status events for the call to ``status_callback``
+    (default: ``STATUS_CALLBACK_URL``) if one is set.
+    Raises:
+        TwilioRestException: If Twilio rejects the call.
+    """
+    status_callback = status_callback or STATUS_CALLBACK_URL
+    callback_args = {}
+    if status_callback:
+        callback_args = {
+            "status_callback": status_callback,
+            "status_callback_event": STATUS_CALLBACK_EVENTS,
+            "status_callback_method": "POST",
+        }
+    with TELEMETRY.span("twilio.calls.create"):
+        call = get_twilio_client().calls.create(
+            twiml=build_twiml(message),
+            to=mobile_no,
+            from_=TWILIO_NUMBER,
+            **callback_args,
+        )
+    return call.sid
+
+
+def _make_call(mobile_no: str, message: str):
     """Make a call to the given mobile number with the specified message.
     Args:
         mobile_no (str): The mobile number to call (in E.164 format, e.g., +1234567890).
@@ -19,13 +104,21 @@ def make_call(mobile_no: str, message: str):
     Returns:
         str: The status of the call initiation.
     """
-    client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
     try:
-        call = client.calls.create(
-            twiml=f"<Response><Say>{message}</Say></Response>",
-            to=mobile_no,
-            from_=TWILIO_NUMBER,
-        )
-        return f"Call initiated with SID: {call.sid}"
+        return f"Call initiated with SID: {place_call(mobile_no, message)}"
     except Exception as e:
         return f"Failed to make call with error as: {str(e)}"
+
+
+def get_make_call_tool():
+    """Return the "make_call" LangChain tool, built once on first use.
+
+    Importing langchain takes about a second, and the fast path and call
+    logs never need it, so it is not imported with this module.
+    """
+    global _make_call_tool
+    with _tool_lock:
+        if _make_call_tool is None:
+            from langchain_core.tools import tool
+            _make_call_tool = tool("make_call")(_make_call)
+    return _make_call_tool
@@ -1,7 +1,14 @@
 import streamlit as st
+from dotenv import load_dotenv
+from src.telemetry import diagnostics_panel, start_telemetry
+
+load_dotenv()
+start_telemetry()
 
 home_page = st.Page("Home.py", title="Home")
 call_logs_page = st.Page("call_logs.py", title="Call Logs")
 
 pg = st.navigation([home_page, call_logs_page])
 pg.run()
+
+diagnostics_panel()
@@ -0,0 +1,72 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.call_store import CallStore, call_row
+from src.callbacks import event_row
+
+
+def event(status, timestamp="Tue, 01 Jul 2025 10:00:00 +0000", **form):
+    return event_row({"CallSid": "CA1", "CallStatus": status, "To": "+12025550123", "From": "+15005550006",
+                      "Direction": "outbound-api", "Timestamp": timestamp, **form})
+
+
+def test_status_events_only_move_calls_forward(tmp_path):
+    store = CallStore(str(tmp_path / "calls.sqlite3"))
+    assert store.apply_events([event("initiated"), event("ringing")]) == 2
+    assert store.apply_events([event("in-progress", "Tue, 01 Jul 2025 10:00:05 +0000")]) == 1
+    assert store.apply_events([event("completed", "Tue, 01 Jul 2025 10:01:05 +0000", CallDuration="60")]) == 1
+
+    # Late and duplicate events arrive after the call finished
+    assert store.apply_events([event("ringing"), event("in-progress"), event("completed")]) == 0
+    [call] = store.query()
+    assert call["status"] == "completed"
+    assert call["duration"] == 60
+    assert call["end_time"] - call["start_time"] == 60
+
+
+def test_out_of_order_batch_keeps_the_furthest_status(tmp_path):
+    store = CallStore(str(tmp_path / "calls.sqlite3"))
+    store.apply_events([event("busy"), event("ringing"), event("initiated")])
+    assert [c["status"] for c in store.query()] == ["busy"]
+
+
+def test_sync_upserts_only_changed_calls(tmp_path):
+    store = CallStore(str(tmp_path / "calls.sqlite3"))
+    record = SimpleNamespace(sid="CA1", to="+12025550123", _from="+15005550006", status="completed",
+                             direction="outbound-api", date_created=1_750_000_000.0,
+                             start_time=1_750_000_001.0, end_time=1_750_000_061.0, duration="60")
+    assert store.upsert([call_row(record)]) == 1
+    assert store.upsert([call_row(record)]) == 0
+    assert store.count(status="completed", number="+1202") == 1
+    assert store.count(number="+44") == 0
+
+
+def test_failed_first_sync_backs_off(tmp_path, monkeypatch):
+    def broken_stream(page_size):
+        raise ConnectionError("Twilio unreachable")
+
+    broken = SimpleNamespace(calls=SimpleNamespace(stream=broken_stream))
+    working = SimpleNamespace(calls=SimpleNamespace(stream=lambda page_size: iter([])))
+    store = CallStore(str(tmp_path / "calls.sqlite3"))
+    now = [1_750_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+
+    assert store.auto_sync_due()
+    with pytest.raises(ConnectionError):
+        store.sync(broken)
+    assert not store.auto_sync_due()
+    now[0] += 31
+    assert store.auto_sync_due()
+
+    with pytest.raises(ConnectionError):
+        store.sync(broken)
+    now[0] += 31
+    assert not store.auto_sync_due()  # second failure waits twice as long
+    now[0] += 30
+    assert store.auto_sync_due()
+
+    store.sync(working)
+    assert store.last_sync() == now[0]
+    assert not store.auto_sync_due()
@@ -0,0 +1,44 @@
+import urllib.error
+import urllib.request
+from urllib.parse import urlencode
+
+import pytest
+from twilio.request_validator import RequestValidator
+
+from src import callbacks
+from src.call_store import CallStore
+
+PUBLIC_URL = "https://example.ngrok.app/twilio/status"
+AUTH_TOKEN = "test-token"
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(callbacks, "STATUS_CALLBACK_URL", PUBLIC_URL)
+    monkeypatch.setattr(callbacks, "TWILIO_AUTH_TOKEN", AUTH_TOKEN)
+    server = callbacks.start_callback_server(CallStore(str(tmp_path / "calls.sqlite3")), port=0, validate=True)
+    yield server
+    server.shutdown()
+
+
+def post(server, form: dict, signature: str) -> int:
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{server.server_address[1]}{callbacks.STATUS_CALLBACK_PATH}",
+        data=urlencode(form).encode(), headers={"X-Twilio-Signature": signature})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def test_signed_callback_with_blank_fields_is_accepted(server):
+    form = {"CallSid": "CA123", "CallStatus": "ringing", "To": "+12025550123",
+            "ForwardedFrom": "", "CallerName": ""}
+    signature = RequestValidator(AUTH_TOKEN).compute_signature(PUBLIC_URL, form)
+    assert post(server, form, signature) == 204
+
+
+def test_bad_signature_is_rejected(server):
+    form = {"CallSid": "CA123", "CallStatus": "ringing", "ForwardedFrom": ""}
+    assert post(server, form, "not-a-signature") == 403
@@ -0,0 +1,57 @@
+import pytest
+
+from src.campaign import Campaign, read_results
+
+CONTACTS = [{"name": "Asha", "mobile_no": "+919876543210"},
+            {"name": "Ben", "mobile_no": "+12025550123"},
+            {"name": "Chen", "mobile_no": "+447700900123"}]
+
+
+class Dialer:
+    def __init__(self):
+        self.numbers = []
+
+    def __call__(self, number, message):
+        self.numbers.append(number)
+        return f"CA{len(self.numbers)}"
+
+
+def campaign(template="Hi {name}", dial=None, contacts=CONTACTS):
+    return Campaign([dict(c) for c in contacts], template, max_concurrency=2, calls_per_second=0,
+                    dial=dial or Dialer())
+
+
+@pytest.mark.parametrize("template", ["Hi {0}", "Hi {name:d}", "Hi {surname}", "Hi {name.first}"])
+def test_broken_template_fails_the_contact_without_dialing(template):
+    dial = Dialer()
+    results = campaign(template, dial).run()
+    assert [r["status"] for r in results] == ["failed"] * 3
+    assert all(r["error"].startswith("Template cannot be filled") for r in results)
+    assert dial.numbers == []
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+def test_results_are_appended_as_calls_complete(tmp_path, suffix):
+    out = str(tmp_path / f"results{suffix}")
+    in_file = []
+    campaign().run(out_path=out, on_result=lambda r: in_file.append(
+        r["mobile_no"] in {row["mobile_no"] for row in read_results(out)}))
+    assert in_file == [True, True, True]
+    assert sorted(r["mobile_no"] for r in read_results(out)) == sorted(c["mobile_no"] for c in CONTACTS)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+def test_rerun_skips_numbers_already_dialed(tmp_path, suffix):
+    out = str(tmp_path / f"results{suffix}")
+    first = Dialer()
+    campaign(dial=first, contacts=CONTACTS[:2] + [{"name": "Bad", "mobile_no": "12345"}]).run(out_path=out)
+    assert sorted(first.numbers) == sorted(c["mobile_no"] for c in CONTACTS[:2])
+
+    second = Dialer()
+    rerun = campaign(dial=second, contacts=CONTACTS + [{"name": "Bad", "mobile_no": "12345"}])
+    results = rerun.run(out_path=out)
+    assert second.numbers == [CONTACTS[2]["mobile_no"]]
+    assert rerun.summary()["resumed"] == 2
+    assert results[0] is None and results[2]["status"] == "initiated"
+    assert results[3]["status"] == "skipped"
+    assert len(read_results(out)) == 5
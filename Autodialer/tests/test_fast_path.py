@@ -0,0 +1,29 @@
+import pytest
+
+from src.fast_path import CallRequest, parse_call_request
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Make a call to +12025550123 with the message: 'Your order has shipped.'",
+     CallRequest("+12025550123", "Your order has shipped.")),
+    ('call +1 (202) 555-0123 and say "hello there"', CallRequest("+12025550123", "hello there")),
+    ("Dial +447700900123 saying “Meeting moved to 3pm”.", CallRequest("+447700900123", "Meeting moved to 3pm")),
+])
+def test_well_formed_requests_skip_the_model(text, expected):
+    assert parse_call_request(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    # More than one quoted part: the greedy message would swallow the text between them
+    "call +12025550123 message 'hi' and 'bye'",
+    "call +12025550123 and say 'hello' to everyone. Actually don't.'",
+    'call +12025550123 and say "first" then "second"',
+    # Not a single clear instruction
+    "call +12025550123 and say 'hi' then call +12025550199 and say 'bye'",
+    "call 2025550123 and say 'no country code'",
+    "call +12025550123 and say 'mismatched\"",
+    "what calls did I make yesterday?",
+    "",
+])
+def test_ambiguous_requests_go_to_the_agent(text):
+    assert parse_call_request(text) is None
@@ -0,0 +1,20 @@
+"""Files every app of the repository keeps its own copy of; fails if the copies differ."""
+from pathlib import Path
+
+import pytest
+
+APP_DIR = Path(__file__).resolve().parents[1]
+APPS = ["AI_Article_generate", "Autodialer", "LinkedIn-Scraping"]
+# The apps are deployed separately, so each ships these files itself
+SHARED_FILES = ["src/telemetry.py", "tests/test_telemetry.py", "tests/test_shared_files.py",
+                "benchmarks/bench_startup.py"]
+
+
+@pytest.mark.parametrize("name", SHARED_FILES)
+def test_shared_files_match_the_other_apps(name):
+    copies = [APP_DIR.parent / app / name for app in APPS if app != APP_DIR.name]
+    copies = [path for path in copies if path.exists()]
+    if not copies:
+        pytest.skip("the other apps are not checked out next to this one")
+    ours = (APP_DIR / name).read_bytes()
+    assert [path for path in copies if path.read_bytes() != ours] == []
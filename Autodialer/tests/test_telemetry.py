@@ -0,0 +1,37 @@
+"""Shared by every app of the repository (see test_shared_files.py)."""
+import json
+import os
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parents[1]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_import_has_no_side_effects_until_started(tmp_path):
+    port = free_port()
+    code = """
+import json, sys, urllib.request
+from src import telemetry
+before = [telemetry.TELEMETRY.metrics_port, telemetry.TELEMETRY.jsonl_path, "dotenv" in sys.modules]
+telemetry.start_telemetry()
+telemetry.start_telemetry()
+telemetry.TELEMETRY.count("probe")
+print(json.dumps({"before": before, "port": telemetry.TELEMETRY.metrics_port,
+                  "metrics": urllib.request.urlopen(sys.argv[1], timeout=5).read().decode()}))
+"""
+    env = {**os.environ, "TELEMETRY_PORT": str(port), "TELEMETRY_JSONL": str(tmp_path / "events.jsonl")}
+    result = subprocess.run([sys.executable, "-c", code, f"http://127.0.0.1:{port}/metrics"], cwd=APP_DIR,
+                            env=env, capture_output=True, text=True, check=True)
+    out = json.loads(result.stdout.strip().splitlines()[-1])
+    assert out["before"] == [None, None, False]
+    assert out["port"] == port
+    assert "probe_total" in out["metrics"]
+    assert json.loads((tmp_path / "events.jsonl").read_text())["name"] == "probe"
@@ -0,0 +1,16 @@
+import subprocess
+import sys
+
+from src.tools import get_make_call_tool
+
+
+def test_importing_tools_does_not_load_langchain():
+    code = "import sys, src.tools; print('langchain_core' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_make_call_tool_is_built_once():
+    tool = get_make_call_tool()
+    assert tool.name == "make_call"
+    assert get_make_call_tool() is tool
@@ -0,0 +1,215 @@
+"""Offline benchmark for the LinkedIn scraper.
+
+Runs scrape_profile, scrape_sections and results_to_dataframe_and_csv over
+synthetic profile fixtures, either through a fake WebDriver (default) or a
+real headless Chrome pointed at a local fixture server (--http).
+
+Usage (from LinkedIn-Scraping/):
+    python -m benchmarks.bench_scraper --sizes 100 1000 10000
+    python -m benchmarks.bench_scraper --sizes 100 --http
+    python -m benchmarks.bench_scraper --compare benchmarks/results/<older>.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+
+from src.extraction import CARD_CLASS
+from src.index import ScrapeIndex
+from src.scrapper import LinkedInScapper
+from src.sinks import ParquetSink
+
+from .fake_driver import FakeDriver
+from .fixtures import make_profile_html
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def percentiles(values: list) -> dict:
+    """Nearest-rank p50/p90/p95/p99 plus mean, in milliseconds."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50_ms": round(pick(0.50), 3),
+        "p90_ms": round(pick(0.90), 3),
+        "p95_ms": round(pick(0.95), 3),
+        "p99_ms": round(pick(0.99), 3),
+    }
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves /in/bench-<i>/ as the i-th synthetic profile."""
+
+    def do_GET(self):
+        try:
+            i = int(self.path.strip("/").split("-")[-1])
+        except ValueError:
+            self.send_error(404)
+            return
+        body = make_profile_html(i).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_fixture_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_size(n: int, http_base: str = None, rtt: float = 0.0) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        scrapper = LinkedInScapper(
+            profile_dir=str(tmp / "profile"),
+            index=ScrapeIndex(str(tmp / "index.sqlite3")),
+            sink=ParquetSink(str(tmp / "parquet")),
+            lightweight=http_base is not None)
+
+        if http_base:
+            links = [f"{http_base}/in/bench-{i}/" for i in range(n)]
+            fake = None
+        else:
+            links = [f"https://www.linkedin.com/in/bench-{i}/" for i in range(n)]
+            fake = FakeDriver({link: make_profile_html(i) for i, link in enumerate(links)}, rtt=rtt)
+            scrapper.driver_manager.attach(fake)
+
+        tracemalloc.start()
+        profile_times, sections_times, results = [], [], []
+        round_trips = {"scrape_profile": 0, "scrape_sections": 0}
+        start = time.perf_counter()
+        for link in links:
+            calls_before = fake.round_trips if fake else 0
+            t0 = time.perf_counter()
+            results.append(scrapper.scrape_profile(link))
+            t1 = time.perf_counter()
+            calls_mid = fake.round_trips if fake else 0
+            # Element-walk path on the same page, for comparison with the one-shot extraction
+            cards = scrapper.driver.find_elements(By.CLASS_NAME, CARD_CLASS)
+            scrapper.scrape_sections(cards[2:])
+            t2 = time.perf_counter()
+            profile_times.append(t1 - t0)
+            sections_times.append(t2 - t1)
+            if fake:
+                round_trips["scrape_profile"] += calls_mid - calls_before
+                round_trips["scrape_sections"] += fake.round_trips - calls_mid
+        scrape_wall = time.perf_counter() - start
+
+        t0 = time.perf_counter()
+        scrapper.results_to_dataframe_and_csv(results, csv_path=str(tmp / "out.csv"))
+        csv_time = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        scrapper.close()
+
+    total_profile = sum(profile_times)
+    result = {
+        "profiles": n,
+        "profiles_per_min": round(n / total_profile * 60, 1) if total_profile else None,
+        "scrape_wall_s": round(scrape_wall, 3),
+        "scrape_profile": percentiles(profile_times),
+        "scrape_sections": percentiles(sections_times),
+        "results_to_dataframe_and_csv_s": round(csv_time, 4),
+        "peak_python_mem_mb": round(peak / 1e6, 2),
+        "wait_summary": scrapper.timer.summary(),
+    }
+    if fake:
+        result["webdriver_calls_per_profile"] = {
+            stage: round(count / n, 1) for stage, count in round_trips.items()}
+    return result
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(current: dict, previous_path: str):
+    previous = json.loads(Path(previous_path).read_text())
+    print(f"\nCompared with {previous_path} ({previous['meta'].get('commit')}):")
+    for size, now in current["results"].items():
+        old = previous["results"].get(size)
+        if not old:
+            continue
+        for label, getter in [
+            ("profiles/min", lambda r: r["profiles_per_min"]),
+            ("scrape_profile p50 ms", lambda r: r["scrape_profile"]["p50_ms"]),
+            ("scrape_sections p50 ms", lambda r: r["scrape_sections"]["p50_ms"]),
+            ("csv export s", lambda r: r["results_to_dataframe_and_csv_s"]),
+            ("peak mem MB", lambda r: r["peak_python_mem_mb"]),
+        ]:
+            a, b = getter(old), getter(now)
+            if a:
+                print(f"  n={size:>6} {label:<24} {a:>10} -> {b:>10} ({(b - a) / a:+.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--http", action="store_true",
+                        help="Use real headless Chrome against a local fixture server")
+    parser.add_argument("--rtt-ms", type=float, default=0.0,
+                        help="Simulated chromedriver round-trip latency for the fake driver")
+    parser.add_argument("--out", default=None, help="Where to write the JSON results")
+    parser.add_argument("--compare", default=None, help="Earlier results JSON to diff against")
+    args = parser.parse_args()
+
+    server = start_fixture_server() if args.http else None
+    http_base = f"http://127.0.0.1:{server.server_address[1]}" if server else None
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "mode": "http" if args.http else "fake-driver",
+            "rtt_ms": args.rtt_ms,
+        },
+        "results": {},
+    }
+    for n in args.sizes:
+        print(f"Benchmarking {n} profiles...")
+        result = run_size(n, http_base=http_base, rtt=args.rtt_ms / 1000)
+        report["results"][str(n)] = result
+        print(f"  {result['profiles_per_min']} profiles/min, "
+              f"scrape_profile p50={result['scrape_profile']['p50_ms']}ms "
+              f"p99={result['scrape_profile']['p99_ms']}ms, "
+              f"csv={result['results_to_dataframe_and_csv_s']}s, "
+              f"peak={result['peak_python_mem_mb']}MB")
+
+    if server:
+        server.shutdown()
+
+    out = Path(args.out) if args.out else RESULTS_DIR / f"scraper-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {out}")
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import time
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from src.extraction import PROFILE_EXTRACTION_JS
+from src.offline import extract_document, inner_text, parse_page
+from src.waits import CLASSIFY_PAGE_JS
+
+
+class FakeElement:
+    """Just enough of ``WebElement`` for the scraper, backed by an lxml node."""
+
+    def __init__(self, driver, node):
+        self._driver = driver
+        self._node = node
+
+    @property
+    def text(self) -> str:
+        self._driver.round_trip()
+        return inner_text(self._node)
+
+    def find_elements(self, by, value):
+        self._driver.round_trip()
+        return [FakeElement(self._driver, n) for n in _select(self._node, by, value)]
+
+    def find_element(self, by, value):
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElementException(f"{by}={value}")
+        return found[0]
+
+    def is_displayed(self) -> bool:
+        return True
+
+
+def _select(node, by, value):
+    if by == By.CSS_SELECTOR:
+        return node.cssselect(value)
+    if by == By.CLASS_NAME:
+        return node.find_class(value)
+    if by == By.TAG_NAME:
+        return [n for n in node.iter(value) if n is not node]
+    if by == By.ID:
+        return node.cssselect(f"#{value}")
+    raise ValueError(f"Unsupported locator strategy: {by}")
+
+
+class FakeDriver:
+    """Offline stand-in for ``webdriver.Chrome`` serving fixture pages.
+
+    ``pages`` maps URL -> HTML. Every WebDriver command is counted (and can
+    be delayed by ``rtt`` seconds) to model chromedriver HTTP round-trips.
+    """
+
+    def __init__(self, pages: dict, rtt: float = 0.0):
+        self.pages = pages
+        self.rtt = rtt
+        self.round_trips = 0
+        self.current_url = "about:blank"
+        self.page_source = ""
+        self._doc = None
+
+    def round_trip(self):
+        self.round_trips += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    def get(self, url):
+        self.round_trip()
+        self.current_url = url
+        self.page_source = self.pages[url]
+        self._doc = parse_page(self.page_source)
+
+    @property
+    def title(self) -> str:
+        found = self._doc.find(".//title") if self._doc is not None else None
+        return found.text if found is not None else ""
+
+    @property
+    def window_handles(self):
+        self.round_trip()
+        return ["fake-window"]
+
+    def find_elements(self, by, value):
+        self.round_trip()
+        return [FakeElement(self, n) for n in _select(self._doc, by, value)]
+
+    def find_element(self, by, value):
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElementException(f"{by}={value}")
+        return found[0]
+
+    def execute_script(self, script, *args):
+        self.round_trip()
+        if script == PROFILE_EXTRACTION_JS:
+            allowed = args[0]
+            record = extract_document(self._doc, allowed)
+            profile_keys = ("Name", "Headline", "Company", "Location", "About")
+            return {
+                "cards": len(self._doc.find_class("artdeco-card")),
+                "profile": {k: record[k] for k in profile_keys},
+                "sections": {k: v for k, v in record.items() if k not in profile_keys},
+            }
+        if script == CLASSIFY_PAGE_JS:
+            return {"url": self.current_url, "title": self.title, "ready": True, "status": 200,
+                    "topCard": bool(self._doc.cssselect(".artdeco-card h1")),
+                    "captcha": False, "text": ""}
+        if "document.readyState" in script:
+            return "complete"
+        if "arguments[0].click()" in script:
+            return None
+        raise NotImplementedError(f"FakeDriver cannot run script: {script[:60]!r}")
+
+    def get_cookies(self):
+        return []
+
+    def add_cookie(self, cookie):
+        pass
+
+    def quit(self):
+        pass
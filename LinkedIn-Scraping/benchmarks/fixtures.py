@@ -0,0 +1,51 @@
+import random
+from html import escape
+
+FIRST_NAMES = ["Asha", "Ben", "Chen", "Diego", "Elif", "Farah", "Goran", "Hana", "Ivan", "Jun"]
+LAST_NAMES = ["Kumar", "Lopez", "Meyer", "Nakamura", "Okafor", "Petrov", "Quinn", "Rossi"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+CITIES = ["Bengaluru, Karnataka, India", "Berlin, Germany", "Austin, Texas, United States"]
+SECTIONS = ["Experience", "Education", "Licenses & certifications", "Projects", "Skills",
+            "Publications", "Courses", "Honors & awards", "Languages", "Volunteering",
+            "Recommendations", "Interests"]
+
+
+def _section(heading: str, items: list) -> str:
+    lis = "".join(
+        f'<li class="artdeco-list__item"><div><span aria-hidden="true">{escape(item)}</span>'
+        f'<span class="visually-hidden">{escape(item)}</span></div></li>'
+        for item in items)
+    return (f'<section class="artdeco-card pv-profile-card">'
+            f'<h2 class="pvs-header__title"><span aria-hidden="true">{escape(heading)}</span>'
+            f'<span class="visually-hidden">{escape(heading)}</span></h2>'
+            f'<ul class="pvs-list">{lis}</ul></section>')
+
+
+def make_profile_html(i: int, seed: int = 0) -> str:
+    """Deterministic synthetic profile page using LinkedIn's card markup."""
+    rng = random.Random(seed * 1_000_003 + i)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    company = rng.choice(COMPANIES)
+    about = " ".join(rng.choice(["Building", "data", "platforms", "at", "scale", "with",
+                                 "Python", "and", "Rust."]) for _ in range(rng.randint(20, 80)))
+    sections = []
+    for heading in rng.sample(SECTIONS, rng.randint(3, len(SECTIONS))):
+        items = [f"{heading} item {n} · {company} · {rng.randint(2010, 2025)}"
+                 for n in range(rng.randint(1, 12))]
+        sections.append(_section(heading, items))
+    return f"""<!DOCTYPE html>
+<html><head><title>{escape(name)} | LinkedIn</title>
+<script>window.__bench = {i};</script></head>
+<body><main class="scaffold-layout__main">
+<section class="artdeco-card pv-top-card">
+  <h1 class="text-heading-xlarge">{escape(name)}</h1>
+  <div class="text-body-medium break-words">Senior Engineer at {escape(company)}</div>
+  <span class="text-body-small inline t-black--light break-words">{escape(rng.choice(CITIES))}</span>
+  <ul class="pv-text-details__right-panel"><li><span class="t-black">{escape(company)}</span></li></ul>
+</section>
+<section class="artdeco-card">
+  <h2 class="pvs-header__title"><span aria-hidden="true">About</span><span class="visually-hidden">About</span></h2>
+  <div class="inline-show-more-text--is-collapsed"><span aria-hidden="true">{escape(about)}</span></div>
+</section>
+{''.join(sections)}
+</main></body></html>"""
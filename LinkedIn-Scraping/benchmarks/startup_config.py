@@ -0,0 +1,12 @@
+"""What bench_startup.py measures for the scraper UI.
+
+Imports are checked for selenium, pandas, pyarrow and lxml; setup is creating
+the job runner, which the first scrape pays once. No browser is launched.
+"""
+HEAVY_PACKAGES = ["selenium", "pandas", "pyarrow", "lxml"]
+IMPORTS = ["src.jobs", "src.network", "src.scrapper", "src.sinks", "src.offline"]
+SETUP = {
+    # The runner's worker thread imports the scraper itself when the first job arrives
+    "job_runner": "from src.jobs import JobRunner; JobRunner()",
+}
+ENV = {"TELEMETRY_PORT": "", "TELEMETRY_JSONL": ""}
@@ -0,0 +1,138 @@
+import json
+import time
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from .network import apply_lightweight_options, block_heavy_resources, enable_page_metrics
+
+COOKIE_FILE = "linkedin_cookies.json"
+COOKIE_URL = "https://www.linkedin.com/robots.txt"  # tiny same-domain page for add_cookie
+
+# Errors that mean the browser/chromedriver session is gone rather than the page misbehaving
+DEAD_SESSION_MARKERS = ("invalid session id", "disconnected", "no such window",
+                        "chrome not reachable", "session deleted", "target window already closed")
+
+
+def is_dead_session_error(error: Exception) -> bool:
+    if isinstance(error, InvalidSessionIdException):
+        return True
+    return isinstance(error, WebDriverException) and any(
+        marker in str(error).lower() for marker in DEAD_SESSION_MARKERS)
+
+
+class DriverManager:
+    """Own one Chrome session: lazy launch, health checks, relaunch and cookie persistence.
+
+    The browser stays warm between ``scrape`` batches; if it has died it is
+    relaunched transparently and the saved LinkedIn cookies are restored so
+    the login flow can be skipped.
+    """
+
+    def __init__(self, chromedriver_path: str, profile_dir: str,
+                 lightweight: bool = False, measure_pages: bool = False):
+        self.chromedriver_path = chromedriver_path
+        self.profile_dir = profile_dir
+        # Headless, no images/media/fonts/trackers (see src/network.py)
+        self.lightweight = lightweight
+        # Record transferred bytes per page from Chrome's performance log
+        self.measure_pages = measure_pages
+        self.cookies_path = Path(profile_dir) / COOKIE_FILE
+        self._driver = None
+        self.launches = 0
+        self.last_launch_s = None
+
+    def build_options(self) -> Options:
+        options = Options()
+        if self.lightweight:
+            apply_lightweight_options(options)
+        else:
+            options.add_argument("--start-maximized")
+        if self.measure_pages:
+            enable_page_metrics(options)
+        options.add_argument(f"user-data-dir={self.profile_dir}")
+        options.add_argument("--profile-directory=Default")
+        return options
+
+    @property
+    def driver(self):
+        """The live WebDriver, launched on first use."""
+        if self._driver is None:
+            self.launch()
+        return self._driver
+
+    @property
+    def started(self) -> bool:
+        return self._driver is not None
+
+    def attach(self, driver):
+        """Adopt an already-created WebDriver (e.g. a fake driver in benchmarks)."""
+        self.quit()
+        self._driver = driver
+
+    def launch(self):
+        start = time.perf_counter()
+        service = Service(self.chromedriver_path)
+        self._driver = webdriver.Chrome(service=service, options=self.build_options())
+        self.launches += 1
+        self.last_launch_s = time.perf_counter() - start
+        print(f"Chrome launched in {self.last_launch_s:.2f}s (launch #{self.launches})")
+        if self.lightweight:
+            block_heavy_resources(self._driver)
+        self.restore_cookies()
+
+    def is_alive(self) -> bool:
+        """Cheap health check: one round-trip that fails if the session is gone."""
+        if self._driver is None:
+            return False
+        try:
+            self._driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def ensure_alive(self) -> bool:
+        """Relaunch the browser if it is missing or dead; returns True if it relaunched."""
+        if self.is_alive():
+            return False
+        if self._driver is not None:
+            print("Chrome session is gone, relaunching...")
+        self.quit()
+        self.launch()
+        return True
+
+    def save_cookies(self):
+        """Persist the current LinkedIn cookies so a restart can skip login."""
+        cookies = [c for c in self.driver.get_cookies()
+                   if "linkedin.com" in c.get("domain", "")]
+        self.cookies_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cookies_path.write_text(json.dumps(cookies))
+
+    def restore_cookies(self) -> bool:
+        if not self.cookies_path.exists():
+            return False
+        try:
+            cookies = json.loads(self.cookies_path.read_text())
+        except ValueError:
+            return False
+        now = time.time()
+        self._driver.get(COOKIE_URL)
+        for cookie in cookies:
+            if cookie.get("expiry") and cookie["expiry"] < now:
+                continue
+            try:
+                self._driver.add_cookie(cookie)
+            except WebDriverException as e:
+                print(f"Skipping cookie {cookie.get('name')}: {e}")
+        return True
+
+    def quit(self):
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except WebDriverException:
+                pass
+            self._driver = None
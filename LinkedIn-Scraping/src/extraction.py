@@ -0,0 +1,95 @@
+from selenium.common.exceptions import NoSuchElementException
+
+# Profile sections kept in the output; everything else is skipped.
+ALLOWED_COLUMNS = ("Experience", "Education", "Licenses & certifications", "Projects",
+                   "Skills", "Publications", "Courses", "Honors & awards", "Languages")
+
+# CSS locators shared by the live (WebDriver), in-page (JavaScript) and
+# offline (snapshot) extractors.
+CARD_CLASS = "artdeco-card"
+NAME_SELECTOR = "h1"
+HEADLINE_SELECTOR = "div.text-body-medium"
+LOCATION_SELECTOR = "span.text-body-small.inline.t-black--light.break-words"
+COMPANY_SELECTOR = "ul li span.t-black"
+SECTION_HEADING_SELECTOR = "h2.pvs-header__title span[aria-hidden='true']"
+ABOUT_BODY_SELECTOR = "div.inline-show-more-text--is-collapsed span[aria-hidden='true']"
+
+# Runs inside the page and returns the whole profile as one JSON-able object,
+# mirroring scrape_user_info + scrape_sections (innerText ~ WebElement.text).
+# Screen-reader copies (.visually-hidden) repeat the visible text, so they are
+# hidden while reading; offline.parse_page drops them the same way.
+PROFILE_EXTRACTION_JS = """
+const allowed = new Set(arguments[0]);
+const sel = arguments[1];
+const hide = document.createElement("style");
+hide.textContent = ".visually-hidden { display: none !important; }";
+(document.head || document.documentElement).appendChild(hide);
+try {
+    const text = (root, selector) => {
+        const el = root ? root.querySelector(selector) : null;
+        return el ? el.innerText.trim() : "";
+    };
+    const cards = Array.from(document.getElementsByClassName(sel.card));
+    if (cards.length < 2) {
+        return {cards: cards.length};
+    }
+    const top = cards[0];
+    const companies = top.querySelectorAll(sel.company);
+    let about = "";
+    if (text(cards[1], sel.heading).toLowerCase() === "about") {
+        about = text(cards[1], sel.about);
+    }
+    const sections = {};
+    for (const card of cards.slice(2)) {
+        const heading = text(card, sel.heading);
+        if (!heading || !allowed.has(heading)) {
+            continue;
+        }
+        const items = [];
+        Array.from(card.getElementsByTagName("li")).forEach((li, id) => {
+            const item = li.innerText.trim();
+            if (item) {
+                items.push({id: id, item: item});
+            }
+        });
+        sections[heading] = items;
+    }
+    return {
+        cards: cards.length,
+        profile: {
+            Name: text(top, sel.name),
+            Headline: text(top, sel.headline),
+            Company: companies.length ? companies[0].innerText.trim() : "",
+            Location: text(top, sel.location),
+            About: about,
+        },
+        sections: sections,
+    };
+} finally {
+    hide.remove();
+}
+"""
+
+SELECTORS = {
+    "card": CARD_CLASS,
+    "name": NAME_SELECTOR,
+    "headline": HEADLINE_SELECTOR,
+    "location": LOCATION_SELECTOR,
+    "company": COMPANY_SELECTOR,
+    "heading": SECTION_HEADING_SELECTOR,
+    "about": ABOUT_BODY_SELECTOR,
+}
+
+
+def extract_profile(driver, allowed_columns) -> dict:
+    """Extract the top card, About and allowed sections in one WebDriver round-trip.
+
+    Returns the same dict shape as ``scrape_user_info(...) | scrape_sections(...)``.
+    """
+    data = driver.execute_script(
+        PROFILE_EXTRACTION_JS, list(allowed_columns), SELECTORS)
+    if not data or "profile" not in data:
+        found = data.get("cards", 0) if data else 0
+        raise NoSuchElementException(
+            f"Expected at least 2 profile cards, found {found}")
+    return data["profile"] | data["sections"]
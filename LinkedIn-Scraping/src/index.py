@@ -0,0 +1,136 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    url          TEXT PRIMARY KEY,
+    status       TEXT NOT NULL,          -- pending | done | failed
+    last_scraped REAL,                   -- unix time of the last successful scrape
+    content_hash TEXT,                   -- sha256 of the record JSON
+    data         TEXT,                   -- record JSON
+    error        TEXT,
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    exported     INTEGER NOT NULL DEFAULT 0,  -- written to the CSV yet?
+    updated_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_status ON profiles(status, exported);
+"""
+
+
+def normalize_profile_url(url: str) -> str:
+    """Canonical form of a profile URL: https, www host, lowercase slug, trailing slash."""
+    parts = urlsplit(url.strip())
+    path = unquote(parts.path).rstrip("/").lower()
+    return f"https://www.linkedin.com{path}/"
+
+
+def content_hash(record: dict) -> str:
+    payload = json.dumps(record, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ScrapeIndex:
+    """SQLite-backed record of every profile we have scraped.
+
+    Each profile is committed as soon as it finishes, so an interrupted run
+    loses at most the profile in flight, and profiles scraped within
+    ``ttl_hours`` are skipped on the next run.
+    """
+
+    def __init__(self, path: str = "scraped_profiles/scrape_index.sqlite3", ttl_hours: float = 24 * 7):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        # Shared by pool worker threads; the lock serialises writes
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def is_fresh(self, url: str) -> bool:
+        """True if ``url`` was scraped successfully within the TTL."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT last_scraped FROM profiles WHERE url = ? AND status = 'done'",
+                (normalize_profile_url(url),)).fetchone()
+        return bool(row and row[0] and time.time() - row[0] < self.ttl_seconds)
+
+    def mark_pending(self, url: str):
+        """Note that ``url`` is about to be scraped.
+
+        A done profile stays done, so its last good record is still served
+        if the new scrape fails; ``mark_done`` overwrites it on success.
+        """
+        with self._lock, self.conn:
+            self.conn.execute(
+                """INSERT INTO profiles (url, status, updated_at) VALUES (?, 'pending', ?)
+                   ON CONFLICT(url) DO UPDATE SET attempts = attempts + 1, updated_at = excluded.updated_at""",
+                (normalize_profile_url(url), time.time()))
+
+    def mark_done(self, url: str, record: dict) -> bool:
+        """Store a scraped record; returns True if its content changed.
+
+        An unchanged record keeps its export flag, so it is not appended to
+        the CSV a second time.
+        """
+        digest = content_hash(record)
+        now = time.time()
+        with self._lock, self.conn:
+            row = self.conn.execute(
+                "SELECT content_hash FROM profiles WHERE url = ?",
+                (normalize_profile_url(url),)).fetchone()
+            changed = not row or row[0] != digest
+            self.conn.execute(
+                """INSERT INTO profiles (url, status, last_scraped, content_hash, data, error, exported, updated_at)
+                   VALUES (?, 'done', ?, ?, ?, NULL, 0, ?)
+                   ON CONFLICT(url) DO UPDATE SET
+                       status = 'done', last_scraped = excluded.last_scraped,
+                       content_hash = excluded.content_hash, data = excluded.data,
+                       error = NULL, updated_at = excluded.updated_at,
+                       exported = CASE WHEN profiles.content_hash IS excluded.content_hash
+                                       THEN profiles.exported ELSE 0 END""",
+                (normalize_profile_url(url), now, digest,
+                 json.dumps(record, ensure_ascii=False), now))
+        return changed
+
+    def mark_failed(self, url: str, error: str):
+        """Record a failed scrape; a profile that was already done keeps its record."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                """INSERT INTO profiles (url, status, error, updated_at) VALUES (?, 'failed', ?, ?)
+                   ON CONFLICT(url) DO UPDATE SET
+                       status = CASE WHEN profiles.status = 'done' THEN 'done' ELSE 'failed' END,
+                       error = excluded.error, updated_at = excluded.updated_at""",
+                (normalize_profile_url(url), error, time.time()))
+
+    def records(self, urls) -> dict:
+        """Return ``{normalized_url: record}`` for the done profiles among ``urls``."""
+        keys = [normalize_profile_url(u) for u in urls]
+        found = {}
+        with self._lock:
+            # Chunked to stay under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self.conn.execute(
+                    f"SELECT url, data FROM profiles WHERE status = 'done' AND url IN ({','.join('?' * len(chunk))})",
+                    chunk).fetchall()
+                found.update({url: json.loads(data) for url, data in rows})
+        return found
+
+    def unexported(self) -> list:
+        """Done records not yet written to the CSV (including ones from crashed runs)."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT url, data FROM profiles WHERE status = 'done' AND exported = 0 ORDER BY last_scraped"
+            ).fetchall()
+        return [(url, json.loads(data)) for url, data in rows]
+
+    def mark_exported(self, urls):
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "UPDATE profiles SET exported = 1 WHERE url = ?", [(u,) for u in urls])
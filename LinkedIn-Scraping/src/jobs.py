@@ -0,0 +1,152 @@
+import queue
+import threading
+import time
+import uuid
+from typing import List
+
+from .index import normalize_profile_url
+from .snapshots import SnapshotStore
+
+# Finished jobs (with their rows) kept for the UI; older ones are dropped
+MAX_FINISHED_JOBS = 20
+FINISHED_JOB_TTL_S = 3600
+
+
+class ScrapeJob:
+    """State of one background scrape, read by the UI while it runs."""
+
+    def __init__(self, links: List[str], options: dict):
+        self.id = uuid.uuid4().hex[:8]
+        self.links = links
+        # Duplicates are scraped (and reported) once
+        self.total = len({normalize_profile_url(link) for link in links})
+        self.options = options
+        self.status = "queued"  # queued | running | done | failed | cancelled
+        self.rows = []          # one row per finished profile, in completion order
+        self.error = None
+        self.timings = {}
+        self.scheduler_stats = {}
+        self.page_metrics = []
+        self.submitted_at = time.time()
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def add_row(self, link, record, error):
+        row = {"Profile URL": link, "Error": error} | (record or {})
+        with self._lock:
+            self.rows.append(row)
+
+    def snapshot_rows(self) -> list:
+        with self._lock:
+            return list(self.rows)
+
+    def dataframe(self):
+        """Finished rows so far as a DataFrame (sections JSON-encoded)."""
+        from .scrapper import records_to_dataframe
+        return records_to_dataframe(self.snapshot_rows())
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed", "cancelled")
+
+    @property
+    def progress(self) -> float:
+        return min(1.0, len(self.rows) / self.total) if self.total else 1.0
+
+
+class JobRunner:
+    """Run scrape jobs one at a time on a background thread.
+
+    A single worker thread owns the browser(s), so jobs queue up behind each
+    other while the UI stays responsive and polls job state by ID. Selenium,
+    pandas and pyarrow are first imported by that thread when it starts the
+    first job, not when the runner is created. Only the last
+    ``max_finished`` finished jobs are kept, each for at most
+    ``finished_ttl_s`` seconds; queued and running jobs are never dropped.
+    """
+
+    def __init__(self, max_finished: int = MAX_FINISHED_JOBS, finished_ttl_s: float = FINISHED_JOB_TTL_S):
+        self.jobs = {}
+        self.max_finished = max_finished
+        self.finished_ttl_s = finished_ttl_s
+        self._jobs_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._scrapper = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, links: List[str], workers: int = 1, refresh: bool = False,
+               lightweight: bool = False, save_snapshots: bool = False, measure_pages: bool = False) -> str:
+        job = ScrapeJob(links, {"workers": workers, "refresh": refresh, "lightweight": lightweight,
+                                "save_snapshots": save_snapshots, "measure_pages": measure_pages})
+        with self._jobs_lock:
+            self.jobs[job.id] = job
+        self._queue.put(job)
+        self.prune()
+        return job.id
+
+    def prune(self):
+        """Drop finished jobs past the TTL or beyond the newest ``max_finished``."""
+        now = time.time()
+        with self._jobs_lock:
+            finished = sorted((job for job in self.jobs.values() if job.finished_at is not None),
+                              key=lambda job: job.finished_at, reverse=True)
+            for i, job in enumerate(finished):
+                if i >= self.max_finished or now - job.finished_at > self.finished_ttl_s:
+                    del self.jobs[job.id]
+
+    def get(self, job_id: str) -> ScrapeJob:
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str):
+        job = self.jobs.get(job_id)
+        if job is not None and not job.finished:
+            job.cancel_event.set()
+
+    def close_browser(self):
+        """Close the warm browser once the queued jobs are done; the next job launches a new one."""
+        self._queue.put(None)
+
+    def scrapper_for(self, lightweight: bool, measure_pages: bool = False):
+        """Reuse the warm scrapper unless the browser mode or page measuring changed."""
+        from .scrapper import LinkedInScapper
+        manager = self._scrapper.driver_manager if self._scrapper is not None else None
+        if manager is not None and (manager.lightweight, manager.measure_pages) != (lightweight, measure_pages):
+            # Chrome flags are fixed at launch, so switching modes needs a new browser
+            self._scrapper.close()
+            self._scrapper = None
+        if self._scrapper is None:
+            self._scrapper = LinkedInScapper(lightweight=lightweight, measure_pages=measure_pages)
+        return self._scrapper
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                if self._scrapper is not None:
+                    self._scrapper.close()
+                    self._scrapper = None
+                continue
+            if job.cancel_event.is_set():
+                job.status, job.finished_at = "cancelled", time.time()
+                self.prune()
+                continue
+            job.status = "running"
+            try:
+                scrapper = self.scrapper_for(job.options["lightweight"], job.options["measure_pages"])
+                scrapper.snapshot_store = SnapshotStore() if job.options["save_snapshots"] else None
+                result = scrapper.scrape(
+                    job.links, workers=job.options["workers"], refresh=job.options["refresh"],
+                    on_result=job.add_row, cancel_event=job.cancel_event)
+                job.timings = scrapper.timer.summary()
+                job.scheduler_stats = scrapper.scheduler.stats()
+                job.page_metrics = list(scrapper.page_metrics)
+                if isinstance(result, dict) and result.get("status") == "error":
+                    job.status, job.error = "failed", result["error"]
+                else:
+                    job.status = "cancelled" if job.cancel_event.is_set() else "done"
+            except Exception as e:
+                job.status, job.error = "failed", f"{type(e).__name__}: {e}"
+            job.finished_at = time.time()
+            self.prune()
@@ -0,0 +1,91 @@
+import json
+
+# Chrome switches for the data-only mode: no UI, no background chatter.
+LIGHTWEIGHT_ARGS = (
+    "--headless=new",
+    "--window-size=1366,900",
+    "--blink-settings=imagesEnabled=false",
+    "--mute-audio",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-notifications",
+    "--no-first-run",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+)
+
+LIGHTWEIGHT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.managed_default_content_settings.notifications": 2,
+}
+
+BLOCKED_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "svg", "ico",
+    "mp4", "webm", "m3u8", "mp3",
+    "woff", "woff2", "ttf", "otf",
+)
+
+# Network.setBlockedURLs patterns: media, fonts and third-party trackers/ads.
+# static.licdn.com scripts and styles are left alone, the page needs them to render.
+# Patterns are matched against the whole URL ('*' is the only wildcard), so each
+# extension also gets a variant for URLs with a query string (photo.jpg?e=...).
+BLOCKED_URL_PATTERNS = [pattern for ext in BLOCKED_EXTENSIONS for pattern in (f"*.{ext}", f"*.{ext}?*")] + [
+    "*media.licdn.com/*", "*dms.licdn.com/*",
+    "*px.ads.linkedin.com/*", "*snap.licdn.com/*", "*platform.linkedin.com/litms*",
+    "*doubleclick.net/*", "*google-analytics.com/*", "*googletagmanager.com/*",
+    "*googlesyndication.com/*", "*facebook.net/*", "*bing.com/*", "*demdex.net/*",
+]
+
+
+def apply_lightweight_options(options):
+    """Add the data-only switches and content settings to Chrome ``Options``."""
+    for arg in LIGHTWEIGHT_ARGS:
+        options.add_argument(arg)
+    options.add_experimental_option("prefs", LIGHTWEIGHT_PREFS)
+
+
+def enable_page_metrics(options):
+    """Turn on Chrome's performance log so transferred bytes can be read per page."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def block_heavy_resources(driver, patterns=BLOCKED_URL_PATTERNS):
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
+
+def collect_page_metrics(driver) -> dict:
+    """Drain the performance log and total what the last page transferred.
+
+    ``encodedDataLength`` is the on-the-wire size (headers + compressed body).
+    """
+    transferred = requests = blocked = 0
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        method = message.get("method")
+        if method == "Network.requestWillBeSent":
+            requests += 1
+        elif method == "Network.loadingFinished":
+            transferred += message["params"].get("encodedDataLength", 0)
+        elif method == "Network.loadingFailed" and message["params"].get("blockedReason"):
+            blocked += 1
+    return {"bytes": int(transferred), "requests": requests, "blocked": blocked}
+
+
+def summarize_page_metrics(metrics: list) -> dict:
+    if not metrics:
+        return {}
+    n = len(metrics)
+    total_bytes = sum(m["bytes"] for m in metrics)
+    return {
+        "pages": n,
+        "total_mb": round(total_bytes / 1e6, 2),
+        "mean_kb_per_page": round(total_bytes / n / 1e3, 1),
+        "mean_requests": round(sum(m["requests"] for m in metrics) / n, 1),
+        "mean_blocked": round(sum(m["blocked"] for m in metrics) / n, 1),
+        "mean_load_s": round(sum(m["load_s"] for m in metrics) / n, 3),
+        "max_load_s": round(max(m["load_s"] for m in metrics), 3),
+    }
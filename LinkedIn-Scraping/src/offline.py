@@ -0,0 +1,190 @@
+"""Rebuild profile records from stored page snapshots without a browser.
+
+Usage:
+    python -m src.offline --out scraped_profiles/reextracted.jsonl --workers 8
+"""
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import html as lxml_html
+
+from .extraction import (ABOUT_BODY_SELECTOR, ALLOWED_COLUMNS, CARD_CLASS, COMPANY_SELECTOR,
+                         HEADLINE_SELECTOR, LOCATION_SELECTOR, NAME_SELECTOR,
+                         SECTION_HEADING_SELECTOR)
+from .snapshots import SnapshotStore
+
+_store = None
+
+# Elements rendered as blocks by default; innerText puts a line break around them
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "details", "dialog", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "pre", "section", "summary", "table", "tr", "ul",
+}
+HIDDEN_TAGS = {"script", "style", "noscript", "template", "head", "title"}
+WHITESPACE = re.compile(r"[ \t\n\r\f]+")
+_BR = object()
+
+
+def _text_items(el, items: list):
+    """Flatten ``el`` into text runs, forced breaks (``_BR``) and required line-break counts."""
+    tag = el.tag if isinstance(el.tag, str) else ""
+    if tag in HIDDEN_TAGS or el.get("hidden") is not None:
+        return
+    if tag == "br":
+        items.append(_BR)
+        return
+    breaks = 2 if tag == "p" else 1 if tag in BLOCK_TAGS else 0
+    if breaks:
+        items.append(breaks)
+    if el.text and tag:
+        items.append(el.text)
+    for child in el:
+        _text_items(child, items)
+        if child.tail:
+            items.append(child.tail)
+    if breaks:
+        items.append(breaks)
+
+
+def inner_text(el) -> str:
+    """The text ``el.innerText`` gives in a browser, for pages without custom CSS display rules.
+
+    Inline elements run together (``Senior <b>Engineer</b>`` is "Senior
+    Engineer"), whitespace collapses, block elements start new lines, ``<p>``
+    is surrounded by a blank line and ``<br>`` breaks the line.
+    """
+    items = []
+    _text_items(el, items)
+    lines, run, pending = [], [], 0
+
+    def end_run():
+        nonlocal pending
+        text = "".join(run)
+        run.clear()
+        pieces = [WHITESPACE.sub(" ", piece).strip() for piece in text.split("\x00")]
+        if len(pieces) == 1 and not pieces[0]:
+            return
+        if lines and pending:
+            lines.append("\n" * pending)
+        lines.append("\n".join(pieces))
+        pending = 0
+
+    for item in items:
+        if isinstance(item, int):
+            end_run()
+            pending = max(pending, item)
+        else:
+            run.append("\x00" if item is _BR else item)
+    end_run()
+    return "".join(lines)
+
+
+def first_text(root, selector: str) -> str:
+    found = root.cssselect(selector)
+    return inner_text(found[0]) if found else ""
+
+
+def parse_page(page: str):
+    """Parse HTML and drop what a browser would not render as text."""
+    doc = lxml_html.fromstring(page)
+    # Screen-reader duplicates are hidden during live extraction too (PROFILE_EXTRACTION_JS)
+    for el in doc.cssselect(".visually-hidden, script, style, noscript"):
+        el.drop_tree()
+    return doc
+
+
+def extract_html(page: str, allowed_columns=ALLOWED_COLUMNS) -> dict:
+    """Parse a saved profile page into the same dict ``scrape_profile`` returns."""
+    return extract_document(parse_page(page), allowed_columns)
+
+
+def extract_document(doc, allowed_columns=ALLOWED_COLUMNS) -> dict:
+    """Extract a profile record from a page parsed with ``parse_page``."""
+    cards = doc.find_class(CARD_CLASS)
+    if len(cards) < 2:
+        raise ValueError(f"Expected at least 2 profile cards, found {len(cards)}")
+
+    top = cards[0]
+    companies = top.cssselect(COMPANY_SELECTOR)
+    about = ""
+    if first_text(cards[1], SECTION_HEADING_SELECTOR).lower() == "about":
+        about = first_text(cards[1], ABOUT_BODY_SELECTOR)
+    profile = {
+        "Name": first_text(top, NAME_SELECTOR),
+        "Headline": first_text(top, HEADLINE_SELECTOR),
+        "Company": inner_text(companies[0]) if companies else "",
+        "Location": first_text(top, LOCATION_SELECTOR),
+        "About": about,
+    }
+
+    sections = {}
+    for card in cards[2:]:
+        heading = first_text(card, SECTION_HEADING_SELECTOR)
+        if not heading or heading not in allowed_columns:
+            continue
+        items = []
+        for id, li in enumerate(card.iter("li")):
+            text = inner_text(li)
+            if text:
+                items.append({"id": id, "item": text})
+        sections[heading] = items
+
+    return profile | sections
+
+
+def _extract_entry(args):
+    root, entry = args
+    global _store
+    if _store is None or str(_store.root) != root:
+        _store = SnapshotStore(root, codec=entry["codec"])
+    record = {"url": entry["url"], "scraped_at": entry["scraped_at"],
+              "record": None, "error": None}
+    try:
+        record["record"] = extract_html(_store.load(entry))
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    return record
+
+
+def reextract(root: str = "scraped_profiles/snapshots", workers: int = None,
+              latest_only: bool = True):
+    """Yield ``{"url", "scraped_at", "record", "error"}`` for every stored snapshot.
+
+    Parsing is spread over a process pool so CPU-bound re-extraction scales
+    with the number of cores.
+    """
+    entries = SnapshotStore(root).entries(latest_only=latest_only)
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(entries) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_extract_entry, [(root, e) for e in entries],
+                            chunksize=chunksize)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", default="scraped_profiles/snapshots")
+    parser.add_argument("--out", default="scraped_profiles/reextracted.jsonl")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--all-versions", action="store_true",
+                        help="Re-extract every snapshot, not just the newest per URL")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    done = failed = 0
+    with open(args.out, "w", encoding="utf-8") as f:
+        for rec in reextract(args.root, args.workers, latest_only=not args.all_versions):
+            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            done += 1
+            failed += rec["error"] is not None
+    elapsed = time.perf_counter() - start
+    print(f"Re-extracted {done} snapshots ({failed} failed) in {elapsed:.1f}s -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+from .scrapper import LinkedInScapper
+
+# Chrome refuses to start on a profile that still carries the source
+# browser's lock files; caches are skipped to keep clones small and fast.
+CLONE_IGNORE = shutil.ignore_patterns(
+    "Singleton*", "lockfile", "*.lock", "Cache", "Code Cache", "GPUCache",
+    "ShaderCache", "GrShaderCache", "Service Worker")
+
+
+class ScrapperPool:
+    """Scrape many profiles in parallel using several Chrome workers.
+
+    Every worker runs its own ``LinkedInScapper`` on a private copy of the
+    logged-in profile directory and the parent's session cookies, so
+    normally only the parent logs in. A worker that hits the auth wall logs
+    in again itself before its next link, as the single-browser loop does.
+    Workers pull links from a shared queue until it is drained.
+    """
+
+    def __init__(self, parent: LinkedInScapper, size: int = 4,
+                 workers_dir: str = "selenium_profile_workers", started_at: float = None):
+        self.parent = parent
+        self.size = max(1, size)
+        self.workers_dir = Path(workers_dir)
+        # Reference point for the start-to-first-profile measurement
+        self.started_at = started_at or time.perf_counter()
+
+    def clone_profile(self, worker_id: int) -> str:
+        """Copy the parent's Chrome profile into a per-worker directory."""
+        target = self.workers_dir / f"worker-{worker_id}"
+        shutil.copytree(self.parent.profile_dir, target,
+                        ignore=CLONE_IGNORE, dirs_exist_ok=True)
+        return str(target)
+
+    def share_session(self, scrapper: LinkedInScapper, cookies: List[dict]):
+        """Copy the parent's live LinkedIn cookies into a worker browser.
+
+        Chrome flushes cookies to disk lazily, so a freshly cloned profile
+        may not contain the login that just happened in the parent.
+        """
+        scrapper.driver.get("https://www.linkedin.com")
+        for cookie in cookies:
+            try:
+                scrapper.driver.add_cookie(cookie)
+            except Exception as e:
+                print(f"Skipping cookie {cookie.get('name')}: {e}")
+
+    def _worker(self, worker_id, jobs, records, cookies):
+        scrapper = None
+        try:
+            scrapper = LinkedInScapper(
+                profile_dir=self.clone_profile(worker_id),
+                timeouts=self.parent.timeouts,
+                snapshot_store=self.parent.snapshot_store,
+                index=self.parent.index,
+                sink=self.parent.sink,
+                lightweight=self.parent.driver_manager.lightweight,
+                measure_pages=self.parent.driver_manager.measure_pages,
+                scheduler=self.parent.scheduler)
+            scrapper.cancel_event = self.parent.cancel_event
+            self.share_session(scrapper, cookies)
+            scrapper.logged_in = True
+        except Exception as e:
+            print(f"Worker {worker_id} failed to start: {e}")
+            if scrapper is not None:
+                # Chrome is already running; don't leave it behind
+                try:
+                    scrapper.close()
+                except Exception as close_error:
+                    print(f"Worker {worker_id} could not close its browser: {close_error}")
+            return
+
+        try:
+            while not self.parent.cancelled():
+                # Auth wall seen on the previous profile: log in again first
+                if not scrapper.logged_in and not scrapper.ensure_session():
+                    print(f"Worker {worker_id} could not log in again, stopping")
+                    break
+                try:
+                    index, link, attempt = jobs.get_nowait()
+                except queue.Empty:
+                    break
+                # One shared scheduler paces all workers of this account
+                outcome = scrapper.scrape_scheduled(link, attempt)
+                if outcome is None:
+                    break
+                result, error, retry = outcome
+                if retry:
+                    print(f"Re-queueing {link} (attempt {attempt}): {error}")
+                    jobs.put((index, link, attempt + 1))
+                    continue
+                records[index]["result"], records[index]["error"] = result, error
+                with self._first_lock:
+                    if not self._first_done:
+                        self._first_done = True
+                        self.parent.timer.record("start_to_first_profile",
+                                                 time.perf_counter() - self.started_at)
+                # Commit right away so a crash mid-batch keeps finished profiles
+                self.parent.record_result(
+                    link, records[index]["result"], records[index]["error"])
+        finally:
+            self.parent.timer.merge(scrapper.timer)
+            self.parent.page_metrics.extend(scrapper.page_metrics)
+            scrapper.close()
+
+    def run(self, links: List[str]) -> List[dict]:
+        """Scrape ``links`` and return one record per link in input order.
+
+        Each record is ``{"link": ..., "result": dict | None, "error": str | None}``.
+        """
+        records = [{"link": link, "result": None, "error": None}
+                   for link in links]
+        jobs = queue.Queue()
+        for index, link in enumerate(links):
+            jobs.put((index, link, 1))
+
+        self._first_done = False
+        self._first_lock = threading.Lock()
+        cookies = self.parent.driver.get_cookies()
+        threads = [
+            threading.Thread(target=self._worker,
+                             args=(worker_id, jobs, records, cookies),
+                             daemon=True)
+            for worker_id in range(min(self.size, len(links)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Links left over after a cancel (stay pending in the index) or when
+        # every worker failed to launch
+        cancelled = self.parent.cancelled()
+        for rec in records:
+            if rec["result"] is None and rec["error"] is None:
+                if cancelled:
+                    rec["error"] = "Cancelled"
+                    continue
+                rec["error"] = "No scraper worker was available"
+                self.parent.record_result(rec["link"], error=rec["error"])
+        return records
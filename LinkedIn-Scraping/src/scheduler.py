@@ -0,0 +1,143 @@
+import threading
+import time
+
+from .telemetry import TELEMETRY
+from .waits import AUTH_WALL, CHECKPOINT, NOT_FOUND, THROTTLED
+
+# Blocking pages worth retrying later; a missing profile is final.
+RETRYABLE_KINDS = (THROTTLED, CHECKPOINT, AUTH_WALL)
+
+
+class PageBlocked(Exception):
+    """Raised when a profile visit lands on something other than a profile."""
+
+    def __init__(self, kind: str, link: str):
+        super().__init__(f"{kind} page instead of profile for {link}")
+        self.kind = kind
+        self.link = link
+
+    @property
+    def retryable(self) -> bool:
+        return self.kind in RETRYABLE_KINDS
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until a token is free."""
+
+    def __init__(self, rate_per_s: float, capacity: float = 1.0):
+        self.rate = rate_per_s
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def set_rate(self, rate_per_s: float):
+        with self._lock:
+            self._refill()
+            self.rate = rate_per_s
+
+    def acquire(self, cancel_event: threading.Event = None) -> bool:
+        """Take one token; returns False if ``cancel_event`` fired while waiting."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if cancel_event is not None:
+                if cancel_event.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+
+
+class AdaptiveScheduler:
+    """Pace profile visits for one LinkedIn account (AIMD with backoff).
+
+    Every ``successes_to_increase`` clean profiles the rate grows by
+    ``increase_per_min``; a throttled page halves it and pauses all workers
+    with exponential backoff, a checkpoint cuts it to a quarter and pauses
+    longer. The rate always stays within [min_rate_per_min, max_rate_per_min].
+    """
+
+    def __init__(self, rate_per_min: float = 20, min_rate_per_min: float = 2,
+                 max_rate_per_min: float = 60, increase_per_min: float = 2,
+                 successes_to_increase: int = 10, backoff_base_s: float = 30,
+                 backoff_max_s: float = 900, max_attempts: int = 3):
+        self.rate_per_min = rate_per_min
+        self.min_rate_per_min = min_rate_per_min
+        self.max_rate_per_min = max_rate_per_min
+        self.increase_per_min = increase_per_min
+        self.successes_to_increase = successes_to_increase
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self.max_attempts = max_attempts
+        self.bucket = TokenBucket(rate_per_min / 60)
+        self.paused_until = 0.0
+        self.backoff_level = 0
+        self.streak = 0
+        self.counts = {"success": 0, THROTTLED: 0, CHECKPOINT: 0, AUTH_WALL: 0, NOT_FOUND: 0}
+        self.paused_s = 0.0
+        self._lock = threading.Lock()
+
+    def _set_rate(self, rate_per_min: float):
+        self.rate_per_min = max(self.min_rate_per_min, min(self.max_rate_per_min, rate_per_min))
+        self.bucket.set_rate(self.rate_per_min / 60)
+
+    def _pause(self, seconds: float):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        print(f"[scheduler] pausing {seconds:.0f}s, rate now {self.rate_per_min:.1f}/min")
+
+    def acquire(self, cancel_event: threading.Event = None) -> bool:
+        """Block until the next visit is allowed; False if cancelled meanwhile."""
+        while True:
+            wait = self.paused_until - time.monotonic()
+            if wait <= 0:
+                break
+            start = time.monotonic()
+            if cancel_event is not None:
+                if cancel_event.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+            with self._lock:
+                self.paused_s += time.monotonic() - start
+        return self.bucket.acquire(cancel_event)
+
+    def on_success(self):
+        with self._lock:
+            self.counts["success"] += 1
+            self.backoff_level = 0
+            self.streak += 1
+            if self.streak >= self.successes_to_increase:
+                self.streak = 0
+                self._set_rate(self.rate_per_min + self.increase_per_min)
+
+    def on_blocked(self, kind: str):
+        TELEMETRY.count("pages_blocked", kind=kind)
+        with self._lock:
+            self.counts[kind] = self.counts.get(kind, 0) + 1
+            self.streak = 0
+            if kind == THROTTLED:
+                self._set_rate(self.rate_per_min / 2)
+                self.backoff_level += 1
+                self._pause(min(self.backoff_max_s,
+                                self.backoff_base_s * 2 ** (self.backoff_level - 1)))
+            elif kind == CHECKPOINT:
+                self._set_rate(self.rate_per_min / 4)
+                self.backoff_level += 1
+                self._pause(min(self.backoff_max_s,
+                                4 * self.backoff_base_s * 2 ** (self.backoff_level - 1)))
+            elif kind == AUTH_WALL:
+                self._set_rate(self.rate_per_min / 2)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"rate_per_min": round(self.rate_per_min, 2),
+                    "paused_s": round(self.paused_s, 1)} | self.counts
@@ -1,54 +1,171 @@
-import time
 import json
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+import time
+from collections import deque
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, JavascriptException, TimeoutException
 from typing import List
 from dotenv import load_dotenv
 import os
 from pathlib import Path
 import pandas as pd
+from .driver import DriverManager, is_dead_session_error
+from .extraction import (ABOUT_BODY_SELECTOR, ALLOWED_COLUMNS, CARD_CLASS, COMPANY_SELECTOR, HEADLINE_SELECTOR,
+                         LOCATION_SELECTOR, NAME_SELECTOR, SECTION_HEADING_SELECTOR, extract_profile)
+from .index import ScrapeIndex, normalize_profile_url
+from .network import collect_page_metrics, summarize_page_metrics
+from .scheduler import AdaptiveScheduler, PageBlocked
+from .sinks import ParquetSink
+from .snapshots import SnapshotStore
+from .telemetry import TELEMETRY
+from .waits import (AUTH_WALL, DEFAULT_TIMEOUTS, PROFILE, StageTimer, wait_for_document_ready,
+                    wait_for_login_fields, wait_for_login_result, wait_for_profile)
 
 load_dotenv()
 
 
+def records_to_dataframe(results) -> pd.DataFrame:
+    """Build a DataFrame from profile records, JSON-encoding nested sections."""
+    # Normalize input to a list of records
+    records = results if isinstance(results, list) else [results]
+
+    # Convert nested structures to JSON strings for stable CSV columns
+    normalized_records = []
+    for rec in records:
+        safe_rec = {}
+        for k, v in rec.items():
+            if isinstance(v, (dict, list)):
+                try:
+                    safe_rec[k] = json.dumps(v, ensure_ascii=False)
+                except Exception:
+                    safe_rec[k] = str(v)
+            else:
+                safe_rec[k] = v
+        normalized_records.append(safe_rec)
+
+    return pd.DataFrame(normalized_records)
+
+
 class LinkedInScapper:
-    def __init__(self):
+    def __init__(self, profile_dir: str = "selenium_profile", timeouts: dict = None,
+                 snapshot_store: SnapshotStore = None, index: ScrapeIndex = None,
+                 sink: ParquetSink = None, lightweight: bool = False, measure_pages: bool = False,
+                 scheduler: AdaptiveScheduler = None):
         self.chromedriver_path = "./chromedriver-linux64/chromedriver"
-        options = Options()
-        options.add_argument("--start-maximized")
-        options.add_argument("user-data-dir=selenium_profile")
-        options.add_argument("--profile-directory=Default")
-        # Initialize driver
-        service = Service(self.chromedriver_path)
-        self.driver = webdriver.Chrome(service=service, options=options)
+        self.profile_dir = profile_dir
+        # Browser is launched lazily and kept warm between scrape() calls
+        self.driver_manager = DriverManager(self.chromedriver_path, self.profile_dir,
+                                            lightweight=lightweight, measure_pages=measure_pages)
+        # Per-page transferred bytes / load time, filled when measure_pages is on
+        self.page_metrics = []
+        # Paces profile visits for this account and backs off when LinkedIn pushes back
+        self.scheduler = scheduler or AdaptiveScheduler()
+        # Set for the duration of scrape(): per-profile callback and cancel flag
+        self.on_result = None
+        self.cancel_event = None
+        self.logged_in = False
         self.linkedin_id = os.getenv("LINKEDIN_ID")
         self.linkedin_pass = os.getenv("LINKEDIN_PASS")
-        self.allowed_columns = ["Experience", "Education", "Licenses & certifications", "Projects",
-                                "Skills", "Publications", "Courses", "Honors & awards", "Languages"]
+        self.allowed_columns = list(ALLOWED_COLUMNS)
+        # Optional archive of rendered pages for offline re-extraction
+        self.snapshot_store = snapshot_store
+        # Per-link errors from the last run, as {"link": ..., "error": ...}
+        self.errors = []
+        # Persistent record of scraped profiles (skip fresh ones, resume after a crash)
+        self.index = index or ScrapeIndex()
+        # Streaming columnar output (Parquet) alongside the CSV export
+        self.sink = sink or ParquetSink()
+        # Per-stage wait budgets (seconds) and the measured time spent waiting
+        self.timeouts = DEFAULT_TIMEOUTS | (timeouts or {})
+        self.timer = StageTimer()
+
+    @property
+    def driver(self):
+        return self.driver_manager.driver
+
+    def close(self):
+        """Quit the browser; the next scrape() launches a fresh one."""
+        self.driver_manager.quit()
+        self.logged_in = False
+
+    def ensure_session(self) -> bool:
+        """Make sure a live, logged-in browser is ready; returns False if login fails."""
+        with self.timer.stage("browser_health"):
+            relaunched = self.driver_manager.ensure_alive()
+        if relaunched:
+            self.timer.record("browser_launch", self.driver_manager.last_launch_s)
+            self.logged_in = False
+        if self.logged_in:
+            # Warm browser that already passed the login check this session
+            return True
+
+        self.driver.get("https://www.linkedin.com/login")
+        with self.timer.stage("login_page"):
+            wait_for_document_ready(self.driver, self.timeouts["login_page"])
+        print(self.driver.title)
+        # Check if already logged in (persistent profile or restored cookies)
+        if self.driver.title == "LinkedIn Login, Sign in | LinkedIn":
+            if not self.login():
+                return False
+        self.logged_in = True
+        self.driver_manager.save_cookies()
+        return True
+
+    def scrape_with_recovery(self, link: str) -> dict:
+        """Scrape one profile, relaunching the browser once if it died mid-batch."""
+        try:
+            return self.scrape_profile(link)
+        except Exception as e:
+            if not is_dead_session_error(e):
+                raise
+            print(f"Browser died while scraping {link}, relaunching: {e}")
+            if not self.ensure_session():
+                raise
+            return self.scrape_profile(link)
+
+    def scrape_scheduled(self, link: str, attempt: int = 1):
+        """Scrape one profile under the adaptive rate scheduler.
+
+        Returns ``(record, error, retry)`` where ``retry`` means the link should
+        go back on the queue (throttled, checkpoint, auth wall or timeout), or
+        None if the batch was cancelled while waiting for a slot.
+        """
+        if not self.scheduler.acquire(self.cancel_event):
+            return None
+        can_retry = attempt < self.scheduler.max_attempts
+        try:
+            record = self.scrape_with_recovery(link)
+        except PageBlocked as e:
+            self.scheduler.on_blocked(e.kind)
+            if e.kind == AUTH_WALL:
+                self.logged_in = False
+            return None, str(e), e.retryable and can_retry
+        except TimeoutException as e:
+            return None, f"TimeoutException: {e.msg or 'page did not settle'}", can_retry
+        except Exception as e:
+            return None, f"{type(e).__name__}: {e}", False
+        self.scheduler.on_success()
+        return record, None, False
 
     def login(self):
         """Login to LinkedIn using provided credentials."""
         try:
+            with self.timer.stage("login_fields"):
+                wait_for_login_fields(self.driver, self.timeouts)
             email_field = self.driver.find_element(By.ID, "username")
             password_field = self.driver.find_element(By.ID, "password")
-        except NoSuchElementException:
+        except (TimeoutException, NoSuchElementException):
             try:
                 details_btn = self.driver.find_element(
                     By.CSS_SELECTOR, "button.member-profile__details")
                 try:
                     details_btn.click()
-                    # Fill Captcha
-                    time.sleep(30)
                 except ElementClickInterceptedException:
                     # If click is intercepted, try via JS as a last resort
                     self.driver.execute_script(
                         "arguments[0].click();", details_btn)
-                # small wait for UI to update
-                time.sleep(1)
-                # retry locating the login fields once
+                # wait for the form (and any captcha in front of it)
+                with self.timer.stage("login_fields"):
+                    wait_for_login_fields(self.driver, self.timeouts)
                 email_field = self.driver.find_element(By.ID, "username")
                 password_field = self.driver.find_element(By.ID, "password")
             except Exception:
@@ -59,14 +176,17 @@ class LinkedInScapper:
         email_field.send_keys(self.linkedin_id)
         password_field.send_keys(self.linkedin_pass)
         # Locate and click "Sign in" button
-        time.sleep(1)
         sign_in_button = self.driver.find_element(
             By.CSS_SELECTOR, 'button[aria-label="Sign in"]')
         sign_in_button.click()
-        # Fill captcha
-        time.sleep(30)
+        # Wait for the redirect, pausing for a captcha only if one shows up
+        try:
+            with self.timer.stage("login_result"):
+                logged_in = wait_for_login_result(self.driver, self.timeouts)
+        except TimeoutException:
+            return False
         # Check if login was successful
-        if "LinkedIn" in self.driver.title:
+        if logged_in and "LinkedIn" in self.driver.title:
             return True
         else:
             return False
@@ -74,21 +194,21 @@ class LinkedInScapper:
     def scrape_user_info(self, cards):
         """Scrape User Info and about section from the profile."""
         # Scrape User Info
-        name = cards[0].find_element(By.CSS_SELECTOR, "h1").text
+        name = cards[0].find_element(By.CSS_SELECTOR, NAME_SELECTOR).text
         headline = cards[0].find_element(
-            By.CSS_SELECTOR, "div.text-body-medium").text
+            By.CSS_SELECTOR, HEADLINE_SELECTOR).text
         location = cards[0].find_element(
-            By.CSS_SELECTOR, "span.text-body-small.inline.t-black--light.break-words").text
+            By.CSS_SELECTOR, LOCATION_SELECTOR).text
         company = cards[0].find_elements(
-            By.CSS_SELECTOR, "ul li span.t-black")[0].text
+            By.CSS_SELECTOR, COMPANY_SELECTOR)[0].text
         about_elem = cards[1].find_element(
-            By.CSS_SELECTOR, "h2.pvs-header__title span[aria-hidden='true']")
+            By.CSS_SELECTOR, SECTION_HEADING_SELECTOR)
         about_text = about_elem.text.strip()
         about_body = ""
         if about_text.lower() == "about":
             # Step 2: Extract the 'About' section text
             about_elem = cards[1].find_element(
-                By.CSS_SELECTOR, "div.inline-show-more-text--is-collapsed span[aria-hidden='true']")
+                By.CSS_SELECTOR, ABOUT_BODY_SELECTOR)
             about_body = about_elem.text.strip()
 
         # Format Data
@@ -111,7 +231,7 @@ class LinkedInScapper:
             # Scrape heading
             try:
                 heading_el = card.find_element(
-                    By.CSS_SELECTOR, "h2.pvs-header__title span[aria-hidden='true']")
+                    By.CSS_SELECTOR, SECTION_HEADING_SELECTOR)
                 heading = heading_el.text.strip()
                 if heading not in self.allowed_columns:
                     continue  # skip unwanted sections
@@ -140,35 +260,40 @@ class LinkedInScapper:
 
     def scrape_profile(self, link):
         """Scrape a single LinkedIn profile."""
-        self.driver.get(link)
-        time.sleep(3)
-        cards = self.driver.find_elements(By.CLASS_NAME, "artdeco-card")
+        measure = self.driver_manager.measure_pages
+        if measure:
+            collect_page_metrics(self.driver)  # drain entries from earlier pages
+        start = time.perf_counter()
+        with TELEMETRY.span("selenium.profile_load", lightweight=self.driver_manager.lightweight):
+            self.driver.get(link)
+            with self.timer.stage("profile"):
+                kind = wait_for_profile(self.driver, self.timeouts)
+        if measure:
+            self.page_metrics.append(collect_page_metrics(self.driver) | {
+                "link": link, "load_s": time.perf_counter() - start})
+        if kind != PROFILE:
+            raise PageBlocked(kind, link)
+        if self.snapshot_store is not None:
+            self.snapshot_store.save(link, self.driver.page_source)
+        try:
+            # Whole profile in a single execute_script round-trip
+            return extract_profile(self.driver, self.allowed_columns)
+        except JavascriptException as e:
+            print(f"In-page extraction failed, falling back to element walk: {e}")
+        cards = self.driver.find_elements(By.CLASS_NAME, CARD_CLASS)
         profile_data = self.scrape_user_info(cards[:2])
         sections_data = self.scrape_sections(
             cards=cards[2:])  # pass remaining cards for sections
         final_dict = profile_data | sections_data
         return final_dict
 
+    def results_to_dataframe(self, results) -> pd.DataFrame:
+        """Convert scraped results to a pandas DataFrame with JSON-string section columns."""
+        return records_to_dataframe(results)
+
     def results_to_dataframe_and_csv(self, results, csv_path: str = "scraped_profiles/linkedin_data.csv") -> pd.DataFrame:
         """Convert scraped results to a pandas DataFrame and persist to CSV."""
-        # Normalize input to a list of records
-        records = results if isinstance(results, list) else [results]
-
-        # Convert nested structures to JSON strings for stable CSV columns
-        normalized_records = []
-        for rec in records:
-            safe_rec = {}
-            for k, v in rec.items():
-                if isinstance(v, (dict, list)):
-                    try:
-                        safe_rec[k] = json.dumps(v, ensure_ascii=False)
-                    except Exception:
-                        safe_rec[k] = str(v)
-                else:
-                    safe_rec[k] = v
-            normalized_records.append(safe_rec)
-
-        df = pd.DataFrame(normalized_records)
+        df = self.results_to_dataframe(results)
 
         # Ensure target directory exists
         csv_file = Path(csv_path)
@@ -178,7 +303,14 @@ class LinkedInScapper:
         if csv_file.exists():
             try:
                 existing_cols = pd.read_csv(csv_file, nrows=0).columns.tolist()
-                # Ensure all existing columns are present; drop extras to keep consistency
+                new_cols = [col for col in df.columns if col not in existing_cols]
+                if new_cols:
+                    # A new section showed up: rewrite once with the widened header
+                    # instead of silently dropping the new columns
+                    merged = pd.concat([pd.read_csv(csv_file), df], ignore_index=True)
+                    merged.to_csv(csv_file, index=False)
+                    return df
+                # Ensure all existing columns are present
                 for col in existing_cols:
                     if col not in df.columns:
                         df[col] = None
@@ -192,21 +324,125 @@ class LinkedInScapper:
 
         return df
 
-    def scrape(self, links: List[str]):
-        """Main function to scrape multiple LinkedIn profiles."""
-        self.driver.get("https://www.linkedin.com/login")
-        time.sleep(3)
-        print(self.driver.title)
-        # Check if already logged in
-        if self.driver.title == "LinkedIn Login, Sign in | LinkedIn":
-            response = self.login()
-            if not response:
-                return {"status": "error", "error": "Cannot LogIn Successfully"}
-        # time.sleep(50)
-        results = []
+    def record_result(self, link: str, result: dict = None, error: str = None):
+        """Commit one profile's outcome to the scrape index as soon as it is known."""
+        TELEMETRY.count("profiles", outcome="scraped" if error is None else "failed")
+        if error is None:
+            self.index.mark_done(link, result)
+            self.sink.write(result, url=normalize_profile_url(link))
+        else:
+            print(f"Failed to scrape {link}: {error}")
+            self.index.mark_failed(link, error)
+            self.errors.append({"link": link, "error": error})
+        if self.on_result is not None:
+            self.on_result(link, result, error)
+
+    def cancelled(self) -> bool:
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def pending_links(self, links: List[str], refresh: bool = False) -> List[str]:
+        """Drop duplicates and, unless ``refresh``, profiles still fresh in the index."""
+        seen = set()
+        pending = []
         for link in links:
-            results.append(self.scrape_profile(link))
+            key = normalize_profile_url(link)
+            if key in seen:
+                continue
+            seen.add(key)
+            if refresh or not self.index.is_fresh(link):
+                pending.append(link)
+        return pending
 
-        df = self.results_to_dataframe_and_csv(results)
-        self.driver.quit()
-        return df
+    def export_pending(self):
+        """Append every scraped-but-unexported record to the CSV.
+
+        This also picks up profiles committed by a run that crashed before
+        reaching its CSV export.
+        """
+        unexported = self.index.unexported()
+        if unexported:
+            self.results_to_dataframe_and_csv([record for _, record in unexported])
+            self.index.mark_exported([url for url, _ in unexported])
+
+    def scrape(self, links: List[str], workers: int = 1, refresh: bool = False,
+               on_result=None, cancel_event=None):
+        """Main function to scrape multiple LinkedIn profiles.
+
+        Profiles scraped within the index TTL are served from the index unless
+        ``refresh`` is set. With ``workers > 1`` the links are spread over a
+        pool of Chrome workers that reuse this session's login (see ``src/pool.py``).
+        ``on_result(link, record, error)`` is called as each profile finishes,
+        and setting ``cancel_event`` stops the batch after the profiles in flight.
+        """
+        self.timer = StageTimer()
+        self.errors = []
+        self.page_metrics = []
+        self.on_result = on_result
+        self.cancel_event = cancel_event
+        try:
+            return self._scrape(links, workers, refresh)
+        finally:
+            self.on_result = None
+            self.cancel_event = None
+
+    def _scrape(self, links: List[str], workers: int, refresh: bool):
+        batch_start = time.perf_counter()
+        pending = self.pending_links(links, refresh)
+        print(f"{len(links) - len(pending)} profile(s) fresh in index, {len(pending)} to scrape")
+        # Profiles served from the index, reported up front under the caller's own link
+        pending_keys = {normalize_profile_url(l) for l in pending}
+        served_links = {}
+        for link in links:
+            key = normalize_profile_url(link)
+            if key not in pending_keys:
+                served_links.setdefault(key, link)
+        results = self.index.records(list(served_links.values()))
+        if self.on_result is not None:
+            for key, record in results.items():
+                self.on_result(served_links[key], record, None)
+        if pending:
+            if not self.ensure_session():
+                return {"status": "error", "error": "Cannot LogIn Successfully"}
+            for link in pending:
+                self.index.mark_pending(link)
+            if workers > 1:
+                # Imported here to avoid a circular import (pool builds scrappers)
+                from .pool import ScrapperPool
+                for rec in ScrapperPool(self, size=workers, started_at=batch_start).run(pending):
+                    if rec["result"] is not None:
+                        results[normalize_profile_url(rec["link"])] = rec["result"]
+            else:
+                queue = deque((link, 1) for link in pending)
+                first = True
+                while queue:
+                    if self.cancelled():
+                        print(f"Scrape cancelled, {len(queue)} profile(s) left pending")
+                        break
+                    # Auth wall seen on the previous profile: log in again first
+                    if not self.logged_in and not self.ensure_session():
+                        return {"status": "error", "error": "Cannot LogIn Successfully"}
+                    link, attempt = queue.popleft()
+                    outcome = self.scrape_scheduled(link, attempt)
+                    if outcome is None:
+                        break
+                    record, error, retry = outcome
+                    if retry:
+                        print(f"Re-queueing {link} (attempt {attempt}): {error}")
+                        queue.append((link, attempt + 1))
+                    else:
+                        self.record_result(link, record, error)
+                        if record is not None:
+                            results[normalize_profile_url(link)] = record
+                    if first:
+                        first = False
+                        self.timer.record("start_to_first_profile",
+                                          time.perf_counter() - batch_start)
+
+        self.sink.flush()
+        self.export_pending()
+        self.timer.report()
+        print(f"[scheduler] {self.scheduler.stats()}")
+        if self.page_metrics:
+            print(f"[pages] {summarize_page_metrics(self.page_metrics)}")
+        return self.results_to_dataframe(
+            [results[key] for key in dict.fromkeys(normalize_profile_url(l) for l in links) if key in results])
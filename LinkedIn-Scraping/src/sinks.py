@@ -0,0 +1,144 @@
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .extraction import ALLOWED_COLUMNS
+
+# Section items keep their native shape instead of JSON strings in CSV cells
+ITEMS_TYPE = pa.list_(pa.struct([("id", pa.int64()), ("item", pa.string())]))
+BASE_FIELDS = [
+    pa.field("url", pa.string()),
+    pa.field("scraped_at", pa.timestamp("us", tz="UTC")),
+    pa.field("Name", pa.string()),
+    pa.field("Headline", pa.string()),
+    pa.field("Company", pa.string()),
+    pa.field("Location", pa.string()),
+    pa.field("About", pa.string()),
+]
+METADATA_FILE = "_common_metadata"
+
+
+def field_for(name: str, value) -> pa.Field:
+    """Arrow field for a record key: item lists for sections, strings otherwise."""
+    if name in ALLOWED_COLUMNS or isinstance(value, list):
+        return pa.field(name, ITEMS_TYPE)
+    return pa.field(name, pa.string())
+
+
+class ParquetSink:
+    """Stream profile records into date-partitioned Parquet files.
+
+    Records are buffered and written every ``batch_size`` profiles as a new
+    part file under ``scraped_date=YYYY-MM-DD/``. When a batch introduces a
+    new column (e.g. a newly supported section) the dataset-wide schema in
+    ``_common_metadata`` is widened, so older files simply read it as null.
+    """
+
+    def __init__(self, root: str = "scraped_profiles/parquet", batch_size: int = 25):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def write(self, record: dict, url: str = None):
+        """Buffer one profile; flushes automatically once the batch is full."""
+        row = {"url": url, "scraped_at": datetime.now(timezone.utc)} | record
+        with self._lock:
+            self._buffer.append(row)
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        rows, self._buffer = self._buffer, []
+
+        fields = {f.name: f for f in BASE_FIELDS}
+        for row in rows:
+            for key, value in row.items():
+                if key not in fields:
+                    fields[key] = field_for(key, value)
+        schema = pa.schema(list(fields.values()))
+
+        # A batch that spans midnight is split so every row lands in its own day
+        by_date = {}
+        for row in rows:
+            by_date.setdefault(f"{row['scraped_at']:%Y-%m-%d}", []).append(row)
+        for date, date_rows in by_date.items():
+            partition = self.root / f"scraped_date={date}"
+            partition.mkdir(parents=True, exist_ok=True)
+            pq.write_table(pa.Table.from_pylist(date_rows, schema=schema),
+                           partition / f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet",
+                           compression="zstd")
+        self._merge_schema(schema)
+
+    def _merge_schema(self, schema: pa.Schema):
+        metadata_path = self.root / METADATA_FILE
+        if metadata_path.exists():
+            current = pq.read_schema(metadata_path)
+            merged = pa.unify_schemas([current, schema])
+            if merged.equals(current):
+                return
+        else:
+            merged = schema
+        pq.write_metadata(merged, metadata_path)
+
+
+def dataset_schema(root: str = "scraped_profiles/parquet") -> pa.Schema:
+    """Union schema of every part file, as maintained by ``ParquetSink``."""
+    return pq.read_schema(Path(root) / METADATA_FILE)
+
+
+def has_data(root: str = "scraped_profiles/parquet") -> bool:
+    """True once a batch has been flushed under ``root`` (the first flush writes the schema)."""
+    return (Path(root) / METADATA_FILE).exists()
+
+
+def _empty_table(columns=None) -> pa.Table:
+    fields = {f.name: f for f in BASE_FIELDS}
+    names = columns or list(fields)
+    return pa.schema([fields.get(name) or field_for(name, None) for name in names]).empty_table()
+
+
+def open_dataset(root: str = "scraped_profiles/parquet") -> ds.Dataset:
+    partition = pa.field("scraped_date", pa.string())
+    # Files starting with "_" (like _common_metadata) are skipped by discovery
+    return ds.dataset(root, format="parquet",
+                      partitioning=ds.partitioning(pa.schema([partition]), flavor="hive"),
+                      schema=dataset_schema(root).append(partition))
+
+
+def load_profiles(root: str = "scraped_profiles/parquet", columns=None, filter=None):
+    """Load (optionally projected and filtered) profiles as a pandas DataFrame.
+
+    Example: ``load_profiles(columns=["Name", "Company"], filter=ds.field("Company") == "Acme")``.
+    Only the requested columns and matching row groups are read. Rows still
+    buffered in a ``ParquetSink`` are not visible until its ``flush()``; with
+    nothing flushed yet the result is an empty DataFrame.
+    """
+    if not has_data(root):
+        return _empty_table(columns).to_pandas()
+    return open_dataset(root).to_table(columns=columns, filter=filter).to_pandas()
+
+
+def iter_profiles(root: str = "scraped_profiles/parquet", columns=None, filter=None,
+                  batch_size: int = 64_000):
+    """Yield DataFrames of at most ``batch_size`` rows for memory-bounded scans.
+
+    Like ``load_profiles``, only flushed rows are seen; with none nothing is yielded.
+    """
+    if not has_data(root):
+        return
+    for batch in open_dataset(root).to_batches(columns=columns, filter=filter, batch_size=batch_size):
+        yield batch.to_pandas()
@@ -0,0 +1,91 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:  # gzip from the stdlib is always available
+    zstandard = None
+
+CODEC_SUFFIX = {"zstd": ".html.zst", "gzip": ".html.gz"}
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class SnapshotStore:
+    """Content-addressed, compressed archive of rendered profile pages.
+
+    Page bodies are stored once per SHA-256 digest under ``objects/`` and an
+    append-only ``index.jsonl`` maps every (profile URL, timestamp) to a digest,
+    so identical re-scrapes cost no extra disk space.
+    """
+
+    def __init__(self, root: str = "scraped_profiles/snapshots", codec: str = None):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / "index.jsonl"
+        self.codec = codec or ("zstd" if zstandard else "gzip")
+        if self.codec == "zstd" and zstandard is None:
+            raise ValueError("zstd codec requested but 'zstandard' is not installed")
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def object_path(self, digest: str, codec: str) -> Path:
+        return self.objects_dir / digest[:2] / (digest + CODEC_SUFFIX[codec])
+
+    def save(self, url: str, html: str, scraped_at: str = None) -> dict:
+        """Store ``html`` for ``url`` and return its index entry."""
+        raw = html.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self.object_path(digest, self.codec)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent workers never see a partial object
+            tmp = path.with_suffix(path.suffix + f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(compress(raw, self.codec))
+            os.replace(tmp, path)
+
+        entry = {
+            "url": url,
+            "scraped_at": scraped_at or datetime.now(timezone.utc).isoformat(),
+            "digest": digest,
+            "codec": self.codec,
+            "size": len(raw),
+        }
+        with self._lock, open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        return entry
+
+    def load(self, entry: dict) -> str:
+        """Return the decompressed HTML for an index entry."""
+        path = self.object_path(entry["digest"], entry["codec"])
+        return decompress(path.read_bytes(), entry["codec"]).decode("utf-8")
+
+    def entries(self, latest_only: bool = True) -> list:
+        """Read the index; by default keep only the newest snapshot per URL."""
+        if not self.index_path.exists():
+            return []
+        with open(self.index_path, encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        if not latest_only:
+            return entries
+        latest = {}
+        for entry in entries:
+            current = latest.get(entry["url"])
+            if current is None or entry["scraped_at"] >= current["scraped_at"]:
+                latest[entry["url"]] = entry
+        return list(latest.values())
@@ -0,0 +1,347 @@
+"""Timing spans, counters and Gemini token/cost accounting.
+
+The same module ships in every app of this repository (AI_Article_generate,
+Autodialer, LinkedIn-Scraping). The apps are deployed separately, so each
+keeps a copy; tests/test_shared_files.py in every app fails if they differ.
+
+Exports, both optional, read by ``start_telemetry``:
+    TELEMETRY_JSONL=telemetry.jsonl   append every span and event as one JSON line
+    TELEMETRY_PORT=9464               serve Prometheus text format on 127.0.0.1:9464/metrics
+
+Importing this module has no side effects: each app's entry point (the
+Streamlit script, the CLIs) loads its .env and then calls ``start_telemetry``.
+Each Streamlit app also shows the numbers in a Diagnostics expander
+(``diagnostics_panel``).
+"""
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+APP_NAME = Path(__file__).resolve().parents[1].name
+# Percentiles are computed over the latest durations of each span
+WINDOW = 1000
+
+# USD per million tokens: (input, cached input, output including thinking).
+# Paid-tier list prices for prompts up to 200k tokens; update when they change.
+GEMINI_PRICES = {
+    "gemini-2.5-pro": (1.25, 0.125, 10.00),
+    "gemini-2.5-flash": (0.30, 0.03, 2.50),
+    "gemini-2.5-flash-lite": (0.10, 0.01, 0.40),
+}
+TOKEN_KINDS = ("input", "cached", "output", "thinking")
+
+
+def _key(name: str, labels: dict) -> tuple:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None))
+
+
+def _percentile(ordered: list, q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _label_text(labels) -> str:
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return ",".join(f'{k}="{escape(v)}"' for k, v in labels)
+
+
+class Telemetry:
+    """Thread-safe store of span durations and counters for one process.
+
+    Spans are identified by a name plus labels, e.g.
+    ``span("twilio.calls.create")`` or ``observe("stage", 0.4, stage="login")``;
+    each keeps a count, an error count, a running total and the latest
+    ``WINDOW`` durations.
+    """
+
+    def __init__(self, app: str = APP_NAME, jsonl_path: str = None):
+        self.app = app
+        self.jsonl_path = jsonl_path
+        self.metrics_port = None  # set once start_telemetry serves /metrics
+        self.started_at = time.time()
+        self._spans = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._jsonl = None
+        self._jsonl_lock = threading.Lock()
+
+    def _emit(self, event: dict):
+        if not self.jsonl_path:
+            return
+        line = json.dumps({"ts": round(time.time(), 3), "app": self.app, **event}, default=str)
+        with self._jsonl_lock:
+            if self._jsonl is None:
+                if os.path.dirname(self.jsonl_path):
+                    os.makedirs(os.path.dirname(self.jsonl_path), exist_ok=True)
+                self._jsonl = open(self.jsonl_path, "a", encoding="utf-8", buffering=1)
+            self._jsonl.write(line + "\n")
+
+    @contextmanager
+    def span(self, name: str, **labels):
+        """Time the block; an exception is counted as an error and re-raised."""
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - start, error=error, **labels)
+
+    def timed(self, name: str, **labels):
+        """Decorator form of ``span``."""
+        def decorate(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(name, **labels):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def observe(self, name: str, seconds: float, error: str = None, **labels):
+        """Record a duration measured elsewhere."""
+        key = _key(name, labels)
+        with self._lock:
+            stats = self._spans.get(key)
+            if stats is None:
+                stats = self._spans[key] = {"count": 0, "errors": 0, "total_s": 0.0, "max_s": 0.0,
+                                            "recent": deque(maxlen=WINDOW)}
+            stats["count"] += 1
+            stats["errors"] += error is not None
+            stats["total_s"] += seconds
+            stats["max_s"] = max(stats["max_s"], seconds)
+            stats["recent"].append(seconds)
+        self._emit({"kind": "span", "name": name, "labels": dict(key[1]),
+                    "seconds": round(seconds, 6), "error": error})
+
+    def _add(self, name: str, value: float, labels: dict):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def count(self, name: str, value: float = 1, **labels):
+        self._add(name, value, labels)
+        self._emit({"kind": "counter", "name": name, "labels": dict(_key(name, labels)[1]), "value": value})
+
+    def record_tokens(self, model: str, input_tokens: int = 0, output_tokens: int = 0,
+                      thinking_tokens: int = 0, cached_tokens: int = 0, **labels) -> float:
+        """Count one Gemini request's tokens and estimated cost; returns the cost in USD.
+
+        ``input_tokens`` includes ``cached_tokens``; ``output_tokens``
+        excludes ``thinking_tokens``, which are billed as output.
+        """
+        model = (model or "unknown").split("/")[-1]
+        tokens = {"input": input_tokens or 0, "cached": cached_tokens or 0,
+                  "output": output_tokens or 0, "thinking": thinking_tokens or 0}
+        price = GEMINI_PRICES.get(model)
+        cost = 0.0
+        if price:
+            cost = ((tokens["input"] - tokens["cached"]) * price[0] + tokens["cached"] * price[1]
+                    + (tokens["output"] + tokens["thinking"]) * price[2]) / 1_000_000
+        self._add("gemini_requests", 1, {"model": model, **labels})
+        for kind, n in tokens.items():
+            if n:
+                self._add("gemini_tokens", n, {"model": model, "kind": kind, **labels})
+        self._add("gemini_cost_usd", cost, {"model": model, **labels})
+        self._emit({"kind": "usage", "name": "gemini", "labels": {"model": model, **labels},
+                    "tokens": tokens, "cost_usd": round(cost, 8)})
+        return cost
+
+    def record_gemini_usage(self, model: str, usage_metadata, **labels) -> float:
+        """``record_tokens`` from a google-genai response's ``usage_metadata``."""
+        if usage_metadata is None:
+            return 0.0
+        return self.record_tokens(
+            model,
+            input_tokens=getattr(usage_metadata, "prompt_token_count", None),
+            output_tokens=getattr(usage_metadata, "candidates_token_count", None),
+            thinking_tokens=getattr(usage_metadata, "thoughts_token_count", None),
+            cached_tokens=getattr(usage_metadata, "cached_content_token_count", None),
+            **labels)
+
+    def span_rows(self) -> list:
+        """One row per span and label set, most total time first (the hot spots)."""
+        with self._lock:
+            items = [(key, dict(stats, recent=sorted(stats["recent"]))) for key, stats in self._spans.items()]
+        rows = []
+        for (name, labels), stats in items:
+            recent = stats["recent"]
+            rows.append({
+                "span": name,
+                "labels": ", ".join(f"{k}={v}" for k, v in labels),
+                "count": stats["count"],
+                "errors": stats["errors"],
+                "total_s": round(stats["total_s"], 3),
+                "mean_ms": round(stats["total_s"] / stats["count"] * 1000, 1),
+                "p50_ms": round(_percentile(recent, 0.50) * 1000, 1),
+                "p95_ms": round(_percentile(recent, 0.95) * 1000, 1),
+                "max_ms": round(stats["max_s"] * 1000, 1),
+            })
+        return sorted(rows, key=lambda r: r["total_s"], reverse=True)
+
+    def counter_rows(self) -> list:
+        with self._lock:
+            items = list(self._counters.items())
+        return [{"counter": name, "labels": ", ".join(f"{k}={v}" for k, v in labels), "value": value}
+                for (name, labels), value in sorted(items)]
+
+    def usage_summary(self) -> dict:
+        """Gemini requests, tokens per kind and cost, totalled per model."""
+        summary = {}
+        with self._lock:
+            items = list(self._counters.items())
+        for (name, labels), value in items:
+            labels = dict(labels)
+            if not name.startswith("gemini_") or "model" not in labels:
+                continue
+            model = summary.setdefault(labels["model"], {"requests": 0, **dict.fromkeys(TOKEN_KINDS, 0),
+                                                         "cost_usd": 0.0})
+            if name == "gemini_requests":
+                model["requests"] += value
+            elif name == "gemini_tokens":
+                model[labels["kind"]] += value
+            elif name == "gemini_cost_usd":
+                model["cost_usd"] = round(model["cost_usd"] + value, 6)
+        return summary
+
+    def prometheus(self) -> str:
+        """All spans and counters in the Prometheus text exposition format."""
+        app = ("app", self.app)
+        with self._lock:
+            spans = [(key, stats["count"], stats["errors"], stats["total_s"], sorted(stats["recent"]))
+                     for key, stats in self._spans.items()]
+            counters = list(self._counters.items())
+        lines = ["# HELP span_seconds Duration of instrumented operations; quantiles over the latest "
+                 f"{WINDOW} per series.", "# TYPE span_seconds summary"]
+        errors = ["# HELP span_errors_total Instrumented operations that raised.",
+                  "# TYPE span_errors_total counter"]
+        for (name, labels), count, error_count, total, recent in spans:
+            series = [app, ("span", name), *labels]
+            for q in (0.5, 0.95, 0.99):
+                lines.append(f"span_seconds{{{_label_text(series + [('quantile', q)])}}} "
+                             f"{_percentile(recent, q):.6f}")
+            lines.append(f"span_seconds_sum{{{_label_text(series)}}} {total:.6f}")
+            lines.append(f"span_seconds_count{{{_label_text(series)}}} {count}")
+            errors.append(f"span_errors_total{{{_label_text(series)}}} {error_count}")
+        lines += errors
+        by_name = {}
+        for (name, labels), value in counters:
+            by_name.setdefault(_metric_name(name) + "_total", []).append((labels, value))
+        for metric, series in sorted(by_name.items()):
+            lines.append(f"# TYPE {metric} counter")
+            lines += [f"{metric}{{{_label_text([app, *labels])}}} {value:g}" for labels, value in series]
+        lines.append(f"# TYPE process_start_time_seconds gauge\nprocess_start_time_seconds {self.started_at:.3f}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if urlparse(self.path).path != "/metrics":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = self.server.telemetry.prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class MetricsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+def start_metrics_server(telemetry: Telemetry, port: int, host: str = "127.0.0.1"):
+    """Serve ``/metrics`` on a background thread; returns None if the port is taken."""
+    try:
+        server = MetricsServer((host, port), MetricsHandler)
+    except OSError as e:
+        print(f"[telemetry] metrics endpoint not started on {host}:{port}: {e}")
+        return None
+    server.telemetry = telemetry
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    telemetry.metrics_port = server.server_address[1]
+    return server
+
+
+def start_telemetry(telemetry: Telemetry = None) -> Telemetry:
+    """Configure exports from the environment and start the metrics endpoint.
+
+    Reads ``TELEMETRY_APP``, ``TELEMETRY_JSONL`` and ``TELEMETRY_PORT``; call
+    it from an entry point after ``load_dotenv()``. Later calls (e.g. on
+    Streamlit reruns) do nothing.
+    """
+    global _started
+    telemetry = telemetry or TELEMETRY
+    with _start_lock:
+        if _started:
+            return telemetry
+        _started = True
+        telemetry.app = os.getenv("TELEMETRY_APP") or telemetry.app
+        telemetry.jsonl_path = os.getenv("TELEMETRY_JSONL") or telemetry.jsonl_path
+        port = int(os.getenv("TELEMETRY_PORT") or 0)
+        if port:
+            start_metrics_server(telemetry, port)
+    return telemetry
+
+
+def diagnostics_panel(telemetry: Telemetry = None):
+    """Streamlit expander with the slowest operations, Gemini usage and counters."""
+    import streamlit as st
+
+    telemetry = telemetry or TELEMETRY
+    with st.expander("Diagnostics"):
+        usage = telemetry.usage_summary()
+        if usage:
+            totals = {k: sum(m[k] for m in usage.values()) for k in ("requests", "input", "output",
+                                                                      "thinking", "cost_usd")}
+            cols = st.columns(4)
+            cols[0].metric("Gemini requests", totals["requests"])
+            cols[1].metric("Input tokens", f"{totals['input']:,}")
+            cols[2].metric("Output + thinking", f"{totals['output'] + totals['thinking']:,}")
+            cols[3].metric("Est. cost", f"${totals['cost_usd']:.4f}")
+        spans = telemetry.span_rows()
+        if spans:
+            st.dataframe(spans, hide_index=True)
+        else:
+            st.caption("Nothing measured yet in this process.")
+        counters = [row for row in telemetry.counter_rows() if not row["counter"].startswith("gemini_")]
+        if counters:
+            st.dataframe(counters, hide_index=True)
+        exports = []
+        if telemetry.jsonl_path:
+            exports.append(f"Events appended to `{telemetry.jsonl_path}`.")
+        if telemetry.metrics_port:
+            exports.append(f"Prometheus metrics on `127.0.0.1:{telemetry.metrics_port}/metrics`.")
+        st.caption(" ".join(exports) or "Set TELEMETRY_JSONL or TELEMETRY_PORT to export these numbers.")
+        if st.button("Reset", key="telemetry-reset"):
+            telemetry.reset()
+            st.rerun()
+
+
+TELEMETRY = Telemetry()
+_started = False
+_start_lock = threading.Lock()
@@ -0,0 +1,229 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .telemetry import TELEMETRY
+
+# Upper bounds (seconds) for each stage; a ready page returns immediately.
+DEFAULT_TIMEOUTS = {
+    "login_page": 15,     # login page (or feed redirect) finished loading
+    "login_fields": 10,   # username/password inputs present
+    "login_result": 30,   # redirect away from the login form after "Sign in"
+    "challenge": 180,     # user solving a captcha / checkpoint by hand
+    "profile": 20,        # profile top card rendered
+}
+
+POLL_INTERVAL = 0.1
+
+CHALLENGE_URL_MARKERS = ("/checkpoint/", "captcha", "/challenge")
+CHALLENGE_SELECTORS = (
+    "iframe[src*='captcha']",
+    "#captcha-internal",
+    "form#captcha-challenge",
+    "iframe#captcha-internal",
+)
+LOGIN_URL_MARKERS = ("/login", "/uas/login-submit")
+AUTH_WALL_URL_MARKERS = ("/authwall", "/signup", "/uas/login") + LOGIN_URL_MARKERS
+THROTTLE_STATUSES = (429, 999)
+THROTTLE_TEXT = ("too many requests", "you’ve reached the weekly limit", "unusual activity")
+NOT_FOUND_TEXT = ("this page doesn’t exist", "this page doesn't exist", "page not found")
+
+# Page kinds reported by classify_page
+PROFILE = "profile"
+CHECKPOINT = "checkpoint"
+AUTH_WALL = "auth_wall"
+THROTTLED = "throttled"
+NOT_FOUND = "not_found"
+LOADING = "loading"
+
+# Everything needed to classify a page, gathered in one execute_script call.
+# Body text is only read once the page is loaded and is not a profile.
+CLASSIFY_PAGE_JS = """
+const nav = performance.getEntriesByType("navigation")[0];
+const ready = document.readyState === "complete";
+const topCard = !!document.querySelector(".artdeco-card h1");
+let text = "";
+if (ready && !topCard && document.body) {
+    text = document.body.innerText.slice(0, 3000).toLowerCase();
+}
+return {
+    url: location.href,
+    title: document.title,
+    ready: ready,
+    status: nav ? (nav.responseStatus || 0) : 0,
+    topCard: topCard,
+    captcha: !!document.querySelector(arguments[0]),
+    text: text,
+};
+"""
+
+
+class StageTimer:
+    """Collect measured wait durations per scraper stage.
+
+    Each measurement is also reported to the process-wide telemetry as a
+    ``scrape.stage`` span.
+    """
+
+    def __init__(self):
+        self.timings = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self.timings.setdefault(stage, []).append(seconds)
+        TELEMETRY.observe("scrape.stage", seconds, stage=stage)
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def merge(self, other: "StageTimer"):
+        """Fold another timer's measurements into this one."""
+        # Already reported to telemetry when the other timer recorded them
+        with self._lock:
+            for stage, values in other.timings.items():
+                self.timings.setdefault(stage, []).extend(values)
+
+    def summary(self) -> dict:
+        """Return count / total / mean / max seconds for every stage."""
+        with self._lock:
+            return {
+                stage: {
+                    "count": len(values),
+                    "total_s": round(sum(values), 3),
+                    "mean_s": round(sum(values) / len(values), 3),
+                    "max_s": round(max(values), 3),
+                }
+                for stage, values in self.timings.items()
+            }
+
+    def report(self):
+        for stage, stats in self.summary().items():
+            print(f"[wait] {stage}: n={stats['count']} mean={stats['mean_s']}s "
+                  f"max={stats['max_s']}s total={stats['total_s']}s")
+
+
+def is_challenge_page(driver) -> bool:
+    """Return True when LinkedIn is showing a captcha or security checkpoint."""
+    url = driver.current_url or ""
+    if any(marker in url for marker in CHALLENGE_URL_MARKERS):
+        return True
+    for selector in CHALLENGE_SELECTORS:
+        if driver.find_elements(By.CSS_SELECTOR, selector):
+            return True
+    return False
+
+
+def is_login_page(driver) -> bool:
+    url = driver.current_url or ""
+    return any(marker in url for marker in LOGIN_URL_MARKERS)
+
+
+def wait_until(driver, condition, timeout: float):
+    """Thin wrapper around WebDriverWait with the module's poll interval."""
+    return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(condition)
+
+
+def wait_for_document_ready(driver, timeout: float):
+    wait_until(driver, lambda d: d.execute_script(
+        "return document.readyState") == "complete", timeout)
+
+
+def wait_for_challenge_cleared(driver, timeout: float):
+    """Block while a captcha/checkpoint is on screen so the user can solve it."""
+    print("Captcha or checkpoint detected, waiting for it to be solved...")
+    wait_until(driver, lambda d: not is_challenge_page(d), timeout)
+
+
+def wait_for_login_fields(driver, timeouts: dict):
+    """Wait for the username/password inputs, pausing for a challenge if one shows."""
+    def ready(d):
+        if d.find_elements(By.ID, "username") and d.find_elements(By.ID, "password"):
+            return "fields"
+        if is_challenge_page(d):
+            return "challenge"
+        return False
+
+    state = wait_until(driver, ready, timeouts["login_fields"])
+    if state == "challenge":
+        wait_for_challenge_cleared(driver, timeouts["challenge"])
+        wait_until(driver, lambda d: d.find_elements(By.ID, "username"),
+                   timeouts["login_fields"])
+
+
+def wait_for_login_result(driver, timeouts: dict):
+    """Wait until the browser leaves the login form; returns once logged in or failed."""
+    def settled(d):
+        if is_challenge_page(d):
+            return "challenge"
+        if not is_login_page(d):
+            return "done"
+        # LinkedIn shows an inline error on the form for bad credentials
+        errors = d.find_elements(
+            By.CSS_SELECTOR, "#error-for-password, #error-for-username")
+        if any(e.is_displayed() and e.text.strip() for e in errors):
+            return "error"
+        return False
+
+    state = wait_until(driver, settled, timeouts["login_result"])
+    if state == "challenge":
+        wait_for_challenge_cleared(driver, timeouts["challenge"])
+        wait_until(driver, lambda d: not is_login_page(d), timeouts["login_result"])
+        state = "done"
+    return state == "done"
+
+
+def page_kind(state: dict) -> str:
+    """Classify a page from the state returned by ``CLASSIFY_PAGE_JS``."""
+    url = (state.get("url") or "").lower()
+    title = (state.get("title") or "").lower()
+    text = state.get("text") or ""
+    if state.get("captcha") or any(marker in url for marker in CHALLENGE_URL_MARKERS):
+        return CHECKPOINT
+    # LinkedIn answers 999 (or 429) when it rate-limits a client
+    if state.get("status") in THROTTLE_STATUSES or any(
+            marker in text or marker in title for marker in THROTTLE_TEXT):
+        return THROTTLED
+    if any(marker in url for marker in AUTH_WALL_URL_MARKERS):
+        return AUTH_WALL
+    if state.get("topCard") and state.get("ready"):
+        return PROFILE
+    if state.get("status") == 404 or any(marker in text for marker in NOT_FOUND_TEXT):
+        return NOT_FOUND
+    return LOADING
+
+
+def classify_page(driver) -> str:
+    """Classify the current page with a single WebDriver round-trip."""
+    return page_kind(driver.execute_script(CLASSIFY_PAGE_JS, ", ".join(CHALLENGE_SELECTORS)))
+
+
+def wait_for_profile(driver, timeouts: dict) -> str:
+    """Wait until the page settles and return its kind.
+
+    Returns ``PROFILE`` once the cards and top-card ``h1`` are present, or
+    the blocking kind (auth wall, throttled, not found, checkpoint) as soon
+    as one is recognised. A checkpoint is first left to the user to solve
+    when ``timeouts["challenge"]`` allows it.
+    """
+    def settled(d):
+        kind = classify_page(d)
+        return kind if kind != LOADING else False
+
+    kind = wait_until(driver, settled, timeouts["profile"])
+    if kind == CHECKPOINT and timeouts["challenge"] > 0:
+        try:
+            wait_for_challenge_cleared(driver, timeouts["challenge"])
+        except TimeoutException:
+            return CHECKPOINT
+        kind = wait_until(driver, settled, timeouts["profile"])
+    return kind
@@ -1,13 +1,17 @@
 import streamlit as st
-import pandas as pd
-from src.scrapper import LinkedInScapper
+from dotenv import load_dotenv
+from src.jobs import JobRunner
+from src.network import summarize_page_metrics
+from src.telemetry import diagnostics_panel, start_telemetry
 
+load_dotenv()
+start_telemetry()
 
-def get_scrapper() -> LinkedInScapper:
-    """Return (and cache) a single scrapper instance for the app session."""
-    if "scrapper" not in st.session_state:
-        st.session_state.scrapper = LinkedInScapper()
-    return st.session_state.scrapper
+
+@st.cache_resource
+def get_runner() -> JobRunner:
+    """Return the process-wide job runner (survives reruns, keeps the browser warm)."""
+    return JobRunner()
 
 
 st.set_page_config(page_title="LinkedIn Profile Scraper", layout="wide")
@@ -42,6 +46,26 @@ def validate_and_parse(raw: str):
 col1, col2 = st.columns([1, 3])
 with col1:
     scrape_btn = st.button("🚀 Scrape Profiles", type="primary")
+    if st.button("♻️ Restart browser", help="Close the warm Chrome session after the queued jobs; "
+                                           "the next scrape launches a fresh one."):
+        get_runner().close_browser()
+with col2:
+    workers = st.number_input(
+        "Parallel browsers", min_value=1, max_value=8, value=1,
+        help="Number of Chrome workers sharing the logged-in session.")
+    save_snapshots = st.checkbox(
+        "Save page snapshots",
+        help="Archive each rendered profile page (compressed) for offline re-extraction.")
+    lightweight = st.checkbox(
+        "Data-only mode",
+        help="Headless Chrome that blocks images, media, fonts and trackers. "
+             "Log in once in normal mode first: captchas cannot be solved headless.")
+    measure_pages = st.checkbox(
+        "Measure page loads",
+        help="Record transferred bytes, request counts and load time for every profile page.")
+    refresh = st.checkbox(
+        "Re-scrape fresh profiles",
+        help="By default profiles scraped within the last 7 days are loaded from the local index.")
 
 if scrape_btn:
     try:
@@ -52,17 +76,60 @@ if scrape_btn:
     if error_msg:
         st.error(error_msg)
     else:
-        with st.spinner("Scraping profiles..."):
-            try:
-                scrapper = get_scrapper()
-                result = scrapper.scrape(parsed_links)
-                if isinstance(result, pd.DataFrame):
-                    st.success("✅ Successfully scraped profiles!")
-                    st.dataframe(result, use_container_width=True)
-                else:
-                    st.error(
-                        "❌ An unexpected response was returned instead of a DataFrame.")
-                    st.write(result)
-            except Exception as e:
-                st.error("❌ Some error occurred during scraping.")
-                st.exception(e)
+        st.session_state.job_id = get_runner().submit(
+            parsed_links, workers=int(workers), refresh=refresh,
+            lightweight=lightweight, save_snapshots=save_snapshots, measure_pages=measure_pages)
+
+
+def render_job(job_id: str):
+    """Show progress and the rows finished so far for a background job."""
+    runner = get_runner()
+    job = runner.get(job_id)
+    if job is None:
+        st.info("This job's results are no longer kept. Run the scrape again to see them.")
+        return
+    rows = job.snapshot_rows()
+    st.progress(job.progress,
+                text=f"Job `{job.id}` · {job.status} · {len(rows)}/{job.total} profiles")
+    if not job.finished:
+        if st.button("⛔ Cancel", key=f"cancel-{job.id}"):
+            runner.cancel(job.id)
+
+    if rows:
+        df = job.dataframe()
+        scraped = df[df["Error"].isna()].drop(columns=["Error"])
+        failed = df[df["Error"].notna()][["Profile URL", "Error"]]
+        st.dataframe(scraped, use_container_width=True)
+        if not failed.empty:
+            st.warning(f"⚠️ {len(failed)} profile(s) could not be scraped.")
+            st.dataframe(failed, use_container_width=True)
+
+    if job.status == "done":
+        st.success("✅ Successfully scraped profiles!")
+    elif job.status == "cancelled":
+        st.info("Scrape cancelled. Unfinished profiles will be picked up by the next run.")
+    elif job.status == "failed":
+        st.error(f"❌ Some error occurred during scraping: {job.error}")
+
+    if job.finished:
+        with st.expander("⏱️ Timing per stage"):
+            st.table(job.timings)
+        with st.expander("🚦 Rate scheduler"):
+            st.write(job.scheduler_stats)
+        if job.page_metrics:
+            with st.expander("📶 Network per page"):
+                st.write(summarize_page_metrics(job.page_metrics))
+                st.dataframe(job.page_metrics, use_container_width=True)
+        if not st.session_state.get(f"final-{job.id}"):
+            # One full rerun so the fragment below stops polling
+            st.session_state[f"final-{job.id}"] = True
+            st.rerun()
+
+
+job_id = st.session_state.get("job_id")
+if job_id:
+    job = get_runner().get(job_id)
+    polling = job is not None and not job.finished
+    st.fragment(render_job, run_every=1.0 if polling else None)(job_id)
+
+diagnostics_panel()
@@ -0,0 +1,68 @@
+import time
+
+from src.index import ScrapeIndex, normalize_profile_url
+
+URL = "https://www.linkedin.com/in/Jane-Doe/"
+RECORD = {"name": "Jane Doe", "headline": "Engineer"}
+
+
+def test_urls_are_normalized():
+    assert normalize_profile_url("http://linkedin.com/in/Jane%2DDoe") == "https://www.linkedin.com/in/jane-doe/"
+    assert normalize_profile_url(" https://www.linkedin.com/in/jane-doe/ ") == normalize_profile_url(URL)
+
+
+def test_done_profiles_are_fresh_until_the_ttl(tmp_path, monkeypatch):
+    index = ScrapeIndex(str(tmp_path / "index.sqlite3"), ttl_hours=1)
+    index.mark_pending(URL)
+    assert not index.is_fresh(URL)
+    index.mark_done(URL, RECORD)
+    assert index.is_fresh("https://linkedin.com/in/jane-doe")
+
+    later = time.time() + 2 * 3600
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert not index.is_fresh(URL)
+
+
+def test_mark_done_reports_content_changes(tmp_path):
+    index = ScrapeIndex(str(tmp_path / "index.sqlite3"))
+    assert index.mark_done(URL, RECORD) is True
+    assert index.mark_done(URL, dict(reversed(RECORD.items()))) is False
+    assert index.mark_done(URL, {**RECORD, "headline": "Staff Engineer"}) is True
+    assert index.records([URL, "https://www.linkedin.com/in/nobody/"]) == {
+        normalize_profile_url(URL): {**RECORD, "headline": "Staff Engineer"}}
+
+
+def test_unexported_survives_a_restart_until_marked(tmp_path):
+    path = str(tmp_path / "index.sqlite3")
+    index = ScrapeIndex(path)
+    index.mark_done(URL, RECORD)
+    index.mark_failed("https://www.linkedin.com/in/broken/", "TimeoutException")
+
+    reopened = ScrapeIndex(path)
+    assert reopened.unexported() == [(normalize_profile_url(URL), RECORD)]
+    reopened.mark_exported([normalize_profile_url(URL)])
+    assert reopened.unexported() == []
+    assert not reopened.is_fresh("https://www.linkedin.com/in/broken/")
+
+
+def test_failed_rescrape_keeps_the_last_good_record(tmp_path):
+    index = ScrapeIndex(str(tmp_path / "index.sqlite3"))
+    index.mark_done(URL, RECORD)
+    index.mark_pending(URL)
+    index.mark_failed(URL, "TimeoutException")
+    assert index.records([URL]) == {normalize_profile_url(URL): RECORD}
+    assert index.is_fresh(URL)
+    assert index.unexported() == [(normalize_profile_url(URL), RECORD)]
+
+
+def test_unchanged_refresh_is_not_exported_again(tmp_path):
+    index = ScrapeIndex(str(tmp_path / "index.sqlite3"))
+    index.mark_done(URL, RECORD)
+    index.mark_exported([normalize_profile_url(URL)])
+
+    index.mark_pending(URL)
+    assert index.mark_done(URL, RECORD) is False
+    assert index.unexported() == []
+
+    assert index.mark_done(URL, {**RECORD, "headline": "Staff Engineer"}) is True
+    assert [url for url, _ in index.unexported()] == [normalize_profile_url(URL)]
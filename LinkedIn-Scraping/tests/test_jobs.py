@@ -0,0 +1,65 @@
+import time
+import types
+
+from src.jobs import JobRunner, ScrapeJob
+
+
+def add_job(runner, status, finished_at=None):
+    job = ScrapeJob(["https://www.linkedin.com/in/jane-doe/"], {})
+    job.status, job.finished_at = status, finished_at
+    runner.jobs[job.id] = job
+    return job.id
+
+
+def test_only_the_newest_finished_jobs_are_kept():
+    runner = JobRunner(max_finished=2)
+    now = time.time()
+    oldest = add_job(runner, "done", now - 30)
+    failed = add_job(runner, "failed", now - 20)
+    newest = add_job(runner, "cancelled", now - 10)
+    running = add_job(runner, "running")
+    runner.prune()
+    assert runner.get(oldest) is None
+    assert all(runner.get(job_id) for job_id in (failed, newest, running))
+
+
+def test_finished_jobs_expire_after_the_ttl():
+    runner = JobRunner(finished_ttl_s=60)
+    expired = add_job(runner, "done", time.time() - 120)
+    recent = add_job(runner, "done", time.time() - 5)
+    queued = add_job(runner, "queued")
+    runner.prune()
+    assert runner.get(expired) is None
+    assert runner.get(recent) is not None and runner.get(queued) is not None
+
+
+def test_progress_counts_duplicate_links_once():
+    job = ScrapeJob(["https://www.linkedin.com/in/jane-doe/", "https://linkedin.com/in/Jane-Doe",
+                     "https://www.linkedin.com/in/john-roe/"], {})
+    job.add_row("https://www.linkedin.com/in/jane-doe/", {"Name": "Jane Doe"}, None)
+    job.add_row("https://www.linkedin.com/in/john-roe/", {"Name": "John Roe"}, None)
+    assert job.total == 2
+    assert job.progress == 1.0
+
+
+def test_page_measuring_is_opt_in(monkeypatch):
+    import src.scrapper
+
+    built = []
+
+    class FakeScrapper:
+        def __init__(self, lightweight, measure_pages):
+            self.driver_manager = types.SimpleNamespace(lightweight=lightweight, measure_pages=measure_pages)
+            self.closed = False
+            built.append(self)
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(src.scrapper, "LinkedInScapper", FakeScrapper)
+    runner = JobRunner()
+    default = runner.scrapper_for(lightweight=False)
+    assert default.driver_manager.measure_pages is False
+    assert runner.scrapper_for(lightweight=False) is default
+    measured = runner.scrapper_for(lightweight=False, measure_pages=True)
+    assert default.closed and measured.driver_manager.measure_pages
@@ -0,0 +1,32 @@
+import re
+
+import pytest
+
+from src.network import BLOCKED_URL_PATTERNS
+
+
+def blocked(url: str) -> bool:
+    """Match like Network.setBlockedURLs: '*' is the only wildcard and the whole URL must match."""
+    return any(re.fullmatch(".*".join(map(re.escape, pattern.split("*"))), url)
+               for pattern in BLOCKED_URL_PATTERNS)
+
+
+@pytest.mark.parametrize("url", [
+    "https://static.licdn.com/aero-v1/sc/h/logo.svg",
+    "https://static.licdn.com/aero-v1/sc/h/ghost-person.png?v=2",
+    "https://media.licdn.com/dms/image/v2/photo.jpg?e=1767225600&v=beta&t=abc",
+    "https://static.licdn.com/aero-v1/sc/h/fonts/SourceSans.woff2?hash=1",
+    "https://px.ads.linkedin.com/collect?pid=1",
+])
+def test_media_fonts_and_trackers_are_blocked(url):
+    assert blocked(url)
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.linkedin.com/in/jane-doe/",
+    "https://static.licdn.com/aero-v1/sc/h/app.js?v=1",
+    "https://static.licdn.com/aero-v1/sc/h/app.css",
+    "https://www.linkedin.com/in/png-lover/?locale=en_US",
+])
+def test_pages_scripts_and_styles_load(url):
+    assert not blocked(url)
@@ -0,0 +1,50 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from lxml import html
+
+from src.extraction import ALLOWED_COLUMNS, extract_profile
+from src.offline import extract_html, inner_text
+
+FIXTURES = Path(__file__).parent / "fixtures"
+# What Chrome's innerText gives for tests/fixtures/profile.html
+EXPECTED = json.loads((FIXTURES / "profile.json").read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("markup, expected", [
+    ("<div>Senior <b>Engineer</b></div>", "Senior Engineer"),
+    ("<div>  lots \n of   <span> space </span> </div>", "lots of space"),
+    ("<li><div>Title</div><div>Company</div></li>", "Title\nCompany"),
+    ("<div>one<br>two<br><br>three</div>", "one\ntwo\n\nthree"),
+    ("<div><p>first</p><p>second</p>after</div>", "first\n\nsecond\n\nafter"),
+    ("<div>shown<span hidden>hidden</span><script>code()</script></div>", "shown"),
+])
+def test_inner_text_follows_browser_rules(markup, expected):
+    assert inner_text(html.fragment_fromstring(markup)) == expected
+
+
+def test_offline_extraction_matches_live_record():
+    page = (FIXTURES / "profile.html").read_text(encoding="utf-8")
+    assert extract_html(page) == EXPECTED
+
+
+def find_chrome():
+    return next((shutil.which(name) for name in ("google-chrome", "chromium", "chromium-browser")
+                 if shutil.which(name)), None)
+
+
+@pytest.mark.skipif(find_chrome() is None, reason="needs a local Chrome")
+def test_live_extraction_in_chrome_matches_fixture():
+    from selenium import webdriver
+
+    options = webdriver.ChromeOptions()
+    options.binary_location = find_chrome()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get((FIXTURES / "profile.html").as_uri())
+        assert extract_profile(driver, ALLOWED_COLUMNS) == EXPECTED
+    finally:
+        driver.quit()
@@ -0,0 +1,93 @@
+import types
+
+from src import pool as pool_module
+from src.pool import ScrapperPool
+from src.waits import StageTimer
+
+
+class FakeDriver:
+    def get(self, url):
+        pass
+
+    def add_cookie(self, cookie):
+        pass
+
+    def get_cookies(self):
+        return [{"name": "li_at", "value": "session"}]
+
+
+class FakeScrapper:
+    """Worker stand-in: the first profile hits the auth wall, the rest succeed."""
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.driver = FakeDriver()
+        self.driver_manager = types.SimpleNamespace(quit=self.close)
+        self.timer = StageTimer()
+        self.page_metrics = []
+        self.logged_in = False
+        self.logins = 0
+        self.scraped = []
+        self.closed = False
+        FakeScrapper.instances.append(self)
+
+    def ensure_session(self):
+        self.logins += 1
+        self.logged_in = True
+        return True
+
+    def scrape_scheduled(self, link, attempt):
+        assert self.logged_in, "scraped while logged out"
+        if not self.scraped and attempt == 1:
+            self.scraped.append(None)
+            self.logged_in = False
+            return None, "PageBlocked: auth wall", True
+        self.scraped.append(link)
+        return {"url": link}, None, False
+
+    def close(self):
+        self.closed = True
+
+
+def make_parent(tmp_path):
+    results = []
+    parent = types.SimpleNamespace(
+        profile_dir=str(tmp_path / "profile"), timeouts={}, snapshot_store=None, index=None, sink=None,
+        driver_manager=types.SimpleNamespace(lightweight=False, measure_pages=False), scheduler=None,
+        cancel_event=None, timer=StageTimer(), page_metrics=[], driver=FakeDriver(), results=results,
+        cancelled=lambda: False,
+        record_result=lambda link, record=None, error=None: results.append((link, record, error)))
+    (tmp_path / "profile").mkdir()
+    return parent
+
+
+def test_worker_logs_in_again_after_auth_wall(tmp_path, monkeypatch):
+    FakeScrapper.instances = []
+    monkeypatch.setattr(pool_module, "LinkedInScapper", FakeScrapper)
+    parent = make_parent(tmp_path)
+    links = [f"https://www.linkedin.com/in/p{i}/" for i in range(3)]
+
+    records = ScrapperPool(parent, size=1, workers_dir=str(tmp_path / "workers")).run(links)
+
+    worker, = FakeScrapper.instances
+    assert worker.logins == 1
+    assert [r["error"] for r in records] == [None, None, None]
+    assert worker.closed
+
+
+def test_worker_that_fails_to_start_closes_its_browser(tmp_path, monkeypatch):
+    FakeScrapper.instances = []
+    monkeypatch.setattr(pool_module, "LinkedInScapper", FakeScrapper)
+
+    def broken_share_session(self, scrapper, cookies):
+        raise RuntimeError("chrome not reachable")
+
+    monkeypatch.setattr(ScrapperPool, "share_session", broken_share_session)
+    parent = make_parent(tmp_path)
+
+    records = ScrapperPool(parent, size=1, workers_dir=str(tmp_path / "workers")).run(
+        ["https://www.linkedin.com/in/p0/"])
+
+    worker, = FakeScrapper.instances
+    assert worker.closed
+    assert records[0]["result"] is None
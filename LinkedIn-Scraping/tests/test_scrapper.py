@@ -0,0 +1,43 @@
+from src import pool as pool_module
+from src.index import ScrapeIndex
+from src.scrapper import LinkedInScapper
+from src.sinks import ParquetSink
+
+FRESH = "https://linkedin.com/in/Jane-Doe"
+NEW = "https://www.linkedin.com/in/john-roe/"
+BROKEN = "https://www.linkedin.com/in/broken/"
+
+
+class FakePool:
+    """Returns one record per link, as ScrapperPool.run does, without launching Chrome."""
+
+    def __init__(self, parent, size, started_at=None):
+        self.parent = parent
+
+    def run(self, links):
+        records = []
+        for link in links:
+            if link == BROKEN:
+                record = {"link": link, "result": None, "error": "TimeoutException"}
+            else:
+                record = {"link": link, "result": {"Name": "John Roe"}, "error": None}
+            self.parent.record_result(link, record["result"], record["error"])
+            records.append(record)
+        return records
+
+
+def test_pool_results_and_index_rows_use_the_callers_links(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(pool_module, "ScrapperPool", FakePool)
+    index = ScrapeIndex(str(tmp_path / "index.sqlite3"))
+    index.mark_done(FRESH, {"Name": "Jane Doe"})
+    scrapper = LinkedInScapper(profile_dir=str(tmp_path / "profile"), index=index,
+                               sink=ParquetSink(str(tmp_path / "parquet")))
+    monkeypatch.setattr(scrapper, "ensure_session", lambda: True)
+
+    seen = []
+    df = scrapper.scrape([FRESH, NEW, BROKEN, FRESH.lower()], workers=2,
+                         on_result=lambda link, record, error: seen.append((link, error)))
+
+    assert seen == [(FRESH, None), (NEW, None), (BROKEN, "TimeoutException")]
+    assert list(df["Name"]) == ["Jane Doe", "John Roe"]
@@ -0,0 +1,48 @@
+import types
+from datetime import datetime, timezone
+
+from src.sinks import ParquetSink, iter_profiles, load_profiles
+
+RECORD = {"Name": "Jane Doe", "Company": "Acme", "Skills": [{"id": 1, "item": "Python"}]}
+
+
+def test_nothing_flushed_reads_as_empty(tmp_path):
+    missing = tmp_path / "missing"
+    assert load_profiles(str(missing)).empty
+    assert list(load_profiles(str(missing), columns=["Name", "Skills"]).columns) == ["Name", "Skills"]
+    assert list(iter_profiles(str(missing))) == []
+
+    sink = ParquetSink(str(tmp_path / "parquet"))
+    sink.write(RECORD, url="https://www.linkedin.com/in/jane-doe/")
+    assert load_profiles(str(tmp_path / "parquet")).empty
+    assert list(iter_profiles(str(tmp_path / "parquet"))) == []
+
+
+def test_flushed_rows_are_loaded_with_new_columns(tmp_path):
+    root = str(tmp_path / "parquet")
+    sink = ParquetSink(root)
+    sink.write(RECORD, url="https://www.linkedin.com/in/jane-doe/")
+    sink.flush()
+    sink.write({"Name": "John Roe", "Languages": [{"id": 1, "item": "French"}]})
+    sink.flush()
+
+    df = load_profiles(root, columns=["Name", "Company", "Languages"])
+    assert sorted(df["Name"]) == ["Jane Doe", "John Roe"]
+    assert df.set_index("Name").loc["Jane Doe", "Languages"] is None
+    assert sum(len(chunk) for chunk in iter_profiles(root, columns=["Name"], batch_size=1)) == 2
+
+
+def test_batch_across_midnight_is_split_by_day(tmp_path, monkeypatch):
+    import src.sinks as sinks
+
+    times = iter([datetime(2025, 7, 1, 23, 59, 30, tzinfo=timezone.utc),
+                  datetime(2025, 7, 2, 0, 0, 10, tzinfo=timezone.utc)])
+    monkeypatch.setattr(sinks, "datetime", types.SimpleNamespace(now=lambda tz: next(times)))
+    root = tmp_path / "parquet"
+    sink = ParquetSink(str(root))
+    sink.write({"Name": "Jane Doe"})
+    sink.write({"Name": "John Roe"})
+    sink.flush()
+
+    df = load_profiles(str(root), columns=["Name", "scraped_date"])
+    assert dict(zip(df["Name"], df["scraped_date"])) == {"Jane Doe": "2025-07-01", "John Roe": "2025-07-02"}